@@ -2,18 +2,27 @@
 Provides dependencies for API calls.
 """
 import logging
-import time
+import threading
 from typing import Annotated
 from fastapi import Depends, HTTPException
 from fastapi.security import APIKeyHeader
 from foundationallm.integration.config import Configuration
 
 __config: Configuration = None
+__config_lock = threading.Lock()
 API_NAME = 'GatekeeperIntegrationAPI'
+# The key prefixes of the configuration settings used by the API.
+CONFIGURATION_KEY_PREFIXES = [f'FoundationaLLM:APIEndpoints:{API_NAME}:']
 
 def get_config(action: str = None) -> Configuration:
     """
     Obtains the application configuration settings.
+    The settings are loaded once per process and served from memory.
+
+    Parameters
+    ----------
+    action : str
+        Set to 'refresh' to reload the settings in the background.
     
     Returns
     -------
@@ -22,13 +31,13 @@ def get_config(action: str = None) -> Configuration:
     """
     global __config
 
-    start = time.time()
-    if action is not None and action=='refresh':
-        __config = Configuration()
-    else:
-        __config = __config or Configuration()
-    end = time.time()
-    print(f'Time to load config: {end-start}')
+    if __config is None:
+        # The concurrent first requests must not each load the settings.
+        with __config_lock:
+            if __config is None:
+                __config = Configuration(key_prefixes=CONFIGURATION_KEY_PREFIXES)
+    elif action is not None and action=='refresh':
+        __config.refresh()
     return __config
 
 def validate_api_key_header(x_api_key: str = Depends(APIKeyHeader(name='X-API-Key'))):
@@ -32,6 +32,8 @@ async def refresh_cache(name: str):
     name : str
         The name of the cache object to refresh.
         "config", for example.
+        The configuration is reloaded in the background and keeps being served
+        from memory until the reload completes.
     """
     #with tracer.start_as_current_span('refresh_cache') as span:
     #    span.set_attribute('cache_name', name)
@@ -50,7 +52,7 @@ async def refresh_cache(name: str):
 
     end = time.time()
 
-    detail = f'The {API_NAME} {name} cache was refreshed in {round(end-start, 3)} seconds.'
+    detail = f'The {API_NAME} {name} cache refresh was started in {round(end-start, 3)} seconds.'
     #span.add_event(detail)
 
     return {'detail':detail}
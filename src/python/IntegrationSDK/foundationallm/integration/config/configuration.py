@@ -1,25 +1,54 @@
 """
 Contains the implementation of the Configuration class that is responsible for resolving
-configuration settings from Azure App Configuration.
+configuration settings from Azure App Configuration, a local file, or environment variables.
 """
+import logging
 import os
-from azure.identity import DefaultAzureCredential
-from azure.appconfiguration.provider import (
-    AzureAppConfigurationKeyVaultOptions,
-    SettingSelector,
-    load
+import threading
+from typing import List
+from foundationallm.integration.config.environment_variables import (
+    FOUNDATIONALLM_CONFIGURATION_FILE,
+    FOUNDATIONALLM_CONFIGURATION_PROVIDER
 )
+from foundationallm.integration.config.providers import (
+    AzureAppConfigurationProvider,
+    ConfigurationProviderBase,
+    ConfigurationProviderTypes,
+    EnvironmentConfigurationProvider,
+    FileConfigurationProvider
+)
+
+DEFAULT_KEY_PREFIXES = ['FoundationaLLM:APIEndpoints:GatekeeperIntegrationAPI:']
 
-# Configuration only has one method by design.
-# pylint: disable=too-few-public-methods
 class Configuration:
     """
-    Configuration class that is responsible for resolving configuration settings
-    from Azure App Configuration.
+    Configuration class that is responsible for resolving configuration settings.
+
+    The settings are read from the provider selected by the FOUNDATIONALLM_CONFIGURATION_PROVIDER
+    environment variable: AzureAppConfiguration (default), File (uses the JSON or YAML file set in
+    FOUNDATIONALLM_CONFIGURATION_FILE), or Environment.
+
+    The settings are loaded once when the class is instantiated and are served from memory.
+    Calling refresh() reloads the settings in the background and replaces them once loaded.
     """
+    def __init__(self, key_prefixes: List[str] = None):
+        """
+        Loads the configuration settings from the configuration provider.
+
+        Parameters
+        ----------
+        key_prefixes : List[str]
+            The prefixes of the keys loaded from Azure App Configuration.
+            Defaults to the Gatekeeper Integration API settings.
+        """
+        self.__key_prefixes = key_prefixes or DEFAULT_KEY_PREFIXES
+        self.__refresh_lock = threading.Lock()
+        self.__refresh_thread: threading.Thread = None
+        self.__provider = self.__create_provider()
+
     def get_value(self, key: str) -> str:
         """
-        Retrieves the setting value from Azure App Configuration.
+        Retrieves the setting value loaded from the configuration provider.
         If the value is not found the method raises an exception.
 
         Parameters
@@ -33,13 +62,67 @@ class Configuration:
 
         Raises an exception if the configuration value is not found.
         """
-        app_config_uri = os.environ['FOUNDATIONALLM_APP_CONFIGURATION_URI']
-        credential = DefaultAzureCredential(
-            exclude_environment_credential=True)
-        # Connect to Azure App Configuration with key filter
-        selectors = [SettingSelector(
-            key_filter="FoundationaLLM:APIEndpoints:GatekeeperIntegrationAPI:*")]
-        app_config = load(endpoint=app_config_uri, credential=credential, selects=selectors,
-                            key_vault_options=
-                            AzureAppConfigurationKeyVaultOptions(credential=credential))
-        return app_config[key]
+        value = self.__provider.get_value(key)
+        if value is None:
+            raise KeyError(f'The configuration variable {key} was not found.')
+        return value
+
+    def refresh(self) -> bool:
+        """
+        Reloads the configuration settings from the configuration provider in the background.
+        The current settings keep being served until the new ones are loaded.
+
+        Returns
+        -------
+        bool
+            True if a refresh was started, False if a refresh is already in progress.
+        """
+        with self.__refresh_lock:
+            if self.__refresh_thread is not None and self.__refresh_thread.is_alive():
+                return False
+            self.__refresh_thread = threading.Thread(
+                target=self.__refresh,
+                name='foundationallm-integration-configuration-refresh',
+                daemon=True)
+            self.__refresh_thread.start()
+            return True
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the configuration lookup statistics.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the number of lookups, the number of missing keys,
+            and the time spent in the configuration provider.
+        """
+        return self.__provider.get_stats()
+
+    def __refresh(self):
+        """
+        Reloads the configuration settings of the provider.
+        """
+        try:
+            self.__provider.refresh()
+        except Exception as e:
+            logging.error(f'Failed to refresh the configuration: {e}')
+
+    def __create_provider(self) -> ConfigurationProviderBase:
+        """
+        Creates the configuration provider selected by the FOUNDATIONALLM_CONFIGURATION_PROVIDER environment variable.
+        """
+        provider_type = os.environ.get(
+            FOUNDATIONALLM_CONFIGURATION_PROVIDER, ConfigurationProviderTypes.AZURE_APP_CONFIGURATION)
+
+        match provider_type:
+            case ConfigurationProviderTypes.AZURE_APP_CONFIGURATION:
+                return AzureAppConfigurationProvider(
+                    os.environ['FOUNDATIONALLM_APP_CONFIGURATION_URI'],
+                    self.__key_prefixes)
+            case ConfigurationProviderTypes.FILE:
+                return FileConfigurationProvider(os.environ[FOUNDATIONALLM_CONFIGURATION_FILE])
+            case ConfigurationProviderTypes.ENVIRONMENT:
+                return EnvironmentConfigurationProvider()
+            case _:
+                raise ValueError(f'The configuration provider {provider_type} is not supported.')
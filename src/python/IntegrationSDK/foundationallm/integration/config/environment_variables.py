@@ -12,3 +12,13 @@ The build version of the container. This is also used for the app version used
 to validate the minimum version of the app required to use certain configuration entries.
 """
 FOUNDATIONALLM_VERSION = "FOUNDATIONALLM_VERSION"
+
+"""
+The provider of the configuration settings: AzureAppConfiguration (default), File, or Environment.
+"""
+FOUNDATIONALLM_CONFIGURATION_PROVIDER = "FOUNDATIONALLM_CONFIGURATION_PROVIDER"
+
+"""
+The path of the JSON or YAML file containing the configuration settings when the File configuration provider is used.
+"""
+FOUNDATIONALLM_CONFIGURATION_FILE = "FOUNDATIONALLM_CONFIGURATION_FILE"
@@ -0,0 +1,8 @@
+"""
+Configuration providers for the Gatekeeper Integration
+"""
+from .configuration_provider_types import ConfigurationProviderTypes
+from .configuration_provider_base import ConfigurationProviderBase
+from .azure_app_configuration_provider import AzureAppConfigurationProvider
+from .environment_configuration_provider import EnvironmentConfigurationProvider
+from .file_configuration_provider import FileConfigurationProvider
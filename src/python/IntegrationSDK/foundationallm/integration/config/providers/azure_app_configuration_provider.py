@@ -0,0 +1,57 @@
+import logging
+import time
+from typing import Any, List, Optional
+
+from azure.appconfiguration.provider import (
+    AzureAppConfigurationKeyVaultOptions,
+    SettingSelector,
+    load
+)
+from azure.identity import DefaultAzureCredential
+
+from .configuration_provider_base import ConfigurationProviderBase
+
+class AzureAppConfigurationProvider(ConfigurationProviderBase):
+    """
+    Provides configuration settings from Azure App Configuration, resolving Key Vault references.
+
+    Only the settings starting with one of the key prefixes are loaded. Calling refresh() loads the settings
+    again and replaces the current ones once loaded.
+    """
+
+    def __init__(self, app_config_uri: str, key_prefixes: List[str]):
+        """
+        Initializes the provider and loads the configuration from Azure App Configuration.
+
+        Parameters
+        ----------
+        app_config_uri : str
+            The endpoint of the Azure App Configuration store.
+        key_prefixes : List[str]
+            The prefixes of the keys to load.
+        """
+        super().__init__()
+        self.app_config_uri = app_config_uri
+        self.key_prefixes = key_prefixes
+        self.__app_config = self.__load()
+
+    def refresh(self):
+        self.__app_config = self.__load()
+
+    def _get_value(self, key: str) -> Optional[Any]:
+        return self.__app_config.get(key)
+
+    def __load(self):
+        """
+        Loads the configuration settings from Azure App Configuration.
+        """
+        start = time.time()
+        credential = DefaultAzureCredential(
+            exclude_environment_credential=True)
+        # Connect to Azure App Configuration with key filter
+        selectors = [SettingSelector(key_filter=f'{key_prefix}*') for key_prefix in self.key_prefixes]
+        app_config = load(endpoint=self.app_config_uri, credential=credential, selects=selectors,
+                            key_vault_options=
+                            AzureAppConfigurationKeyVaultOptions(credential=credential))
+        logging.info(f'Time to load config: {time.time() - start}')
+        return app_config
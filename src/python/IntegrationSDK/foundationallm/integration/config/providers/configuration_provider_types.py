@@ -0,0 +1,5 @@
+class ConfigurationProviderTypes:
+   """Configuration Provider Type Constants"""
+   AZURE_APP_CONFIGURATION = "AzureAppConfiguration"
+   FILE = "File"
+   ENVIRONMENT = "Environment"
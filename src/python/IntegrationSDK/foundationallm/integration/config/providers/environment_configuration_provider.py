@@ -0,0 +1,20 @@
+import os
+from typing import Any, Optional
+
+from .configuration_provider_base import ConfigurationProviderBase
+
+class EnvironmentConfigurationProvider(ConfigurationProviderBase):
+    """
+    Provides configuration settings from environment variables.
+
+    The key separator ':' is replaced with '__' to build the environment variable name
+    (e.g., FoundationaLLM:APIEndpoints:StateAPI:Essentials:APIUrl is read from
+    FoundationaLLM__APIEndpoints__StateAPI__Essentials__APIUrl). The key itself is used
+    when no such environment variable exists.
+    """
+
+    def _get_value(self, key: str) -> Optional[Any]:
+        value = os.environ.get(key.replace(':', '__'))
+        if value is None:
+            value = os.environ.get(key)
+        return value
@@ -0,0 +1,71 @@
+import json
+from typing import Any, Dict, Mapping, Optional
+
+from .configuration_provider_base import ConfigurationProviderBase
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+FEATURE_FLAGS_SECTION = 'FeatureManagementFeatureFlags'
+
+class FileConfigurationProvider(ConfigurationProviderBase):
+    """
+    Provides configuration settings from a JSON or YAML file.
+
+    The file contains either flat keys (e.g., "FoundationaLLM:APIEndpoints:StateAPI:Essentials:APIUrl")
+    or nested objects, which are flattened using ':' as the key separator. Feature flags are read
+    from the top level FeatureManagementFeatureFlags object. YAML files require the PyYAML package.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initializes the provider and loads the configuration file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the JSON (.json) or YAML (.yaml, .yml) configuration file.
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.__settings: Dict[str, Any] = {}
+        self.__feature_flags: Dict[str, Any] = {}
+        self.refresh()
+
+    def get_feature_flags(self) -> Mapping[str, Any]:
+        return self.__feature_flags
+
+    def refresh(self):
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            if self.file_path.lower().endswith(('.yaml', '.yml')):
+                if yaml is None:
+                    raise ImportError('The PyYAML package is required to load YAML configuration files.')
+                content = yaml.safe_load(file) or {}
+            else:
+                content = json.load(file)
+
+        feature_flags = content.pop(FEATURE_FLAGS_SECTION, None) or {}
+        settings = {}
+        self.__flatten(content, '', settings)
+
+        self.__settings = settings
+        self.__feature_flags = feature_flags
+
+    def _get_value(self, key: str) -> Optional[Any]:
+        return self.__settings.get(key)
+
+    def __flatten(self, content: Dict[str, Any], prefix: str, settings: Dict[str, Any]):
+        """
+        Flattens nested objects into ':' separated keys. Scalar values are stored as strings,
+        like the values returned by Azure App Configuration.
+        """
+        for key, value in content.items():
+            full_key = f'{prefix}{key}'
+            if isinstance(value, dict):
+                self.__flatten(value, f'{full_key}:', settings)
+            elif value is None or isinstance(value, str):
+                settings[full_key] = value
+            else:
+                settings[full_key] = json.dumps(value)
@@ -0,0 +1,336 @@
+'''
+Bounded, admission-controlled executor for background completion requests.
+'''
+import asyncio
+import os
+import time
+from logging import Logger
+from typing import Coroutine, Dict, List, Optional
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_COMPLETIONS_DRAIN_TIMEOUT_SECONDS,
+    FOUNDATIONALLM_COMPLETIONS_MAX_CONCURRENCY,
+    FOUNDATIONALLM_COMPLETIONS_MAX_QUEUE_SIZE
+)
+from foundationallm.telemetry import Telemetry
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_QUEUE_SIZE = 64
+DEFAULT_RETRY_AFTER_SECONDS = 5
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 30
+MAX_RETRY_AFTER_SECONDS = 60
+# Smoothing factor for the moving average of the completion execution time.
+EXECUTION_TIME_SMOOTHING_FACTOR = 0.2
+
+class CompletionExecutorSaturatedException(Exception):
+    """
+    Raised when the completion executor cannot accept any more work.
+    """
+    def __init__(self, message: str, retry_after_seconds: int):
+        self.message = message
+        self.retry_after_seconds = retry_after_seconds
+
+    def __str__(self):
+        return self.message
+
+class CompletionExecutorStoppedException(Exception):
+    """
+    Raised when the completion executor no longer accepts work because it is draining.
+    """
+    def __init__(self, message: str):
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+class CompletionTaskDetails():
+    """
+    Encapsulates the details of a completion request tracked by the executor.
+        operation_id: str - The unique identifier of the operation.
+        instance_id: str - The unique identifier of the FoundationaLLM instance.
+        user_identity: str - The user identity of the user who initiated the operation.
+    """
+
+    def __init__(self, operation_id: str, instance_id: Optional[str], user_identity: Optional[str]):
+        self.operation_id = operation_id
+        self.instance_id = instance_id
+        self.user_identity = user_identity
+
+class CompletionExecutor():
+    """
+    Runs completion requests in the background with a limited number of in-flight
+    requests and a bounded wait queue.
+
+    Callers reserve a slot before accepting a request and then submit the
+    completion coroutine using the reserved slot. When both the execution slots
+    and the wait queue are exhausted, the reservation is rejected.
+
+    On shutdown, the executor is drained: new reservations are rejected and the
+    tracked completions are given a deadline to finish before being cancelled.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        drain_timeout_seconds: float = DEFAULT_DRAIN_TIMEOUT_SECONDS,
+        logger: Logger = None):
+        """
+        Initializes the completion executor.
+
+        Parameters
+        ----------
+        max_concurrency : int
+            The maximum number of completion requests executed concurrently.
+        max_queue_size : int
+            The maximum number of completion requests waiting for an execution slot.
+        drain_timeout_seconds : float
+            The maximum time to wait for tracked completions to finish when draining.
+        logger : Logger
+            The logger used for logging.
+        """
+        if max_concurrency < 1:
+            raise ValueError('The max_concurrency parameter must be greater than zero.')
+        if max_queue_size < 0:
+            raise ValueError('The max_queue_size parameter cannot be negative.')
+
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self.logger = logger or Telemetry.get_logger(__name__)
+        self.accepting = True
+
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.task_details: Dict[str, CompletionTaskDetails] = {}
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__reserved = 0
+        self.__queued = 0
+        self.__in_flight = 0
+        self.__completed = 0
+        self.__rejected = 0
+        self.__average_wait_time = None
+        self.__average_execution_time = None
+
+        meter = Telemetry.get_meter(__name__)
+        self.__queue_depth_counter = meter.create_up_down_counter(
+            'langchainapi.completions.queue_depth',
+            description='The number of completion requests waiting for an execution slot.')
+        self.__in_flight_counter = meter.create_up_down_counter(
+            'langchainapi.completions.in_flight',
+            description='The number of completion requests being executed.')
+        self.__wait_time_histogram = meter.create_histogram(
+            'langchainapi.completions.wait_time',
+            unit='s',
+            description='The time completion requests spend waiting for an execution slot.')
+        self.__rejected_counter = meter.create_counter(
+            'langchainapi.completions.rejected',
+            description='The number of completion requests rejected because the executor was saturated.')
+
+    @staticmethod
+    def from_environment(logger: Logger = None) -> 'CompletionExecutor':
+        """
+        Creates a completion executor using the limits set in the environment variables.
+
+        Returns
+        -------
+        CompletionExecutor
+            The completion executor.
+        """
+        return CompletionExecutor(
+            max_concurrency=int(os.getenv(
+                FOUNDATIONALLM_COMPLETIONS_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)),
+            max_queue_size=int(os.getenv(
+                FOUNDATIONALLM_COMPLETIONS_MAX_QUEUE_SIZE, DEFAULT_MAX_QUEUE_SIZE)),
+            drain_timeout_seconds=float(os.getenv(
+                FOUNDATIONALLM_COMPLETIONS_DRAIN_TIMEOUT_SECONDS, DEFAULT_DRAIN_TIMEOUT_SECONDS)),
+            logger=logger)
+
+    @property
+    def capacity(self) -> int:
+        """
+        The total number of completion requests the executor can hold.
+        """
+        return self.max_concurrency + self.max_queue_size
+
+    def reserve(self):
+        """
+        Reserves a slot for a completion request that is about to be submitted.
+
+        Raises
+        ------
+        CompletionExecutorStoppedException
+            When the executor is draining and no longer accepts work.
+        CompletionExecutorSaturatedException
+            When all the execution slots and the wait queue are in use.
+        """
+        if not self.accepting:
+            raise CompletionExecutorStoppedException(
+                'The service is shutting down and does not accept new completion requests.')
+        if len(self.tasks) + self.__reserved >= self.capacity:
+            self.__rejected += 1
+            self.__rejected_counter.add(1)
+            raise CompletionExecutorSaturatedException(
+                f'The service is processing the maximum number of completion requests ({self.capacity}). Retry the request later.',
+                self.__get_retry_after_seconds())
+        self.__reserved += 1
+
+    def release_reservation(self):
+        """
+        Releases a slot reserved with reserve() that will not be used.
+        """
+        self.__reserved = max(0, self.__reserved - 1)
+
+    def submit(
+        self,
+        operation_id: str,
+        coroutine: Coroutine,
+        instance_id: Optional[str] = None,
+        user_identity: Optional[str] = None) -> asyncio.Task:
+        """
+        Submits a completion coroutine using a slot previously reserved with reserve().
+
+        Parameters
+        ----------
+        operation_id : str
+            The unique identifier of the operation associated with the completion request.
+        coroutine : Coroutine
+            The coroutine generating the completion response.
+        instance_id : str
+            The unique identifier of the FoundationaLLM instance.
+        user_identity : str
+            The user identity of the user who initiated the operation.
+
+        Returns
+        -------
+        asyncio.Task
+            The task running the coroutine.
+        """
+        self.release_reservation()
+        self.__queued += 1
+        self.__queue_depth_counter.add(1)
+        task = asyncio.create_task(self.__run(coroutine, time.monotonic()))
+        self.tasks[operation_id] = task
+        self.task_details[operation_id] = CompletionTaskDetails(operation_id, instance_id, user_identity)
+        task.add_done_callback(lambda _: self.__untrack(operation_id))
+        return task
+
+    async def drain(self) -> List[CompletionTaskDetails]:
+        """
+        Stops accepting new work and waits up to the drain timeout for the tracked
+        completions to finish. Completions still running after the deadline are cancelled.
+
+        Returns
+        -------
+        List[CompletionTaskDetails]
+            The details of the completions that were cancelled because they did not
+            finish before the deadline.
+        """
+        self.accepting = False
+
+        if not self.tasks:
+            return []
+
+        self.logger.info(
+            'Draining %d completion requests with a timeout of %s seconds.',
+            len(self.tasks),
+            self.drain_timeout_seconds)
+
+        _, pending = await asyncio.wait(
+            list(self.tasks.values()),
+            timeout=self.drain_timeout_seconds)
+
+        unfinished = [
+            self.task_details[operation_id]
+            for operation_id, task in self.tasks.items()
+            if task in pending
+        ]
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if unfinished:
+            self.logger.warning(
+                'Cancelled %d completion requests that did not finish before the drain timeout.',
+                len(unfinished))
+
+        return unfinished
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the current statistics of the executor.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the executor statistics.
+        """
+        return {
+            'accepting': self.accepting,
+            'max_concurrency': self.max_concurrency,
+            'max_queue_size': self.max_queue_size,
+            'in_flight': self.__in_flight,
+            'queue_depth': self.__queued,
+            'reserved': self.__reserved,
+            'completed': self.__completed,
+            'rejected': self.__rejected,
+            'average_wait_time_seconds': round(self.__average_wait_time or 0.0, 3),
+            'average_execution_time_seconds': round(self.__average_execution_time or 0.0, 3)
+        }
+
+    async def __run(self, coroutine: Coroutine, enqueued_at: float):
+        """
+        Waits for an execution slot and runs the completion coroutine.
+        """
+        try:
+            await self.__semaphore.acquire()
+        except asyncio.CancelledError:
+            # The coroutine never started, close it to avoid the "never awaited" warning.
+            coroutine.close()
+            raise
+        finally:
+            self.__queued -= 1
+            self.__queue_depth_counter.add(-1)
+
+        wait_time = time.monotonic() - enqueued_at
+        self.__wait_time_histogram.record(wait_time)
+        self.__average_wait_time = self.__smooth(self.__average_wait_time, wait_time)
+
+        self.__in_flight += 1
+        self.__in_flight_counter.add(1)
+        start_time = time.monotonic()
+        try:
+            return await coroutine
+        finally:
+            self.__in_flight -= 1
+            self.__in_flight_counter.add(-1)
+            self.__completed += 1
+            self.__average_execution_time = self.__smooth(
+                self.__average_execution_time, time.monotonic() - start_time)
+            self.__semaphore.release()
+
+    def __untrack(self, operation_id: str):
+        """
+        Stops tracking a completion once its task is done.
+        """
+        self.tasks.pop(operation_id, None)
+        self.task_details.pop(operation_id, None)
+
+    def __get_retry_after_seconds(self) -> int:
+        """
+        Estimates the number of seconds after which a rejected request should be retried.
+        """
+        if not self.__average_execution_time:
+            return DEFAULT_RETRY_AFTER_SECONDS
+        # Time needed to drain the wait queue through the available execution slots.
+        estimate = self.__average_execution_time * (self.__queued + 1) / self.max_concurrency
+        return max(1, min(MAX_RETRY_AFTER_SECONDS, round(estimate)))
+
+    @staticmethod
+    def __smooth(average: float, sample: float) -> float:
+        """
+        Updates an exponentially weighted moving average with a new sample.
+        """
+        if average is None:
+            return sample
+        return EXECUTION_TIME_SMOOTHING_FACTOR * sample + (1 - EXECUTION_TIME_SMOOTHING_FACTOR) * average
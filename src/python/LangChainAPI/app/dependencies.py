@@ -16,6 +16,22 @@ from foundationallm.telemetry import Telemetry
 # Initialize telemetry logging
 logger = Telemetry.get_logger(__name__)
 
+async def validate_startup_completed(request: Request):
+    """
+    Validates that the API has completed its startup, including the warm-up steps running in the background.
+
+    Raises
+    ------
+    HTTPException
+        A 503 error if the API is still starting.
+    """
+    startup_orchestrator = getattr(request.app.state, 'startup_orchestrator', None)
+    if startup_orchestrator is None or not startup_orchestrator.ready:
+        raise HTTPException(
+            status_code = 503,
+            detail = 'The LangChainAPI is starting and is not ready to accept requests.'
+        )
+
 async def validate_api_key_header(
         request: Request,
         x_api_key: str = Depends(APIKeyHeader(name='X-API-Key'))) -> bool:
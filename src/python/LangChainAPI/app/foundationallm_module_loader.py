@@ -1,11 +1,18 @@
 """
 Loader for the foundationallm module from Azure Blob Storage.
-Downloads the wheel file and adds it to sys.path for normal import.
+Downloads the wheel file, installs it into a versioned local directory,
+and adds the directory to sys.path for normal import.
 """
+from io import BytesIO
 from logging import Logger
+import compileall
 import json
 import os
+import re
+import shutil
 import sys
+import time
+import zipfile
 
 from azure.appconfiguration import AzureAppConfigurationClient
 from azure.storage.blob import BlobServiceClient
@@ -20,6 +27,11 @@ STORAGE_AUTH_TYPE_KEY = \
 STORAGE_CONTAINER = 'resource-provider'
 PACKAGE_BLOB_PATH = 'FoundationaLLM.Plugin/Python-FoundationaLLM.json'
 LOCAL_MODULES_FOLDER = 'foundationallm_external_modules'
+# The foundationallm module cannot be imported yet, so the configuration provider
+# environment variable and its default value are duplicated here.
+CONFIGURATION_PROVIDER_ENV_VAR = 'FOUNDATIONALLM_CONFIGURATION_PROVIDER'
+AZURE_APP_CONFIGURATION_PROVIDER = 'AzureAppConfiguration'
+INSTALLED_MARKER_FILE_NAME = '.installed'
 
 
 class FoundationaLLMModuleLoader:
@@ -64,6 +76,13 @@ class FoundationaLLMModuleLoader:
 
     def load(self):
         """Downloads and loads the foundationallm module from blob storage."""
+        configuration_provider = os.getenv(CONFIGURATION_PROVIDER_ENV_VAR, AZURE_APP_CONFIGURATION_PROVIDER)
+        if configuration_provider != AZURE_APP_CONFIGURATION_PROVIDER:
+            # Offline configuration (e.g., load testing or CI): use the installed foundationallm module.
+            self.logger.info(
+                f'Skipping the foundationallm module download for the {configuration_provider} configuration provider.')
+            return
+
         try:
             storage_account = self._get_config_value(STORAGE_ACCOUNT_NAME_KEY)
         except Exception:
@@ -85,20 +104,49 @@ class FoundationaLLMModuleLoader:
             package_info = json.loads(package_blob.download_blob().readall())
             wheel_path = package_info['package_file_path']
 
-            # Download wheel file
+            # Install the wheel file into a directory versioned by the blob ETag.
+            # The wheel is downloaded only when that version is not installed yet.
             wheel_blob = container.get_blob_client(wheel_path)
-            local_wheel = f'{self.local_path}/{os.path.basename(wheel_path)}'
+            version = re.sub(r'[^A-Za-z0-9]', '', wheel_blob.get_blob_properties().etag)
+            install_path = os.path.join(self.local_path, 'foundationallm', version)
 
-            self.logger.info(f'Downloading wheel to: {local_wheel}')
-            with open(local_wheel, 'wb') as f:
-                f.write(wheel_blob.download_blob().readall())
+            if os.path.exists(os.path.join(install_path, INSTALLED_MARKER_FILE_NAME)):
+                self.logger.info(f'Using the installed wheel from: {install_path}')
+            else:
+                self.logger.info(f'Installing wheel to: {install_path}')
+                start = time.perf_counter()
+                self._install_wheel(wheel_blob.download_blob().readall(), install_path)
+                self.logger.info(f'Wheel installed in {(time.perf_counter() - start) * 1000:.0f} ms.')
 
             # Add to sys.path
-            if local_wheel not in sys.path:
-                sys.path.insert(0, local_wheel)
+            if install_path not in sys.path:
+                sys.path.insert(0, install_path)
 
             self.loaded = True
             self.logger.info('foundationallm module loaded successfully.')
 
         except Exception as e:
             self.logger.exception(f'Failed to load foundationallm module: {e}')
+
+    def _install_wheel(self, wheel_content: bytes, install_path: str):
+        """
+        Extracts the wheel and precompiles its Python files in a temporary directory,
+        then moves the directory into place so a partial installation is never imported.
+        """
+        temporary_install_path = f'{install_path}.tmp-{os.getpid()}'
+        shutil.rmtree(temporary_install_path, ignore_errors=True)
+
+        with zipfile.ZipFile(BytesIO(wheel_content)) as wheel:
+            wheel.extractall(temporary_install_path)
+
+        compileall.compile_dir(temporary_install_path, ddir=install_path, quiet=1)
+        with open(os.path.join(temporary_install_path, INSTALLED_MARKER_FILE_NAME), 'w', encoding='utf-8'):
+            pass
+
+        try:
+            os.replace(temporary_install_path, install_path)
+        except OSError:
+            # Another worker installed the same version in the meantime.
+            shutil.rmtree(temporary_install_path, ignore_errors=True)
+            if not os.path.exists(os.path.join(install_path, INSTALLED_MARKER_FILE_NAME)):
+                raise
@@ -1,26 +1,49 @@
 '''
 Handles the FastAPI application lifespan events.
 '''
+import asyncio
 import logging
+import time
 
 from contextlib import asynccontextmanager
 
-from aiohttp import ClientSession
 from fastapi import FastAPI
 
+from .startup_orchestrator import StartupOrchestrator
+
 # Ensure foundationallm imports work.
 # For this, we need to load the foundationallm module first.
 from .foundationallm_module_loader import FoundationaLLMModuleLoader
+loader_start = time.perf_counter()
 loader = FoundationaLLMModuleLoader(logging.getLogger(__name__))
 loader.load()
+loader_duration_ms = (time.perf_counter() - loader_start) * 1000
 
 # pylint: disable=C0411,C0413
+from .completion_executor import CompletionExecutor
 from foundationallm.config import Configuration
+from foundationallm.operations import OperationsManager, OperationStateWriter
 from foundationallm.plugins import PluginManager
 from foundationallm.storage import BlobStorageManager
 from foundationallm.telemetry import Telemetry
+from foundationallm.utils import HttpSessionPool
 # pylint: enable=C0411
 
+# The key prefixes of the configuration settings used by the LangChain API.
+# The API endpoint settings include the secrets referenced by the API endpoint configurations.
+# Additional prefixes can be set in the FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES environment variable.
+CONFIGURATION_KEY_PREFIXES = [
+    'FoundationaLLM:APIEndpoints:',
+    'FoundationaLLM:Configuration:',
+    'FoundationaLLM:Instance:',
+    'FoundationaLLM:PythonSDK:',
+    'FoundationaLLM:ResourceProviders:'
+]
+
+# The startup steps running in the background once the API has started, while the API reports it is not ready.
+# The completion and management endpoints are not available until they have completed.
+WARM_UP_STEPS = ['telemetry', 'plugins']
+
 COMPLETION_REQUESTS_CONFIGURATION_NAMESPACE = \
     'FoundationaLLM:APIEndpoints:OrchestrationAPI:Configuration:CompletionRequestsStorage'
 COMPLETION_REQUESTS_STORAGE_ACCOUNT_NAME = \
@@ -30,41 +53,109 @@ COMPLETION_REQUESTS_STORAGE_AUTHENTICATION_TYPE = \
 COMPLETION_REQUESTS_STORAGE_CONTAINER = \
     f'{COMPLETION_REQUESTS_CONFIGURATION_NAMESPACE}:ContainerName'
 
+def create_startup_orchestrator(app: FastAPI) -> StartupOrchestrator:
+    """
+    Creates the orchestrator running the startup steps of the application.
+    Steps that do not depend on each other run concurrently.
+    The warm-up steps (WARM_UP_STEPS) run in the background once the API has started.
+    """
+    orchestrator = StartupOrchestrator(logging.getLogger(__name__))
+    # The foundationallm module is loaded at import time, before any other step can run.
+    orchestrator.record_step('foundationallm_module', loader_duration_ms)
+
+    def create_configuration():
+        # Create the application configuration
+        app.state.config = Configuration(key_prefixes=CONFIGURATION_KEY_PREFIXES)
+
+    async def create_http_session():
+        # Create the aiohttp client session backed by the shared connection pool
+        app.state.http_session_pool = HttpSessionPool.get_default()
+        app.state.http_client_session = app.state.http_session_pool.get_session()
+
+    def configure_telemetry():
+        # Configure telemetry monitoring
+        Telemetry.configure_monitoring(
+            app.state.config,
+            'FoundationaLLM:APIEndpoints:LangChainAPI:Essentials:AppInsightsConnectionString',
+            'LangChainAPI')
+
+    def load_plugins():
+        # Create the plugin manager and load the external modules
+        app.state.plugin_manager = PluginManager(
+            app.state.config,
+            Telemetry.get_logger(__name__))
+        app.state.plugin_manager.load_external_modules()
+
+    def create_completion_requests_storage():
+        storage_account_name = app.state.config.get_value(
+            COMPLETION_REQUESTS_STORAGE_ACCOUNT_NAME)
+        storage_authentication_type = app.state.config.get_value(
+            COMPLETION_REQUESTS_STORAGE_AUTHENTICATION_TYPE)
+        storage_container_name = app.state.config.get_value(
+            COMPLETION_REQUESTS_STORAGE_CONTAINER)
+        app.state.completion_requests_storage_manager = BlobStorageManager(
+            account_name = storage_account_name,
+            authentication_type = storage_authentication_type,
+            container_name = storage_container_name
+        )
+
+    async def start_operation_state_writer():
+        # Create the writer that sends the operation progress updates to the State API in the background
+        app.state.operation_state_writer = OperationStateWriter.from_environment(
+            Telemetry.get_logger(__name__))
+        app.state.operation_state_writer.start()
+
+    async def create_completion_executor():
+        # Create the executor that runs the completion requests in the background
+        app.state.completion_executor = CompletionExecutor.from_environment(
+            Telemetry.get_logger(__name__))
+
+    orchestrator.add_step('configuration', create_configuration)
+    orchestrator.add_step('http_session', create_http_session)
+    orchestrator.add_step('telemetry', configure_telemetry, depends_on=['configuration'])
+    orchestrator.add_step('plugins', load_plugins, depends_on=['configuration', 'telemetry'])
+    orchestrator.add_step('completion_requests_storage', create_completion_requests_storage, depends_on=['configuration'])
+    orchestrator.add_step('operation_state_writer', start_operation_state_writer)
+    orchestrator.add_step('completion_executor', create_completion_executor)
+    return orchestrator
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Async context manager for the FastAPI application lifespan."""
 
-    # Create the application configuration
-    app.state.config = Configuration()
-
-    # Create an aiohttp client session
-    app.state.http_client_session = ClientSession()
-
-    # Configure telemetry monitoring
-    Telemetry.configure_monitoring(
-        app.state.config,
-        'FoundationaLLM:APIEndpoints:LangChainAPI:Essentials:AppInsightsConnectionString',
-        'LangChainAPI')
-
-    # Create the plugin manager
-    app.state.plugin_manager = PluginManager(
-        app.state.config,
-        Telemetry.get_logger(__name__))
-    app.state.plugin_manager.load_external_modules()
-
-    storage_account_name = app.state.config.get_value(
-        COMPLETION_REQUESTS_STORAGE_ACCOUNT_NAME)
-    storage_authentication_type = app.state.config.get_value(
-        COMPLETION_REQUESTS_STORAGE_AUTHENTICATION_TYPE)
-    storage_container_name = app.state.config.get_value(
-        COMPLETION_REQUESTS_STORAGE_CONTAINER)
-    app.state.completion_requests_storage_manager = BlobStorageManager(
-        account_name = storage_account_name,
-        authentication_type = storage_authentication_type,
-        container_name = storage_container_name
-    )
+    startup_orchestrator = create_startup_orchestrator(app)
+    app.state.startup_orchestrator = startup_orchestrator
+    await startup_orchestrator.run_async(
+        [step_name for step_name in startup_orchestrator.step_names if step_name not in WARM_UP_STEPS])
+
+    async def warm_up():
+        try:
+            await startup_orchestrator.run_async(WARM_UP_STEPS)
+        except Exception:
+            # The failed step is logged by the orchestrator, and the API keeps reporting it is not ready.
+            pass
+
+    warm_up_task = asyncio.create_task(warm_up())
 
     yield
 
     # Perform shutdown actions here
-    await app.state.http_client_session.close()
+    if not warm_up_task.done():
+        warm_up_task.cancel()
+        await asyncio.gather(warm_up_task, return_exceptions=True)
+
+    # Let the in-flight completion requests finish and fail the ones that run past the drain timeout.
+    unfinished_completions = await app.state.completion_executor.drain()
+    if unfinished_completions:
+        operations_manager = OperationsManager(
+            app.state.config,
+            app.state.http_client_session,
+            Telemetry.get_logger(__name__),
+            app.state.operation_state_writer)
+        await operations_manager.fail_operations_async(
+            [(c.operation_id, c.instance_id, c.user_identity) for c in unfinished_completions],
+            'The operation was interrupted because the LangChain API instance processing it was shut down.')
+
+    await app.state.operation_state_writer.stop_async()
+
+    await app.state.http_session_pool.close_async()
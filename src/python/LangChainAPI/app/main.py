@@ -33,7 +33,7 @@ app = FastAPI(
     }
 )
 
-NO_LOGGING_ROUTES = { '/status' }
+NO_LOGGING_ROUTES = { '/status', '/ready' }
 
 class SuppressAccessLogFilter(logging.Filter):
     '''Filter to suppress access logs for specific routes.'''
@@ -5,9 +5,15 @@ import asyncio
 import json
 from typing import Optional
 
+from app.completion_executor import (
+    CompletionExecutorSaturatedException,
+    CompletionExecutorStoppedException,
+    DEFAULT_RETRY_AFTER_SECONDS
+)
 from app.dependencies import (
     validate_api_key_header,
-    resolve_completion_request
+    resolve_completion_request,
+    validate_startup_completed
 )
 from fastapi import (
     APIRouter,
@@ -17,8 +23,10 @@ from fastapi import (
     Request,
     status
 )
-from opentelemetry.trace import SpanKind
+from fastapi.responses import StreamingResponse
+from opentelemetry.trace import Span, SpanKind
 from foundationallm.config import Configuration, UserIdentity
+from foundationallm.langchain.common import FoundationaLLMCompletionStream
 from foundationallm.langchain.orchestration import OrchestrationManager
 from foundationallm.models.agents import CompletionRequest
 from foundationallm.models.operations import (
@@ -38,7 +46,7 @@ tracer = Telemetry.get_tracer(__name__)
 router = APIRouter(
     prefix='/instances/{instance_id}',
     tags=['completions'],
-    dependencies=[Depends(validate_api_key_header)],
+    dependencies=[Depends(validate_startup_completed), Depends(validate_api_key_header)],
     responses={404: {'description':'Not found'}}
 )
 
@@ -48,6 +56,8 @@ router = APIRouter(
     status_code = status.HTTP_202_ACCEPTED,
     responses = {
         202: {'description': 'Completion request accepted.'},
+        429: {'description': 'Too many completion requests are being processed.'},
+        503: {'description': 'The service is shutting down and does not accept new completion requests.'},
     }
 )
 async def submit_completion_request(
@@ -67,57 +77,165 @@ async def submit_completion_request(
     with tracer.start_as_current_span(
         'langchainapi_submit_completion_request',
         kind=SpanKind.SERVER) as span:
-        try:
-            # Get the operation_id from the completion request.
-            operation_id = completion_request.operation_id
 
-            span.set_attribute('operation_id', operation_id)
-            span.set_attribute('instance_id', instance_id)
-            span.set_attribute('user_identity', x_user_identity)
+        # Return the long running operation object.
+        return await queue_completion_request(
+            instance_id,
+            request,
+            completion_request,
+            x_user_identity,
+            span)
 
-            # Create an operations manager to create the operation.
-            operations_manager = OperationsManager(
-                request.app.state.config,
-                request.app.state.http_client_session,
-                logger)
-            
-            # Update the operation status to reflect that it is now
-            # being processed by LangChain API.
-            operation = await operations_manager.update_operation_async(
+@router.post(
+    '/streaming-completions',
+    summary = 'Submit a completion request and stream the completion response.',
+    response_class = StreamingResponse,
+    responses = {
+        200: {
+            'description': 'The completion response is streamed as Server-Sent Events.',
+            'content': {'text/event-stream': {}}
+        },
+        429: {'description': 'Too many completion requests are being processed.'},
+        503: {'description': 'The service is shutting down and does not accept new completion requests.'},
+    }
+)
+async def submit_streaming_completion_request(
+    instance_id: str,
+    request: Request,
+    completion_request: CompletionRequestBase = Depends(resolve_completion_request),
+    x_user_identity: Optional[str] = Header(None)
+) -> StreamingResponse:
+    """
+    Initiates the creation of a completion response in the background and streams
+    the generated tokens and the tool progress as Server-Sent Events.
+
+    The last event of the stream is either a completion event containing the final
+    completion response or an error event. The completion response is persisted
+    through the State API in both cases, as for async completion requests.
+
+    Returns
+    -------
+    StreamingResponse
+        The stream of Server-Sent Events.
+    """
+    with tracer.start_as_current_span(
+        'langchainapi_submit_streaming_completion_request',
+        kind=SpanKind.SERVER) as span:
+
+        completion_stream = FoundationaLLMCompletionStream(completion_request.operation_id)
+        await queue_completion_request(
+            instance_id,
+            request,
+            completion_request,
+            x_user_identity,
+            span,
+            completion_stream)
+
+        return StreamingResponse(
+            completion_stream.iterate_sse_async(),
+            media_type = 'text/event-stream',
+            headers = {
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            })
+
+async def queue_completion_request(
+    instance_id: str,
+    request: Request,
+    completion_request: CompletionRequestBase,
+    x_user_identity: Optional[str],
+    span: Span,
+    completion_stream: Optional[FoundationaLLMCompletionStream] = None
+) -> LongRunningOperation:
+    """
+    Marks the operation as in progress and queues the completion request on the completion executor.
+
+    Returns
+    -------
+    LongRunningOperation
+        Object containing the operation ID and status.
+    """
+    # Reserve an execution slot before accepting the request.
+    completion_executor = request.app.state.completion_executor
+    try:
+        completion_executor.reserve()
+    except CompletionExecutorSaturatedException as e:
+        logger.warning(
+            'Rejected completion request for operation_id: %s. %s',
+            completion_request.operation_id,
+            e)
+        raise HTTPException(
+            status_code = status.HTTP_429_TOO_MANY_REQUESTS,
+            detail = str(e),
+            headers = {'Retry-After': str(e.retry_after_seconds)}
+        ) from e
+    except CompletionExecutorStoppedException as e:
+        raise HTTPException(
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail = str(e),
+            headers = {'Retry-After': str(DEFAULT_RETRY_AFTER_SECONDS)}
+        ) from e
+
+    submitted = False
+    try:
+        # Get the operation_id from the completion request.
+        operation_id = completion_request.operation_id
+
+        span.set_attribute('operation_id', operation_id)
+        span.set_attribute('instance_id', instance_id)
+        span.set_attribute('user_identity', x_user_identity)
+
+        # Create an operations manager to create the operation.
+        operations_manager = OperationsManager(
+            request.app.state.config,
+            request.app.state.http_client_session,
+            logger,
+            request.app.state.operation_state_writer)
+        
+        # Update the operation status to reflect that it is now
+        # being processed by LangChain API.
+        operation = await operations_manager.update_operation_async(
+            operation_id,
+            instance_id,
+            status = OperationStatus.INPROGRESS,
+            status_message = 'The operation is being processed by LangChain API.',
+            user_identity = x_user_identity
+        )
+        if operation is None:
+            # Create the operation if it does not exist.
+            # The operation might not exist if LangChain API is called directly
+            # without going through the Orchestration API (e.g. for testing or debugging).
+            operation = await operations_manager.create_operation_async(
                 operation_id,
                 instance_id,
-                status = OperationStatus.INPROGRESS,
-                status_message = 'The operation is being processed by LangChain API.',
-                user_identity = x_user_identity
+                x_user_identity
             )
-            if operation is None:
-                # Create the operation if it does not exist.
-                # The operation might not exist if LangChain API is called directly
-                # without going through the Orchestration API (e.g. for testing or debugging).
-                operation = await operations_manager.create_operation_async(
-                    operation_id,
-                    instance_id,
-                    x_user_identity
-                )
 
-            # Start a background task to perform the completion request.
-            asyncio.create_task(
-                create_completion_response(
-                    operation_id,
-                    instance_id,
-                    completion_request,
-                    request.app.state.config,
-                    request.app.state.plugin_manager,
-                    operations_manager,
-                    x_user_identity
-                )
-            )
+        # Queue the completion request on the executor using the reserved slot.
+        completion_executor.submit(
+            operation_id,
+            create_completion_response(
+                operation_id,
+                instance_id,
+                completion_request,
+                request.app.state.config,
+                request.app.state.plugin_manager,
+                operations_manager,
+                x_user_identity,
+                completion_stream
+            ),
+            instance_id = instance_id,
+            user_identity = x_user_identity
+        )
+        submitted = True
 
-            # Return the long running operation object.
-            return operation
+        return operation
 
-        except Exception as e:
-            handle_exception(e)
+    except Exception as e:
+        handle_exception(e)
+    finally:
+        if not submitted:
+            completion_executor.release_reservation()
 
 async def create_completion_response(
     operation_id: str,
@@ -126,10 +244,14 @@ async def create_completion_response(
     config: Configuration,
     plugin_manager: PluginManager,
     operations_manager: OperationsManager,
-    x_user_identity: Optional[str] = Header(None)
+    x_user_identity: Optional[str] = Header(None),
+    completion_stream: Optional[FoundationaLLMCompletionStream] = None
 ):
     """
     Generates the completion response for the specified completion request.
+
+    If a completion stream is provided, the completion response is relayed to it
+    while it is generated and the stream is closed once the response is persisted.
     """
     with tracer.start_as_current_span(
         'langchainapi_create_completion_response',
@@ -149,7 +271,8 @@ async def create_completion_response(
                 plugin_manager = plugin_manager,
                 operations_manager = operations_manager,
                 instance_id = instance_id,
-                user_identity = user_identity
+                user_identity = user_identity,
+                completion_stream = completion_stream
             )
 
             # Await the completion response from the orchestration manager.
@@ -157,6 +280,9 @@ async def create_completion_response(
             completion_status = OperationStatus.COMPLETED if not completion_response.is_error else OperationStatus.FAILED
             completion_status_message = "Operation completed successfully." if not completion_response.is_error else "Operation failed."
 
+            # Ensure no pending progress update overwrites the final state of the operation.
+            await operations_manager.discard_pending_updates_async(operation_id)
+
             # Send the completion response to the State API and mark the operation as completed.
             await asyncio.gather(
                 operations_manager.set_operation_result_async(
@@ -171,6 +297,8 @@ async def create_completion_response(
                     user_identity = x_user_identity
                 )
             )
+            if completion_stream is not None:
+                completion_stream.complete(completion_response)
         except Exception as e:
             # Send the completion response to the State API and mark the operation as failed.
             logger.error(e, stack_info=True, exc_info=True)
@@ -186,6 +314,7 @@ async def create_completion_response(
                 "Starting to persist operation result for failed operation_id: %s, instance_id: %s",
                 operation_id,
                 instance_id)
+            await operations_manager.discard_pending_updates_async(operation_id)
             await asyncio.gather(
                 operations_manager.set_operation_result_async(
                     operation_id = operation_id,
@@ -204,6 +333,12 @@ async def create_completion_response(
                 operation_id,
                 instance_id
             )
+            if completion_stream is not None:
+                completion_stream.fail(f"{e}")
+        finally:
+            if completion_stream is not None:
+                # Ensure the consumer stops waiting if the completion was cancelled.
+                completion_stream.close()
 
 def handle_exception(exception: Exception, status_code: int = 500):
     """
@@ -1,10 +1,10 @@
 """
 The API endpoint for returning the completion from the LLM for the specified user prompt.
 """
-
+import asyncio
 from typing import Optional
 
-from app.dependencies import validate_api_key_header
+from app.dependencies import validate_api_key_header, validate_startup_completed
 from fastapi import (
     APIRouter,
     Depends,
@@ -15,8 +15,15 @@ from fastapi import (
 )
 from opentelemetry.trace import SpanKind
 
+from foundationallm.langchain.language_models import (
+    AwsStsCredentialCache,
+    DeploymentRateLimiter,
+    EndpointHealth,
+    LanguageModelClientCache
+)
 from foundationallm.plugins import PluginManager
 from foundationallm.telemetry import Telemetry
+from foundationallm.utils import AzureCredentialRegistry, ContextFileContentCache
 
 # Initialize telemetry logging
 logger = Telemetry.get_logger(__name__)
@@ -26,7 +33,7 @@ tracer = Telemetry.get_tracer(__name__)
 router = APIRouter(
     prefix='/instances/{instance_id}',
     tags=['management'],
-    dependencies=[Depends(validate_api_key_header)],
+    dependencies=[Depends(validate_startup_completed), Depends(validate_api_key_header)],
     responses={404: {'description':'Not found'}}
 )
 
@@ -46,17 +53,22 @@ async def reload_plugins(
     """
     Reloads the external plugins for the specified instance.
 
+    The new version of the plugins is loaded in a worker thread. Requests already running
+    finish on the previous version, new requests use the new version once it is loaded.
+
     Returns
     -------
     str
-        A message indicating that the plugins are being reloaded.
+        A message indicating that the plugins were reloaded.
     """
     with tracer.start_as_current_span('langchainapi_plugins_reload', kind=SpanKind.SERVER) as span:
         try:
-            request.app.state.plugin_manager.load_external_modules(reload_modules=True)
-            request.app.state.plugin_manager.clear_cache()
+            plugin_manager = request.app.state.plugin_manager
+            await asyncio.to_thread(plugin_manager.load_external_modules, reload_modules=True)
+            plugin_manager.clear_cache()
+            span.set_attribute('plugin_registry_version', plugin_manager.registry.version)
 
-            return 'Plugins reloaded successfully.'
+            return f'Plugins reloaded successfully. Plugin registry version: {plugin_manager.registry.version}.'
 
         except Exception as e:
             handle_exception(e)
@@ -75,7 +87,7 @@ async def clear_plugins_cache(
     x_user_identity: Optional[str] = Header(None)
 ) -> str:
     """
-    Clears the plugin cache for the specified instance.
+    Clears the plugin cache and the language model client cache for the specified instance.
 
     Returns
     -------
@@ -85,6 +97,7 @@ async def clear_plugins_cache(
     with tracer.start_as_current_span('langchainapi_plugins_cache_clear', kind=SpanKind.SERVER) as span:
         try:
             request.app.state.plugin_manager.clear_cache()
+            LanguageModelClientCache.get_default().clear()
 
             return 'Plugins cache cleared successfully.'
 
@@ -110,16 +123,279 @@ async def get_plugins_cache_stats(
     Returns
     -------
     dict
-        A dictionary containing the plugins cache statistics.
+        A dictionary containing the keys of the cached plugin objects and
+        the hit and miss statistics of the language model client cache.
     """
     with tracer.start_as_current_span('langchainapi_plugins_cache_stats', kind=SpanKind.SERVER) as span:
         try:
-            stats = list(request.app.state.plugin_manager.object_cache.keys())
+            stats = {
+                'objects': list(request.app.state.plugin_manager.object_cache.keys()),
+                'language_models': LanguageModelClientCache.get_default().get_stats()
+            }
             return stats
 
         except Exception as e:
             handle_exception(e)
 
+@router.get(
+    '/plugins/stats',
+    summary = 'Retrieves the plugin installation statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Plugins installation statistics retrieved.'},
+    }
+)
+async def get_plugins_stats(
+    instance_id: str,
+    request: Request,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the plugin installation statistics for the specified instance.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the download statistics and the import time of each plugin module.
+    """
+    with tracer.start_as_current_span('langchainapi_plugins_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return request.app.state.plugin_manager.get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/completions/stats',
+    summary = 'Retrieves the completion executor statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Completion executor statistics retrieved.'},
+    }
+)
+async def get_completions_stats(
+    instance_id: str,
+    request: Request,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the executor running the completion requests.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the in-flight, queued, and rejected completion requests
+        along with the average wait and execution times.
+    """
+    with tracer.start_as_current_span('langchainapi_completions_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return request.app.state.completion_executor.get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/operations/stats',
+    summary = 'Retrieves the operation state writer statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Operation state writer statistics retrieved.'},
+    }
+)
+async def get_operations_stats(
+    instance_id: str,
+    request: Request,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the writer sending the operation progress updates to the State API.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the pending, coalesced, written, and failed progress updates.
+    """
+    with tracer.start_as_current_span('langchainapi_operations_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return request.app.state.operation_state_writer.get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/http/pool/stats',
+    summary = 'Retrieves the HTTP session pool statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'HTTP session pool statistics retrieved.'},
+    }
+)
+async def get_http_pool_stats(
+    instance_id: str,
+    request: Request,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the HTTP session pool shared by the State API, Context API, and Gateway API calls.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the pool utilization and the connection reuse statistics.
+    """
+    with tracer.start_as_current_span('langchainapi_http_pool_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return request.app.state.http_session_pool.get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/configuration/stats',
+    summary = 'Retrieves the configuration lookup statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Configuration lookup statistics retrieved.'},
+    }
+)
+async def get_configuration_stats(
+    instance_id: str,
+    request: Request,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the configuration provider used by the API.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the number of lookups, the number of missing keys,
+        the time spent in the configuration provider, and the number of cached entries.
+    """
+    with tracer.start_as_current_span('langchainapi_configuration_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return request.app.state.config.get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/credentials/stats',
+    summary = 'Retrieves the Azure credential and AWS STS credential cache statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Credential statistics retrieved.'},
+    }
+)
+async def get_credentials_stats(
+    instance_id: str,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the token acquisition statistics of the process-wide Azure credential
+    and the statistics of the AWS STS credential cache.
+
+    Returns
+    -------
+    dict
+        A dictionary containing, for each Azure credential and token scope, the number of token acquisitions,
+        the number of token cache hits, and the token acquisition latency, as well as
+        the AWS STS credential cache hits and refreshes.
+    """
+    with tracer.start_as_current_span('langchainapi_credentials_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return {
+                'azure': AzureCredentialRegistry.get_stats(),
+                'aws_sts': AwsStsCredentialCache.get_default().get_stats()
+            }
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/rate-limits/stats',
+    summary = 'Retrieves the statistics of the model deployment rate limiters.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Rate limiter statistics retrieved.'},
+    }
+)
+async def get_rate_limits_stats(
+    instance_id: str,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the client-side rate limiters of the model deployments.
+
+    Returns
+    -------
+    dict
+        A dictionary containing, for each deployment, its limits, its available capacity,
+        the number of queued and throttled requests, the wait times, and the estimated and actual token usage.
+    """
+    with tracer.start_as_current_span('langchainapi_rate_limits_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return DeploymentRateLimiter.get_all_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/endpoints/stats',
+    summary = 'Retrieves the health statistics of the API endpoints serving the language models.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'API endpoint health statistics retrieved.'},
+    }
+)
+async def get_endpoints_stats(
+    instance_id: str,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the health statistics used to route the language model calls to the API endpoints.
+
+    Returns
+    -------
+    dict
+        A dictionary containing, for each deployment on an API endpoint, the latency and error rate EWMAs, the remaining cooldown,
+        and the number of requests, failures, and throttled requests.
+    """
+    with tracer.start_as_current_span('langchainapi_endpoints_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return EndpointHealth.get_all_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
+@router.get(
+    '/context-files/cache/stats',
+    summary = 'Retrieves the context file content cache statistics.',
+    status_code = status.HTTP_200_OK,
+    responses = {
+        200: {'description': 'Context file content cache statistics retrieved.'},
+    }
+)
+async def get_context_files_cache_stats(
+    instance_id: str,
+    x_user_identity: Optional[str] = Header(None)
+) -> dict:
+    """
+    Retrieves the statistics of the cache holding the content of the context files across the turns of the conversations.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the number and size of the entries cached in memory and on the local disk,
+        and the cache hits, misses, and evictions.
+    """
+    with tracer.start_as_current_span('langchainapi_context_files_cache_stats', kind=SpanKind.SERVER) as span:
+        try:
+            return ContextFileContentCache.get_default().get_stats()
+
+        except Exception as e:
+            handle_exception(e)
+
 def handle_exception(exception: Exception, status_code: int = 500):
     """
     Handles an exception that occurred while processing a request.
@@ -2,7 +2,8 @@
 Status API endpoint that acts as a health check for the API.
 """
 import os
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
 from foundationallm.config.environment_variables import HOSTNAME, FOUNDATIONALLM_VERSION
 
 router = APIRouter(
@@ -32,6 +33,41 @@ async def get_status():
     }
     return status_message
 
+@router.get(
+    '/ready',
+    summary = 'Get the readiness of the LangChainAPI.',
+    responses = {
+        200: {'description': 'The LangChainAPI is ready to accept requests.'},
+        503: {'description': 'The LangChainAPI is starting or shutting down.'}
+    }
+)
+async def get_readiness(request: Request):
+    """
+    Get the readiness of the LangChainAPI.
+    The API is ready once all the startup steps, including the warm-up steps running in the background
+    after the API has started, have completed, and until it starts shutting down.
+
+    Returns
+    -------
+    JSONResponse
+        A JSON object containing the name, version, readiness, and startup timing breakdown of the LangChainAPI.
+    """
+    startup_orchestrator = getattr(request.app.state, 'startup_orchestrator', None)
+    completion_executor = getattr(request.app.state, 'completion_executor', None)
+    ready = startup_orchestrator is not None and startup_orchestrator.ready \
+        and completion_executor is not None and completion_executor.accepting
+
+    readiness_message = {
+        "name": 'LangChainAPI',
+        "instance_name": os.getenv(HOSTNAME, ''),
+        "version": os.getenv(FOUNDATIONALLM_VERSION),
+        "status": "ready" if ready else "not ready",
+        "startup": startup_orchestrator.get_stats() if startup_orchestrator is not None else None
+    }
+    return JSONResponse(
+        content=readiness_message,
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
+
 @router.get(
     '/instances/{instance_id}/status',
     summary = 'Get the status of a specified instance of the LangChainAPI.'
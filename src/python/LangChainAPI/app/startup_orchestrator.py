@@ -0,0 +1,194 @@
+'''
+Dependency-aware orchestrator for the LangChain API startup steps.
+'''
+import asyncio
+import inspect
+import time
+from logging import Logger
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+class StartupStep():
+    """
+    Encapsulates a startup step and its outcome.
+        name: str - The name of the step.
+        action: Callable - The function running the step. Blocking functions run in a worker thread.
+        depends_on: List[str] - The names of the steps that must complete before the step starts.
+        status: str - The status of the step: pending, running, completed, failed, or skipped.
+        started_at_ms: float - The time, in milliseconds since the startup began, when the step started.
+        duration_ms: float - The time, in milliseconds, spent running the step.
+        error: str - The error raised by the step, if any.
+    """
+
+    def __init__(self, name: str, action: Callable[[], Any], depends_on: List[str]):
+        self.name = name
+        self.action = action
+        self.depends_on = depends_on
+        self.status = 'pending'
+        self.started_at_ms: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+class StartupOrchestrator():
+    """
+    Runs the startup steps of the API, starting each step as soon as the steps it depends on
+    have completed, so independent steps (mostly network I/O) run concurrently.
+
+    The steps can run in several phases (e.g., the steps required to start serving requests,
+    followed by the slower warm-up steps running in the background).
+    The orchestrator records a timing breakdown of the steps and reports the API as ready
+    only once all the steps have completed.
+    """
+
+    def __init__(self, logger: Logger):
+        """
+        Initializes the startup orchestrator.
+
+        Parameters
+        ----------
+        logger : Logger
+            The logger used for logging.
+        """
+        self.logger = logger
+        self.ready = False
+        self.duration_ms: Optional[float] = None
+        self.__steps: Dict[str, StartupStep] = {}
+        self.__start: Optional[float] = None
+
+    @property
+    def step_names(self) -> List[str]:
+        """
+        The names of the startup steps, in the order they were added.
+        """
+        return list(self.__steps.keys())
+
+    def add_step(
+        self,
+        name: str,
+        action: Callable[[], Any] | Callable[[], Awaitable[Any]],
+        depends_on: Optional[List[str]] = None):
+        """
+        Adds a step to the startup.
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+        action : Callable
+            The function running the step. Coroutine functions are awaited on the event loop,
+            other functions run in a worker thread.
+        depends_on : List[str]
+            The names of the steps that must complete before the step starts.
+        """
+        if name in self.__steps:
+            raise ValueError(f'The startup step {name} is already defined.')
+        self.__steps[name] = StartupStep(name, action, depends_on or [])
+
+    def record_step(self, name: str, duration_ms: float):
+        """
+        Records a step that ran before the orchestrator was created (e.g., at import time).
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+        duration_ms : float
+            The time, in milliseconds, spent running the step.
+        """
+        step = StartupStep(name, None, [])
+        step.status = 'completed'
+        step.duration_ms = round(duration_ms, 3)
+        self.__steps[name] = step
+
+    async def run_async(self, step_names: Optional[List[str]] = None):
+        """
+        Runs the pending startup steps, respecting their dependencies.
+        Raises the error of the first failed step once all the other steps are finished.
+
+        Parameters
+        ----------
+        step_names : List[str]
+            The names of the steps to run. All the pending steps run if None.
+            The steps they depend on must be part of the same run or have run before.
+        """
+        for step in self.__steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.__steps:
+                    raise ValueError(f'The startup step {step.name} depends on the unknown step {dependency}.')
+        for step_name in step_names or []:
+            if step_name not in self.__steps:
+                raise ValueError(f'The startup step {step_name} is not defined.')
+
+        if self.__start is None:
+            self.__start = time.perf_counter()
+        start = self.__start
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_step(step: StartupStep):
+            for dependency in step.depends_on:
+                try:
+                    dependency_completed = await tasks[dependency]
+                except Exception:
+                    dependency_completed = False
+                if not dependency_completed:
+                    step.status = 'skipped'
+                    return False
+
+            step.status = 'running'
+            step.started_at_ms = round((time.perf_counter() - start) * 1000, 3)
+            step_start = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(step.action):
+                    await step.action()
+                else:
+                    await asyncio.to_thread(step.action)
+                step.status = 'completed'
+                return True
+            except Exception as e:
+                step.status = 'failed'
+                step.error = str(e)
+                self.logger.exception(f'The startup step {step.name} failed: {e}')
+                raise
+            finally:
+                step.duration_ms = round((time.perf_counter() - step_start) * 1000, 3)
+
+        for step in self.__steps.values():
+            if step.status == 'pending' and (step_names is None or step.name in step_names):
+                tasks[step.name] = asyncio.create_task(run_step(step))
+            else:
+                # The steps that are not part of this run only satisfy their dependents if they have completed.
+                tasks[step.name] = asyncio.create_task(asyncio.sleep(0, result=step.status == 'completed'))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+        if all(step.status == 'completed' for step in self.__steps.values()):
+            self.ready = True
+            self.logger.info(f'Startup completed in {self.duration_ms} ms: {self.get_stats()["steps"]}')
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the timing breakdown of the startup.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the readiness, the total startup time, and the outcome of each step.
+        """
+        return {
+            'ready': self.ready,
+            'duration_ms': self.duration_ms,
+            'steps': {
+                step.name: {
+                    'status': step.status,
+                    'depends_on': step.depends_on,
+                    'started_at_ms': step.started_at_ms,
+                    'duration_ms': step.duration_ms,
+                    'error': step.error
+                }
+                for step in self.__steps.values()
+            }
+        }
@@ -130,7 +130,6 @@ class FoundationaLLMCodeInterpreterTool(FoundationaLLMToolBase):
             # Start the process of executing the code in the code interpreter
 
             # returns the operation_id
-            self.context_api_client.headers['X-USER-IDENTITY'] = self.user_identity.model_dump_json()
             operation_response = await self.context_api_client.post_async(
                 endpoint = f"/instances/{self.instance_id}/codeSessions/{session_id}/uploadFiles",
                 data = json.dumps({
@@ -8,7 +8,6 @@ from io import BytesIO
 from typing import Optional, List, ClassVar, Tuple
 
 # Azure imports
-from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobServiceClient
 
 from opentelemetry.trace import SpanKind
@@ -32,6 +31,7 @@ from foundationallm.langchain.common import (
 )
 from foundationallm.models.agents import AgentTool
 from foundationallm.models.constants import RunnableConfigKeys
+from foundationallm.utils import AzureCredentialRegistry
 
 class FoundationaLLMFileAnalysisTool(FoundationaLLMToolBase):
     """ A tool for analyzing files using a large language model. """
@@ -177,7 +177,7 @@ class FoundationaLLMFileAnalysisTool(FoundationaLLMToolBase):
 
         if (self.storage_type == "OneLake"):
 
-            credential = DefaultAzureCredential()
+            credential = AzureCredentialRegistry.get_credential(include_environment_credential=True)
             self.storage_client = BlobServiceClient(account_url=f"https://onelake.dfs.fabric.microsoft.com", credential=credential)
             self.storage_container_client = self.storage_client.get_container_client(self.file_container_name)
 
@@ -247,7 +247,6 @@ class FoundationaLLMKnowledgeTool(FoundationaLLMToolBase):
                 user_identity,
                 config
             )
-            client.headers['X-USER-IDENTITY'] = user_identity.model_dump_json()
             return client
         else:
             raise ToolException("The Context API endpoint configuration is required to use the knowledge tool.")
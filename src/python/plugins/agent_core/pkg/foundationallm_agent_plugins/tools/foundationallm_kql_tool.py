@@ -9,7 +9,6 @@ import pandas as pd
 import requests
 
 #Azure imports
-from azure.identity import DefaultAzureCredential
 
 # LangChain imports
 from langchain_core.messages import (
@@ -30,6 +29,7 @@ from foundationallm.langchain.common import (
 from foundationallm.config import Configuration, UserIdentity
 from foundationallm.models.agents import AgentTool
 from foundationallm.models.constants import RunnableConfigKeys
+from foundationallm.utils import AzureCredentialRegistry
 
 class FoundationaLLMKQLTool(FoundationaLLMToolBase):
     """
@@ -177,7 +177,7 @@ class FoundationaLLMKQLTool(FoundationaLLMToolBase):
         self.kusto_query_endpoint = tool_config.properties['kusto_query_endpoint']
         self.kusto_database = tool_config.properties['kusto_database']
 
-        credential = DefaultAzureCredential()
+        credential = AzureCredentialRegistry.get_credential(include_environment_credential=True)
         self.kusto_token = credential.get_token("https://api.kusto.windows.net")
 
         self.tools = [
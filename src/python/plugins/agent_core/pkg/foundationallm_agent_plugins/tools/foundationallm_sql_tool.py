@@ -14,7 +14,6 @@ import struct
 from itertools import chain, repeat
 
 #Azure imports
-from azure.identity import DefaultAzureCredential
 # LangChain imports
 from langchain_core.messages import (
     BaseMessage,
@@ -39,6 +38,7 @@ from foundationallm.models.constants import (
     ResourceObjectIdPropertyNames,
     ResourceProviderNames)
 from foundationallm.models.orchestration import ContentArtifact
+from foundationallm.utils import AzureCredentialRegistry
 
 class FoundationaLLMSQLTool(FoundationaLLMToolBase):
     """
@@ -229,7 +229,7 @@ class FoundationaLLMSQLTool(FoundationaLLMToolBase):
         else:
             # Expects Azure credentials to authenticate to the database.
             # Get access token for Fabric
-            credential = DefaultAzureCredential()
+            credential = AzureCredentialRegistry.get_credential(include_environment_credential=True)
             token = credential.get_token('https://database.windows.net/.default')
             token_as_bytes = bytes(token.token, "UTF-8")
             encoded_bytes = bytes(chain.from_iterable(zip(token_as_bytes, repeat(0)))) # Encode the bytes to a Windows byte string
@@ -3,6 +3,7 @@ Class: FoundationaLLMFunctionCallingWorkflow
 Description: FoundationaLLM Function Calling workflow to invoke tools at a low level.
 """
 
+import asyncio
 import base64
 import json
 import re
@@ -14,7 +15,9 @@ from langchain_core.messages import (
     AIMessage,
     BaseMessage,
     HumanMessage,
-    SystemMessage
+    SystemMessage,
+    ToolCall,
+    ToolMessage
 )
 from langchain_core.runnables import RunnableConfig
 
@@ -38,6 +41,7 @@ from foundationallm.models.operations import OperationStatus
 from foundationallm.models.orchestration import (
     CompletionRequestObjectKeys,
     CompletionResponse,
+    CompletionStreamEventTypes,
     ContentArtifact,
     FileHistoryItem,
     OpenAITextMessageContentItem,
@@ -47,6 +51,15 @@ from foundationallm.models.orchestration import (
 from foundationallm.models.resource_providers.configuration import APIEndpointConfiguration
 from foundationallm.operations import OperationsManager
 from foundationallm.services import HttpClientService
+from foundationallm.utils import ContextFileContentCache
+
+# The default maximum number of tool calls running concurrently in a workflow invocation.
+DEFAULT_MAX_CONCURRENT_TOOL_CALLS = 4
+# The default maximum number of context files fetched concurrently from the Context API in a workflow invocation.
+DEFAULT_MAX_CONCURRENT_CONTEXT_FILE_FETCHES = 4
+# The size, in bytes, above which the content of a context file is base64 encoded in a worker thread,
+# so large files do not block the event loop.
+BASE64_ENCODING_THREAD_THRESHOLD_BYTES = 256 * 1024
 
 class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
     """
@@ -89,6 +102,20 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
         self.instance_id = objects.get(CompletionRequestObjectKeys.INSTANCE_ID, None)
 
+        # The tool calls requested by the router run concurrently, up to this limit.
+        self.max_concurrent_tool_calls = int(workflow_config.properties.get(
+            'max_concurrent_tool_calls',
+            DEFAULT_MAX_CONCURRENT_TOOL_CALLS)) \
+            if workflow_config.properties else DEFAULT_MAX_CONCURRENT_TOOL_CALLS
+
+        # The context files embedded in the request are fetched concurrently, up to this limit.
+        self.max_concurrent_context_file_fetches = int(workflow_config.properties.get(
+            'max_concurrent_context_file_fetches',
+            DEFAULT_MAX_CONCURRENT_CONTEXT_FILE_FETCHES)) \
+            if workflow_config.properties else DEFAULT_MAX_CONCURRENT_CONTEXT_FILE_FETCHES
+
+        self.context_file_content_cache = ContextFileContentCache.get_default()
+
         # Special commands pattern for user prompts
         # Matches patterns like [command1, command2]: user prompt
         self.special_commands_pattern = re.compile(
@@ -137,6 +164,10 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
         commands, llm_prompt = self.__extract_special_commands(llm_prompt)
 
+        if is_new_conversation:
+            # Generate the conversation name concurrently with the workflow.
+            self.start_conversation_name_generation(llm_prompt)
+
         runnable_config = self.__get_tools_runnable_config(
             user_prompt,
             user_prompt_rewrite,
@@ -169,6 +200,7 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
         with self.tracer.start_as_current_span(f'{self.name}_workflow', kind=SpanKind.INTERNAL):
 
+            self.emit_stream_event(CompletionStreamEventTypes.STATUS, content="Running agent workflow.")
             await self.operations_manager.update_operation_with_text_result_async(
                 operation_id,
                 self.instance_id,
@@ -191,7 +223,8 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
                 llm_bound_tools = self.workflow_llm.bind_tools(self.tools)
                 try:
-                    llm_response = await llm_bound_tools.ainvoke(
+                    llm_response = await self.invoke_runnable_async(
+                        llm_bound_tools,
                         messages,
                         tool_choice='auto')
                     initial_response = self.get_text_from_message(llm_response)
@@ -217,6 +250,7 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
                     else:
 
+                        self.emit_stream_event(CompletionStreamEventTypes.STATUS, content="Running agent tools.")
                         await self.operations_manager.update_operation_with_text_result_async(
                             operation_id,
                             self.instance_id,
@@ -230,23 +264,27 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
                         if llm_response_content_text:
                             intermediate_responses.append(str(llm_response_content_text))
 
-                        for tool_call in llm_response.tool_calls:
-
-                            with self.tracer.start_as_current_span(f'{self.name}_tool_call', kind=SpanKind.INTERNAL) as tool_call_span:
-                                tool_call_span.set_attribute('tool_call_id', tool_call['id'])
-                                tool_call_span.set_attribute('tool_call_function', tool_call['name'])
-
-                                # Get the tool from the tools list
-                                tool = next((t for t in self.tools if t.name == tool_call['name']), None)
-                                if tool:
-                                    tool_result = await tool.ainvoke(tool_call, runnable_config)
-                                    content_artifacts.extend(tool_result.artifact.content_artifacts)
-                                    intermediate_responses.append(str(tool_result.artifact.content))
-                                    input_tokens += tool_result.artifact.input_tokens
-                                    output_tokens += tool_result.artifact.output_tokens
-                                else:
-                                    self.logger.error(
-                                        'Tool %s not found in the tools list. Skipping tool call.', tool_call["name"])
+                        # The tool calls run concurrently, their results are processed in the order of the tool calls.
+                        tool_call_semaphore = asyncio.Semaphore(self.max_concurrent_tool_calls)
+                        tool_results = await asyncio.gather(
+                            *[
+                                self.__invoke_tool_async(tool_call, runnable_config, tool_call_semaphore)
+                                for tool_call in llm_response.tool_calls
+                            ],
+                            return_exceptions=True)
+
+                        for tool_call, tool_result in zip(llm_response.tool_calls, tool_results):
+                            if tool_result is None:
+                                continue
+                            if isinstance(tool_result, BaseException):
+                                # A failed tool call does not fail the other tool calls; the final response reports the failure.
+                                intermediate_responses.append(
+                                    f'The {tool_call["name"]} tool failed with the following error: {str(tool_result)}')
+                                continue
+                            content_artifacts.extend(tool_result.artifact.content_artifacts)
+                            intermediate_responses.append(str(tool_result.artifact.content))
+                            input_tokens += tool_result.artifact.input_tokens
+                            output_tokens += tool_result.artifact.output_tokens
 
                         # Ask the LLM to verify if the answer is correct if not, loop again with the current messages.
                         # verification_messages = messages_with_toolchain.copy()
@@ -281,6 +319,7 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
 
                 with self.tracer.start_as_current_span(f'{self.name}_final_llm_call', kind=SpanKind.INTERNAL):
 
+                    self.emit_stream_event(CompletionStreamEventTypes.STATUS, content="Preparing final response.")
                     await self.operations_manager.update_operation_with_text_result_async(
                         operation_id,
                         self.instance_id,
@@ -295,7 +334,7 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
                         final_messages.append(final_message)
                     
                     try:
-                        final_llm_response = await self.workflow_llm.ainvoke(final_messages)
+                        final_llm_response = await self.invoke_runnable_async(self.workflow_llm, final_messages)
 
                         usage = self.get_canonical_usage(final_llm_response)
                         input_tokens += usage['input_tokens']
@@ -364,19 +403,138 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
                 total_cost=0
             )
 
-            if is_new_conversation:
-                # Generate a conversation name if this is a new conversation.
-                conversation_name, input_tokens, output_tokens = await self.get_conversation_name(
-                    llm_prompt,
-                    final_response_content.value
-                )
-                if conversation_name:
-                    retvalue.conversation_name = conversation_name
-                    retvalue.prompt_tokens += input_tokens
-                    retvalue.completion_tokens += output_tokens
+            # Add the conversation name if this is a new conversation.
+            await self.set_conversation_name_async(retvalue)
 
             return retvalue
 
+    async def __invoke_tool_async(
+        self,
+        tool_call: ToolCall,
+        runnable_config: RunnableConfig,
+        semaphore: asyncio.Semaphore) -> Optional[ToolMessage]:
+        """
+        Invokes the tool requested by a tool call, once the semaphore allows it.
+
+        Parameters
+        ----------
+        tool_call : ToolCall
+            The tool call requested by the router.
+        runnable_config : RunnableConfig
+            The runnable config used in tool invocation.
+        semaphore : asyncio.Semaphore
+            The semaphore limiting the number of tool calls running concurrently.
+
+        Returns
+        -------
+        Optional[ToolMessage]
+            The result of the tool, or None if the tool is not found.
+        """
+        # Get the tool from the tools list
+        tool = next((t for t in self.tools if t.name == tool_call['name']), None)
+        if tool is None:
+            self.logger.error(
+                'Tool %s not found in the tools list. Skipping tool call.', tool_call["name"])
+            return None
+
+        async with semaphore:
+            with self.tracer.start_as_current_span(f'{self.name}_tool_call', kind=SpanKind.INTERNAL) as tool_call_span:
+                tool_call_span.set_attribute('tool_call_id', tool_call['id'])
+                tool_call_span.set_attribute('tool_call_function', tool_call['name'])
+
+                tool_call_details = {'id': tool_call['id'], 'args': tool_call['args']}
+                self.emit_stream_event(
+                    CompletionStreamEventTypes.TOOL_START,
+                    content=tool_call['name'],
+                    data=tool_call_details)
+                try:
+                    return await tool.ainvoke(tool_call, runnable_config)
+                except Exception as ex:
+                    self.logger.error('Error during the invocation of the tool %s: %s', tool_call['name'], str(ex))
+                    tool_call_span.record_exception(ex)
+                    raise
+                finally:
+                    self.emit_stream_event(
+                        CompletionStreamEventTypes.TOOL_END,
+                        content=tool_call['name'],
+                        data=tool_call_details)
+
+    async def __get_context_file_message_async(
+        self,
+        context_file: FileHistoryItem,
+        semaphore: asyncio.Semaphore) -> dict:
+        """
+        Retrieves the message content block of a context file from the context file content cache, or fetches
+        the content of the file from the Context API, once the semaphore allows it, and converts it.
+
+        Parameters
+        ----------
+        context_file : FileHistoryItem
+            The context file embedded in the request.
+        semaphore : asyncio.Semaphore
+            The semaphore limiting the number of context files fetched concurrently.
+
+        Returns
+        -------
+        dict
+            The message content block containing the image, audio, or text content of the file.
+        """
+        # The content of the context files does not change, so it is cached across the turns of the conversation.
+        cache_key = ContextFileContentCache.get_key(
+            self.instance_id,
+            self.user_identity.user_id or self.user_identity.upn,
+            context_file.object_id)
+        context_file_message = await self.context_file_content_cache.get_async(cache_key)
+        if context_file_message is not None:
+            return context_file_message
+
+        context_file_message = await self.__fetch_context_file_message_async(context_file, semaphore)
+        await self.context_file_content_cache.set_async(cache_key, context_file_message)
+        return context_file_message
+
+    async def __fetch_context_file_message_async(
+        self,
+        context_file: FileHistoryItem,
+        semaphore: asyncio.Semaphore) -> dict:
+        """
+        Fetches the content of a context file from the Context API and converts it into a message content block.
+        """
+        context_file_id = context_file.object_id.split('/')[-1]
+        is_binary = context_file.content_type.startswith(("image/", "audio/"))
+        content_type = "application/octet-stream" if is_binary else None
+
+        async with semaphore:
+            context_file_content = await self.context_api_client.get_async(
+                endpoint = f"/instances/{self.instance_id}/files/{context_file_id}",
+                content_type = content_type)
+
+        if not is_binary:
+            return {
+                'type': 'text',
+                'text': f'\nFILE_CONTENT for /{context_file.original_file_name}/:\n{context_file_content}\nEND_FILE_CONTENT\n'
+            }
+
+        encoded_content = await asyncio.to_thread(self.__encode_base64, context_file_content) \
+            if len(context_file_content) > BASE64_ENCODING_THREAD_THRESHOLD_BYTES \
+            else self.__encode_base64(context_file_content)
+
+        return \
+            {
+                'type': 'image_url',
+                'image_url': {
+                    'url': f'data:{context_file.content_type};base64,{encoded_content}'
+                }
+            } if context_file.content_type.startswith("image/") \
+            else {
+                'type': 'media',
+                'data': encoded_content,
+                'mime_type': context_file.content_type
+            }
+
+    @staticmethod
+    def __encode_base64(content: bytes) -> str:
+        return base64.b64encode(content).decode("utf-8")
+
     def __create_context_client(self):
         """
         Creates the context client for the workflow.
@@ -477,38 +635,16 @@ class FoundationaLLMFunctionCallingWorkflow(FoundationaLLMWorkflowBase):
             CompletionRequestObjectKeys.WORKFLOW_INVOCATION_CONVERSATION_FILES, [])]
         attached_files = [f'/{file_name}/' for file_name in objects.get(
             CompletionRequestObjectKeys.WORKFLOW_INVOCATION_ATTACHED_FILES, [])]
-        context_files = []
-
-        context_file_messages = []
-        for context_file in [f for f in file_history if f.embed_content_in_request]:
-
-            self.context_api_client.headers['X-USER-IDENTITY'] = self.user_identity.model_dump_json()
-            context_file_id = context_file.object_id.split('/')[-1]
-            content_type = "application/octet-stream" if context_file.content_type.startswith(("image/", "audio/")) else None
-            context_file_content = await self.context_api_client.get_async(
-                endpoint = f"/instances/{self.instance_id}/files/{context_file_id}",
-                content_type = content_type)
-
-            context_file_message = \
-                {
-                    'type': 'image_url',
-                    'image_url': {
-                        'url': f'data:{context_file.content_type};base64,{base64.b64encode(context_file_content).decode("utf-8")}'
-                    }
-                } if context_file.content_type.startswith("image/") \
-                else {
-                    'type': 'media',
-                    'data': base64.b64encode(context_file_content).decode("utf-8"),
-                    'mime_type': context_file.content_type
-                } if context_file.content_type.startswith("audio/") \
-                else {
-                    'type': 'text',
-                    'text': f'\nFILE_CONTENT for /{context_file.original_file_name}/:\n{context_file_content}\nEND_FILE_CONTENT\n'
-                }
 
-            context_file_messages.append(
-                context_file_message)
-            context_files.append(f'/{context_file.original_file_name}/')
+        # Fetch the embedded context files concurrently. The results are returned in the order of the file history.
+        embedded_context_files = [f for f in file_history if f.embed_content_in_request]
+        context_file_fetch_semaphore = asyncio.Semaphore(self.max_concurrent_context_file_fetches)
+        context_file_messages = await asyncio.gather(
+            *[
+                self.__get_context_file_message_async(context_file, context_file_fetch_semaphore)
+                for context_file in embedded_context_files
+            ])
+        context_files = [f'/{context_file.original_file_name}/' for context_file in embedded_context_files]
 
         context_message = HumanMessage(
             content=[{"type": "text", "text": llm_prompt}]+context_file_messages)
@@ -128,6 +128,11 @@ class FoundationaLLMLangChainAgentWorkflow(FoundationaLLMWorkflowBase):
         output_tokens = 0
 
         llm_prompt = user_prompt_rewrite or user_prompt
+
+        if is_new_conversation:
+            # Generate the conversation name concurrently with the workflow.
+            self.start_conversation_name_generation(llm_prompt)
+
         workflow_main_prompt = self.create_workflow_main_prompt()
 
         message_list = self.__get_message_list(
@@ -147,7 +152,8 @@ class FoundationaLLMLangChainAgentWorkflow(FoundationaLLMWorkflowBase):
         # TODO: Clarify if this still has an effect with the new LangGraph implementation
         graph_recursion_limit = self.workflow_config.properties.get('graph_recursion_limit', None) if self.workflow_config.properties else None
 
-        response = await graph.ainvoke(
+        response = await self.invoke_runnable_async(
+            graph,
             { "messages": message_list },
             context=Context(
                 original_user_prompt=llm_prompt,
@@ -195,16 +201,8 @@ class FoundationaLLMLangChainAgentWorkflow(FoundationaLLMWorkflowBase):
             total_cost=0
         )
 
-        if is_new_conversation:
-            # Generate a conversation name if this is a new conversation.
-            conversation_name, input_tokens, output_tokens = await self.get_conversation_name(
-                llm_prompt,
-                response_content.value
-            )
-            if conversation_name:
-                retvalue.conversation_name = conversation_name
-                retvalue.prompt_tokens += input_tokens
-                retvalue.completion_tokens += output_tokens
+        # Add the conversation name if this is a new conversation.
+        await self.set_conversation_name_async(retvalue)
 
         return retvalue
 
@@ -122,6 +122,11 @@ class FoundationaLLMLangChainLCELWorkflow(FoundationaLLMWorkflowBase):
         output_tokens = 0
 
         llm_prompt = user_prompt_rewrite or user_prompt
+
+        if is_new_conversation:
+            # Generate the conversation name concurrently with the workflow.
+            self.start_conversation_name_generation(llm_prompt)
+
         workflow_main_prompt = self.create_workflow_main_prompt()
 
         # Get the prompt template.
@@ -152,7 +157,7 @@ class FoundationaLLMLangChainLCELWorkflow(FoundationaLLMWorkflowBase):
                 chain = chain | StrOutputParser()
                 try:
                     with self.tracer.start_as_current_span('langchain_invoke_lcel_chain', kind=SpanKind.SERVER):
-                        completion = await chain.ainvoke(llm_prompt)
+                        completion = await self.invoke_runnable_async(chain, llm_prompt)
 
                     workflow_end_time = time.time()
 
@@ -187,7 +192,7 @@ class FoundationaLLMLangChainLCELWorkflow(FoundationaLLMWorkflowBase):
                     raise LangChainException(f"An unexpected exception occurred when executing the completion request: {str(e)}", 500)
         else:
             with self.tracer.start_as_current_span('langchain_invoke_lcel_chain', kind=SpanKind.SERVER):
-                completion = await chain.ainvoke(llm_prompt)
+                completion = await self.invoke_runnable_async(chain, llm_prompt)
 
             workflow_end_time = time.time()
 
@@ -218,16 +223,8 @@ class FoundationaLLMLangChainLCELWorkflow(FoundationaLLMWorkflowBase):
                     total_cost=0
                 )
 
-        if is_new_conversation:
-            # Generate a conversation name if this is a new conversation.
-            conversation_name, input_tokens, output_tokens = await self.get_conversation_name(
-                llm_prompt,
-                response_content.value
-            )
-            if conversation_name:
-                retvalue.conversation_name = conversation_name
-                retvalue.prompt_tokens += input_tokens
-                retvalue.completion_tokens += output_tokens
+        # Add the conversation name if this is a new conversation.
+        await self.set_conversation_name_async(retvalue)
 
         return retvalue
 
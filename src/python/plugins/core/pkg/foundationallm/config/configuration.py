@@ -1,28 +1,62 @@
 import os
 import logging
 import json
-from tenacity import retry, wait_random_exponential, stop_after_attempt, RetryError
-from azure.appconfiguration.provider import (
-    AzureAppConfigurationKeyVaultOptions,
-    load
+import time
+from typing import Dict, List, Optional, Tuple
+from tenacity import retry, retry_if_not_exception_type, wait_random_exponential, stop_after_attempt, RetryError
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_CONFIGURATION_CACHE_TTL_SECONDS,
+    FOUNDATIONALLM_CONFIGURATION_FILE,
+    FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES,
+    FOUNDATIONALLM_CONFIGURATION_PROVIDER,
+    FOUNDATIONALLM_CONFIGURATION_REFRESH_INTERVAL_SECONDS,
+    FOUNDATIONALLM_CONFIGURATION_SENTINEL_KEY
 )
-from azure.identity import DefaultAzureCredential
+from foundationallm.config.providers import (
+    AzureAppConfigurationProvider,
+    ConfigurationProviderBase,
+    ConfigurationProviderTypes,
+    EnvironmentConfigurationProvider,
+    FileConfigurationProvider
+)
+
+DEFAULT_CACHE_TTL_SECONDS = 300
+DEFAULT_REFRESH_INTERVAL_SECONDS = 60
+DEFAULT_SENTINEL_KEY = 'FoundationaLLM:Configuration:Sentinel'
 
 class Configuration():
-    def __init__(self):
-        """Init"""
-        try:
-            app_config_uri = os.environ['FOUNDATIONALLM_APP_CONFIGURATION_URI']
-        except Exception as e:
-            raise e
+    def __init__(self, key_prefixes: Optional[List[str]] = None):
+        """
+        Init
 
-        credential = DefaultAzureCredential(
-            exclude_environment_credential=True)
+        The configuration settings are read from the provider selected by the
+        FOUNDATIONALLM_CONFIGURATION_PROVIDER environment variable: AzureAppConfiguration (default),
+        File (uses the JSON or YAML file set in FOUNDATIONALLM_CONFIGURATION_FILE), or Environment.
 
-        # Connect to Azure App Configuration.
-        self.__config = load(endpoint=app_config_uri, credential=credential,
-                             key_vault_options=
-                                AzureAppConfigurationKeyVaultOptions(credential=credential))
+        Parameters
+        ----------
+        key_prefixes : List[str]
+            The prefixes of the keys loaded from Azure App Configuration. All the keys are loaded when not set.
+            Additional prefixes can be set in the FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES environment variable
+            as a comma separated list.
+        """
+        self.__key_prefixes = key_prefixes
+        additional_key_prefixes = os.environ.get(FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES)
+        if key_prefixes and additional_key_prefixes:
+            self.__key_prefixes = [
+                *key_prefixes,
+                *[key_prefix.strip() for key_prefix in additional_key_prefixes.split(',') if key_prefix.strip()]
+            ]
+
+        # Values (and missing keys, cached as None) are served from memory until they expire
+        # or until the configuration is refreshed.
+        self.__cache_ttl_seconds = int(os.environ.get(
+            FOUNDATIONALLM_CONFIGURATION_CACHE_TTL_SECONDS, DEFAULT_CACHE_TTL_SECONDS))
+        self.__values_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self.__feature_flags_cache: Dict[str, bool] = {}
+
+        self.__provider = self.__create_provider()
 
     def get_value(self, key: str) -> str:
         """
@@ -62,10 +96,7 @@ class Configuration():
             value = os.environ.get(key)
 
         if value is None:
-            try:
-                value = self.__get_config_with_retry(name=key)
-            except Exception as e:
-                pass
+            value = self.__get_cached_value(key)
 
         if value is not None:
             return value
@@ -91,17 +122,93 @@ class Configuration():
         if key is None:
             raise KeyError('The key parameter is required for Configuration.get_feature_flag().')
 
+        if key in self.__feature_flags_cache:
+            return self.__feature_flags_cache[key]
+
         value = False
 
-        if "FeatureManagementFeatureFlags" in self.__config.keys():
-            if key in self.__config["FeatureManagementFeatureFlags"].keys():
+        feature_flags = self.__provider.get_feature_flags()
+        if key in feature_flags.keys():
+            try:
+                feature_flag_setting = feature_flags[key]
+                obj = json.loads(feature_flag_setting) \
+                    if isinstance(feature_flag_setting, str) else feature_flag_setting
+                value = obj["enabled"]
+            except Exception as e:
+                pass
+
+        self.__feature_flags_cache[key] = value
+        return value
+
+    def clear_cache(self):
+        """
+        Clears the cached configuration values and feature flags.
+        Called when the configuration is refreshed from Azure App Configuration.
+        """
+        self.__values_cache = {}
+        self.__feature_flags_cache = {}
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the configuration lookup statistics.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the provider lookup statistics and the number of cached entries.
+        """
+        return {
+            **self.__provider.get_stats(),
+            'cached_values': len(self.__values_cache),
+            'cached_feature_flags': len(self.__feature_flags_cache)
+        }
+
+    def __create_provider(self) -> ConfigurationProviderBase:
+        """
+        Creates the configuration provider selected by the FOUNDATIONALLM_CONFIGURATION_PROVIDER environment variable.
+        """
+        provider_type = os.environ.get(
+            FOUNDATIONALLM_CONFIGURATION_PROVIDER, ConfigurationProviderTypes.AZURE_APP_CONFIGURATION)
+
+        match provider_type:
+            case ConfigurationProviderTypes.AZURE_APP_CONFIGURATION:
                 try:
-                    feature_flag_setting = self.__config["FeatureManagementFeatureFlags"][key]
-                    obj = json.loads(feature_flag_setting)
-                    value = obj["enabled"]
+                    app_config_uri = os.environ['FOUNDATIONALLM_APP_CONFIGURATION_URI']
                 except Exception as e:
-                    pass
+                    raise e
+                # The whole configuration is reloaded only when the sentinel key changes.
+                return AzureAppConfigurationProvider(
+                    app_config_uri,
+                    key_prefixes=self.__key_prefixes,
+                    refresh_interval_seconds=int(os.environ.get(
+                        FOUNDATIONALLM_CONFIGURATION_REFRESH_INTERVAL_SECONDS, DEFAULT_REFRESH_INTERVAL_SECONDS)),
+                    sentinel_key=os.environ.get(
+                        FOUNDATIONALLM_CONFIGURATION_SENTINEL_KEY, DEFAULT_SENTINEL_KEY),
+                    on_refresh_success=self.clear_cache)
+            case ConfigurationProviderTypes.FILE:
+                return FileConfigurationProvider(os.environ[FOUNDATIONALLM_CONFIGURATION_FILE])
+            case ConfigurationProviderTypes.ENVIRONMENT:
+                return EnvironmentConfigurationProvider()
+            case _:
+                raise ValueError(f'The configuration provider {provider_type} is not supported.')
+
+    def __get_cached_value(self, key: str) -> Optional[str]:
+        """
+        Retrieves a value from the cache, loading it from Azure App Configuration when
+        it is not cached or has expired. Missing keys are cached as None.
+        """
+        cached_value = self.__values_cache.get(key)
+        if cached_value is not None and cached_value[1] > time.monotonic():
+            return cached_value[0]
+
+        try:
+            value = self.__get_config_with_retry(name=key)
+        except Exception as e:
+            # Do not cache transient failures.
+            logging.warning(f'Failed to retrieve the configuration variable {key}: {e}')
+            return None
 
+        self.__values_cache[key] = (value, time.monotonic() + self.__cache_ttl_seconds)
         return value
 
     def __retry_before_sleep(self, retry_state):
@@ -120,13 +227,15 @@ class Configuration():
     # Retry with jitter on transient errors. Initially up to 2^x * 1 seconds between each retry
     # until the range reaches 30 seconds, then randomly up to 60 seconds afterwards.
     # Stop after five retry attempts.
+    # Missing keys are not retried: they are reported as None instead of raising KeyError.
     @retry(
         wait=wait_random_exponential(multiplier=1, max=5),
         stop=stop_after_attempt(5),
+        retry=retry_if_not_exception_type(KeyError),
         before_sleep=__retry_before_sleep
     )
     def __get_config_with_retry(self, name):
         try:
-            return self.__config[name]
+            return self.__provider.get_value(name)
         except RetryError:
             pass
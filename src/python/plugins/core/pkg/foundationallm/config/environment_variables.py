@@ -12,3 +12,105 @@ The build version of the container. This is also used for the app version used
 to validate the minimum version of the app required to use certain configuration entries.
 """
 FOUNDATIONALLM_VERSION = "FOUNDATIONALLM_VERSION"
+
+"""
+The maximum number of completion requests a LangChainAPI worker processes concurrently.
+"""
+FOUNDATIONALLM_COMPLETIONS_MAX_CONCURRENCY = "FOUNDATIONALLM_COMPLETIONS_MAX_CONCURRENCY"
+
+"""
+The maximum number of accepted completion requests a LangChainAPI worker keeps waiting
+for a free execution slot. Requests beyond this limit are rejected with HTTP 429.
+"""
+FOUNDATIONALLM_COMPLETIONS_MAX_QUEUE_SIZE = "FOUNDATIONALLM_COMPLETIONS_MAX_QUEUE_SIZE"
+
+"""
+The maximum number of seconds a LangChainAPI worker waits for in-flight completion requests
+to finish when shutting down. Completion requests still running afterwards are marked as failed.
+"""
+FOUNDATIONALLM_COMPLETIONS_DRAIN_TIMEOUT_SECONDS = "FOUNDATIONALLM_COMPLETIONS_DRAIN_TIMEOUT_SECONDS"
+
+"""
+The interval, in seconds, at which the pending progress updates of the long running operations
+are written to the State API.
+"""
+FOUNDATIONALLM_OPERATION_STATE_FLUSH_INTERVAL_SECONDS = "FOUNDATIONALLM_OPERATION_STATE_FLUSH_INTERVAL_SECONDS"
+
+"""
+The maximum number of simultaneous connections of the shared HTTP session pool.
+"""
+FOUNDATIONALLM_HTTP_POOL_LIMIT = "FOUNDATIONALLM_HTTP_POOL_LIMIT"
+
+"""
+The maximum number of simultaneous connections of the shared HTTP session pool to the same endpoint.
+"""
+FOUNDATIONALLM_HTTP_POOL_LIMIT_PER_HOST = "FOUNDATIONALLM_HTTP_POOL_LIMIT_PER_HOST"
+
+"""
+The time, in seconds, the DNS entries resolved by the shared HTTP session pool are cached.
+"""
+FOUNDATIONALLM_HTTP_POOL_DNS_CACHE_TTL_SECONDS = "FOUNDATIONALLM_HTTP_POOL_DNS_CACHE_TTL_SECONDS"
+
+"""
+The time, in seconds, the idle connections of the shared HTTP session pool are kept open for reuse.
+"""
+FOUNDATIONALLM_HTTP_POOL_KEEPALIVE_TIMEOUT_SECONDS = "FOUNDATIONALLM_HTTP_POOL_KEEPALIVE_TIMEOUT_SECONDS"
+
+"""
+The time, in seconds, configuration values (including missing keys) are cached in memory.
+"""
+FOUNDATIONALLM_CONFIGURATION_CACHE_TTL_SECONDS = "FOUNDATIONALLM_CONFIGURATION_CACHE_TTL_SECONDS"
+
+"""
+The interval, in seconds, at which the configuration sentinel key is checked for changes.
+Set to 0 to disable the background refresh of the configuration.
+"""
+FOUNDATIONALLM_CONFIGURATION_REFRESH_INTERVAL_SECONDS = "FOUNDATIONALLM_CONFIGURATION_REFRESH_INTERVAL_SECONDS"
+
+"""
+The key of the configuration setting that triggers a refresh of the whole configuration when its value changes.
+"""
+FOUNDATIONALLM_CONFIGURATION_SENTINEL_KEY = "FOUNDATIONALLM_CONFIGURATION_SENTINEL_KEY"
+
+"""
+The provider of the configuration settings: AzureAppConfiguration (default), File, or Environment.
+"""
+FOUNDATIONALLM_CONFIGURATION_PROVIDER = "FOUNDATIONALLM_CONFIGURATION_PROVIDER"
+
+"""
+The path of the JSON or YAML file containing the configuration settings when the File configuration provider is used.
+"""
+FOUNDATIONALLM_CONFIGURATION_FILE = "FOUNDATIONALLM_CONFIGURATION_FILE"
+
+"""
+A comma separated list of additional key prefixes loaded from Azure App Configuration
+when the API loads only the key prefixes it requires.
+"""
+FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES = "FOUNDATIONALLM_CONFIGURATION_KEY_PREFIXES"
+
+"""
+The maximum number of plugin package descriptors and module files downloaded concurrently at startup.
+"""
+FOUNDATIONALLM_PLUGIN_DOWNLOAD_MAX_WORKERS = "FOUNDATIONALLM_PLUGIN_DOWNLOAD_MAX_WORKERS"
+
+"""
+The maximum number of language model clients cached by the LanguageModelFactory.
+"""
+FOUNDATIONALLM_LANGUAGE_MODEL_CACHE_MAX_SIZE = "FOUNDATIONALLM_LANGUAGE_MODEL_CACHE_MAX_SIZE"
+
+"""
+The maximum size, in megabytes, of the context file contents cached in memory across the turns of the conversations.
+Set to 0 to disable the context file content cache.
+"""
+FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_MEMORY_MB = "FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_MEMORY_MB"
+
+"""
+The maximum size, in megabytes, of the context file contents cached on the local disk
+when they are evicted from memory. Set to 0 to cache the context file contents in memory only.
+"""
+FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_DISK_MB = "FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_DISK_MB"
+
+"""
+The directory in which the context file contents are cached on the local disk. Defaults to the temporary directory.
+"""
+FOUNDATIONALLM_CONTEXT_FILE_CACHE_PATH = "FOUNDATIONALLM_CONTEXT_FILE_CACHE_PATH"
@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from azure.appconfiguration.provider import (
+    AzureAppConfigurationKeyVaultOptions,
+    SettingSelector,
+    WatchKey,
+    load
+)
+from azure.identity import DefaultAzureCredential
+from azure.keyvault.secrets import KeyVaultSecretIdentifier, SecretClient
+
+from .configuration_provider_base import ConfigurationProviderBase
+
+FEATURE_FLAGS_SECTION = 'FeatureManagementFeatureFlags'
+# Marks the values of the Key Vault references that are resolved on first access.
+KEY_VAULT_REFERENCE_MARKER = '@KeyVaultReference:'
+
+class AzureAppConfigurationProvider(ConfigurationProviderBase):
+    """
+    Provides configuration settings from Azure App Configuration, resolving Key Vault references.
+
+    When key prefixes are set, only the settings starting with one of the prefixes are loaded.
+    Key Vault references are not resolved when the configuration is loaded: each secret is
+    retrieved from Key Vault the first time its setting is accessed and is cached afterwards.
+
+    When a refresh interval is set, a background thread checks the sentinel key on the interval
+    and the whole configuration is reloaded only when the sentinel key changes.
+    """
+
+    def __init__(
+        self,
+        app_config_uri: str,
+        key_prefixes: Optional[List[str]] = None,
+        refresh_interval_seconds: int = 0,
+        sentinel_key: Optional[str] = None,
+        on_refresh_success: Optional[Callable[[], None]] = None):
+        """
+        Initializes the provider and loads the configuration from Azure App Configuration.
+
+        Parameters
+        ----------
+        app_config_uri : str
+            The endpoint of the Azure App Configuration store.
+        key_prefixes : List[str]
+            The prefixes of the keys to load. All the keys are loaded when not set.
+        refresh_interval_seconds : int
+            The interval, in seconds, at which the sentinel key is checked. Set to 0 to disable the refresh.
+        sentinel_key : str
+            The key of the setting that triggers a reload of the configuration when its value changes.
+        on_refresh_success : Callable[[], None]
+            The function called after the configuration is reloaded.
+        """
+        super().__init__()
+
+        self.key_prefixes = key_prefixes
+        self.__on_refresh_success = on_refresh_success
+        self.__credential = DefaultAzureCredential(
+            exclude_environment_credential=True)
+        self.__secret_clients: Dict[str, SecretClient] = {}
+        self.__secrets: Dict[str, str] = {}
+        self.__secrets_lock = threading.Lock()
+
+        refresh_options = {
+            'refresh_on': [WatchKey(sentinel_key)],
+            'refresh_interval': refresh_interval_seconds,
+            'on_refresh_success': self.__refresh_success
+        } if refresh_interval_seconds > 0 and sentinel_key else {}
+
+        selectors = {
+            'selects': [
+                SettingSelector(key_filter=f'{key_prefix}*')
+                for key_prefix in [*key_prefixes, FEATURE_FLAGS_SECTION]
+            ]
+        } if key_prefixes else {}
+
+        # Connect to Azure App Configuration.
+        # Key Vault references are replaced with markers and resolved on first access.
+        self.__config = load(endpoint=app_config_uri, credential=self.__credential,
+                             key_vault_options=
+                                AzureAppConfigurationKeyVaultOptions(
+                                    secret_resolver=self.__defer_secret_resolution),
+                             **selectors,
+                             **refresh_options)
+
+        if refresh_options:
+            threading.Thread(
+                target=self.__refresh_loop,
+                args=(refresh_interval_seconds,),
+                name='foundationallm-configuration-refresh',
+                daemon=True).start()
+
+    def get_feature_flags(self) -> Mapping[str, Any]:
+        if FEATURE_FLAGS_SECTION in self.__config.keys():
+            return self.__config[FEATURE_FLAGS_SECTION]
+        return {}
+
+    def refresh(self):
+        self.__config.refresh()
+
+    def get_stats(self) -> dict:
+        return {
+            **super().get_stats(),
+            'key_prefixes': self.key_prefixes,
+            'resolved_secrets': len(self.__secrets)
+        }
+
+    def _get_value(self, key: str) -> Optional[Any]:
+        value = self.__config.get(key)
+        if isinstance(value, str) and value.startswith(KEY_VAULT_REFERENCE_MARKER):
+            return self.__resolve_secret(value[len(KEY_VAULT_REFERENCE_MARKER):])
+        if value is None and self.key_prefixes \
+            and not any(key.startswith(key_prefix) for key_prefix in self.key_prefixes):
+            logging.warning(f'The configuration key {key} does not match any of the loaded key prefixes.')
+        return value
+
+    def __defer_secret_resolution(self, secret_uri: str) -> str:
+        """
+        Replaces a Key Vault reference with a marker resolved on first access.
+        """
+        return f'{KEY_VAULT_REFERENCE_MARKER}{secret_uri}'
+
+    def __resolve_secret(self, secret_uri: str) -> str:
+        """
+        Retrieves the value of a Key Vault secret, caching it for the subsequent accesses.
+        """
+        with self.__secrets_lock:
+            if secret_uri in self.__secrets:
+                return self.__secrets[secret_uri]
+
+            secret_identifier = KeyVaultSecretIdentifier(secret_uri)
+            secret_client = self.__secret_clients.get(secret_identifier.vault_url)
+            if secret_client is None:
+                secret_client = SecretClient(
+                    vault_url=secret_identifier.vault_url,
+                    credential=self.__credential)
+                self.__secret_clients[secret_identifier.vault_url] = secret_client
+
+            secret = secret_client.get_secret(secret_identifier.name, secret_identifier.version)
+            self.__secrets[secret_uri] = secret.value
+            return secret.value
+
+    def __refresh_success(self):
+        """
+        Clears the resolved secrets after the configuration is reloaded, so rotated secrets are picked up.
+        """
+        with self.__secrets_lock:
+            self.__secrets = {}
+        if self.__on_refresh_success is not None:
+            self.__on_refresh_success()
+
+    def __refresh_loop(self, refresh_interval_seconds: int):
+        """
+        Checks the sentinel key on the refresh interval and reloads the configuration when it changed.
+        """
+        while True:
+            time.sleep(refresh_interval_seconds)
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.warning(f'Failed to refresh the configuration from Azure App Configuration: {e}')
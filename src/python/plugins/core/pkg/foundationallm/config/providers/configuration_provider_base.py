@@ -0,0 +1,93 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Mapping, Optional
+
+class ConfigurationProviderBase(ABC):
+    """
+    Base class for the providers of configuration settings.
+
+    Every lookup goes through get_value(), which records the number of lookups and the time
+    spent in the provider, so the configuration lookup overhead can be measured separately
+    from the caching done by the Configuration class.
+    """
+
+    def __init__(self):
+        self.__lookups = 0
+        self.__missing = 0
+        self.__lookup_time_seconds = 0.0
+
+    def get_value(self, key: str) -> Optional[Any]:
+        """
+        Retrieves the value of a configuration setting.
+
+        Parameters
+        ----------
+        key : str
+            The key name of the configuration setting to retrieve.
+
+        Returns
+        -------
+        Optional[Any]
+            The value of the configuration setting or None if the setting does not exist.
+        """
+        start = time.perf_counter()
+        try:
+            value = self._get_value(key)
+        finally:
+            self.__lookups += 1
+            self.__lookup_time_seconds += time.perf_counter() - start
+        if value is None:
+            self.__missing += 1
+        return value
+
+    def get_feature_flags(self) -> Mapping[str, Any]:
+        """
+        Retrieves the feature flags, indexed by feature flag name.
+
+        Returns
+        -------
+        Mapping[str, Any]
+            The feature flag definitions, either as JSON strings or as dictionaries.
+        """
+        return {}
+
+    def refresh(self):
+        """
+        Reloads the configuration settings from their source.
+        """
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the lookup statistics of the provider.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the number of lookups, the number of missing keys,
+            and the time spent in the provider.
+        """
+        return {
+            'provider': type(self).__name__,
+            'lookups': self.__lookups,
+            'missing': self.__missing,
+            'total_lookup_time_ms': round(self.__lookup_time_seconds * 1000, 3),
+            'average_lookup_time_us': \
+                round(self.__lookup_time_seconds * 1000000 / self.__lookups, 3) if self.__lookups else 0.0
+        }
+
+    @abstractmethod
+    def _get_value(self, key: str) -> Optional[Any]:
+        """
+        Retrieves the value of a configuration setting from the source of the provider.
+
+        Parameters
+        ----------
+        key : str
+            The key name of the configuration setting to retrieve.
+
+        Returns
+        -------
+        Optional[Any]
+            The value of the configuration setting or None if the setting does not exist.
+        """
+        raise NotImplementedError()
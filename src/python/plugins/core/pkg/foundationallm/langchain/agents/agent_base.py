@@ -1,5 +1,7 @@
 from abc import abstractmethod
+from typing import Optional
 from foundationallm.config import Configuration, UserIdentity
+from foundationallm.langchain.common import FoundationaLLMCompletionStream
 from foundationallm.operations import OperationsManager
 from foundationallm.models.orchestration import (
     CompletionRequestBase,
@@ -12,7 +14,14 @@ class AgentBase():
     """
     Implements the base functionality for a LangChain agent.
     """
-    def __init__(self, instance_id: str, user_identity: UserIdentity, config: Configuration, plugin_manager: PluginManager, operations_manager: OperationsManager):
+    def __init__(
+        self,
+        instance_id: str,
+        user_identity: UserIdentity,
+        config: Configuration,
+        plugin_manager: PluginManager,
+        operations_manager: OperationsManager,
+        completion_stream: Optional[FoundationaLLMCompletionStream] = None):
         """
         Initializes a knowledge management agent.
 
@@ -20,11 +29,16 @@ class AgentBase():
         ----------
         config : Configuration
             Application configuration class for retrieving configuration settings.
+        completion_stream : FoundationaLLMCompletionStream
+            The stream used to relay the completion response while it is generated.
+            If None, the completion response is not streamed.
         """
         self.instance_id = instance_id
         self.user_identity = user_identity
         self.config = config
         self.plugin_manager = plugin_manager
+        # The request keeps using this version of the plugins even if they are reloaded meanwhile.
+        self.plugin_registry = plugin_manager.registry
         self.ai_model = None
         self.api_endpoint = None
         self.prompt = ''
@@ -32,6 +46,7 @@ class AgentBase():
         self.has_indexing_profiles = False
         self.has_retriever = False
         self.operations_manager = operations_manager
+        self.completion_stream = completion_stream
 
         self.tracer = Telemetry.get_tracer('langchain-agent-base')
 
@@ -1,4 +1,6 @@
+from typing import Optional
 from foundationallm.config import Configuration, UserIdentity
+from foundationallm.langchain.common import FoundationaLLMCompletionStream
 from foundationallm.operations import OperationsManager
 from foundationallm.plugins import PluginManager
 from foundationallm.langchain.agents import (
@@ -17,7 +19,8 @@ class AgentFactory:
         plugin_manager: PluginManager,
         operations_manager: OperationsManager,
         instance_id: str,
-        user_identity: UserIdentity
+        user_identity: UserIdentity,
+        completion_stream: Optional[FoundationaLLMCompletionStream] = None
     ) -> AgentBase:
         """
         Retrieves an agent of the the requested type.
@@ -34,6 +37,8 @@ class AgentFactory:
             The unique identifier of the FoundationaLLM instance.
         user_identity : UserIdentity
             The user context under which to execution completion requests.
+        completion_stream : FoundationaLLMCompletionStream
+            The stream used to relay the completion response while it is generated.
 
         Returns
         -------
@@ -49,6 +54,7 @@ class AgentFactory:
                         user_identity=user_identity,
                         config=config,
                         plugin_manager=plugin_manager,
-                        operations_manager=operations_manager)
+                        operations_manager=operations_manager,
+                        completion_stream=completion_stream)
             case _:
                 raise ValueError(f'The agent type {agent_type} is not supported.')
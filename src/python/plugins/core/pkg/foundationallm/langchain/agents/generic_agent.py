@@ -1,5 +1,5 @@
 ﻿import uuid
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+from azure.identity import get_bearer_token_provider
 from openai import AsyncAzureOpenAI as async_aoi
 from openai.types import CompletionUsage
 from opentelemetry.trace import SpanKind
@@ -45,7 +45,7 @@ from foundationallm.services import (
     ImageService,
     OpenAIAssistantsApiService
 )
-from foundationallm.utils import ObjectUtils
+from foundationallm.utils import AzureCredentialRegistry, ObjectUtils
 
 from langchain_core.language_models import BaseLanguageModel
 
@@ -148,7 +148,7 @@ class GenericAgent(AgentBase):
         scope = api_endpoint.authentication_parameters.get('scope', 'https://cognitiveservices.azure.com/.default')
         # Set up a Azure AD token provider.
         token_provider = get_bearer_token_provider(
-            DefaultAzureCredential(exclude_environment_credential=True),
+            AzureCredentialRegistry.get_credential(),
             scope
         )
 
@@ -343,7 +343,7 @@ class GenericAgent(AgentBase):
                 span.set_attribute("operation_id", request.operation_id)
 
                 # prepare tools
-                tool_factory = ToolFactory(self.plugin_manager)
+                tool_factory = ToolFactory(self.plugin_manager, self.plugin_registry)
                 workflow_tools = []
 
                 # Populate tools list from agent configuration
@@ -360,29 +360,35 @@ class GenericAgent(AgentBase):
                 # create the workflow
                 workflow_factory = WorkflowFactory(
                     self.plugin_manager,
-                    self.operations_manager)
+                    self.operations_manager,
+                    self.plugin_registry)
                 workflow = workflow_factory.get_workflow(
                     agent.workflow,
                     request.objects,
                     workflow_tools,
                     self.user_identity,
                     self.config)
+                workflow.completion_stream = self.completion_stream
 
             with self.tracer.start_as_current_span('langchain_invoke_plugin_workflow', kind=SpanKind.SERVER) as span:
                 span.set_attribute("agent_name", agent.name)
                 span.set_attribute("conversation_id", request.session_id if request.session_id is not None else '')
                 span.set_attribute("operation_id", request.operation_id)
 
-                response = await workflow.invoke_async(
-                    operation_id=request.operation_id,
-                    user_prompt=request.user_prompt,
-                    user_prompt_rewrite=request.user_prompt_rewrite,
-                    message_history=request.message_history,
-                    file_history=request.file_history,
-                    conversation_id=request.session_id,
-                    is_new_conversation=request.is_new_conversation,
-                    objects=request.objects
-                )
+                try:
+                    response = await workflow.invoke_async(
+                        operation_id=request.operation_id,
+                        user_prompt=request.user_prompt,
+                        user_prompt_rewrite=request.user_prompt_rewrite,
+                        message_history=request.message_history,
+                        file_history=request.file_history,
+                        conversation_id=request.session_id,
+                        is_new_conversation=request.is_new_conversation,
+                        objects=request.objects
+                    )
+                finally:
+                    # Do not spend a language model call on the name of a conversation whose workflow failed.
+                    workflow.cancel_conversation_name_generation()
                 # Ensure the user prompt rewrite is returned in the response
                 response.user_prompt_rewrite = request.user_prompt_rewrite
             return response
@@ -1,3 +1,4 @@
 from .foundationallm_tool_base import FoundationaLLMToolBase
+from .foundationallm_completion_stream import FoundationaLLMCompletionStream
 from .foundationallm_workflow_base import FoundationaLLMWorkflowBase
 from .foundationallm_tool_result import FoundationaLLMToolResult
@@ -0,0 +1,113 @@
+"""
+Class: FoundationaLLMCompletionStream
+Description: Relays the events produced while a completion response is generated to a streaming consumer.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Optional
+
+from foundationallm.models.orchestration import (
+    CompletionResponse,
+    CompletionStreamEvent,
+    CompletionStreamEventTypes
+)
+
+class FoundationaLLMCompletionStream():
+    """
+    Relays the events produced by a workflow while generating a completion response.
+
+    The producer (the workflow) emits events without waiting for the consumer. The consumer
+    iterates over the stream until the completion response is emitted or the stream is closed.
+    """
+
+    def __init__(self, operation_id: str):
+        """
+        Initializes the completion stream.
+
+        Parameters
+        ----------
+        operation_id : str
+            The unique identifier of the operation generating the completion response.
+        """
+        self.operation_id = operation_id
+        self.closed = False
+        self.__queue: asyncio.Queue[Optional[CompletionStreamEvent]] = asyncio.Queue()
+
+    def emit(
+        self,
+        event_type: str,
+        content: Optional[str] = None,
+        data: Optional[Any] = None):
+        """
+        Emits an event to the stream. Events emitted after the stream is closed are ignored.
+
+        Parameters
+        ----------
+        event_type : str
+            The type of the event. See CompletionStreamEventTypes for the supported values.
+        content : str
+            The text content of the event.
+        data : Any
+            Additional data associated with the event.
+        """
+        if self.closed:
+            return
+        self.__queue.put_nowait(
+            CompletionStreamEvent(
+                event_type=event_type,
+                operation_id=self.operation_id,
+                content=content,
+                data=data))
+
+    def complete(self, completion_response: CompletionResponse):
+        """
+        Emits the final completion response and closes the stream.
+
+        Parameters
+        ----------
+        completion_response : CompletionResponse
+            The final completion response.
+        """
+        self.emit(
+            CompletionStreamEventTypes.COMPLETION,
+            data=completion_response.model_dump(exclude_none=True))
+        self.close()
+
+    def fail(self, error_message: str):
+        """
+        Emits an error event and closes the stream.
+
+        Parameters
+        ----------
+        error_message : str
+            The message describing the error.
+        """
+        self.emit(CompletionStreamEventTypes.ERROR, content=error_message)
+        self.close()
+
+    def close(self):
+        """
+        Closes the stream. The consumer stops iterating after receiving the pending events.
+        """
+        if not self.closed:
+            self.closed = True
+            self.__queue.put_nowait(None)
+
+    async def __aiter__(self) -> AsyncIterator[CompletionStreamEvent]:
+        while True:
+            event = await self.__queue.get()
+            if event is None:
+                return
+            yield event
+
+    async def iterate_sse_async(self) -> AsyncIterator[str]:
+        """
+        Iterates over the events of the stream formatted as Server-Sent Events.
+
+        Returns
+        -------
+        AsyncIterator[str]
+            The Server-Sent Events messages.
+        """
+        async for event in self:
+            yield f'event: {event.event_type}\ndata: {event.model_dump_json(exclude_none=True)}\n\n'
@@ -6,7 +6,6 @@ Description: FoundationaLLM base class for tools that uses the AgentTool model f
 from typing import List, Dict
 
 # Platform imports
-from azure.identity import DefaultAzureCredential
 from logging import Logger
 from opentelemetry.trace import Tracer
 
@@ -27,6 +26,7 @@ from foundationallm.models.constants import (
     ResourceProviderNames)
 from foundationallm.models.orchestration import ContentArtifact
 from foundationallm.telemetry import Telemetry
+from foundationallm.utils import AzureCredentialRegistry
 
 class FoundationaLLMToolBase(BaseTool):
     """
@@ -50,7 +50,7 @@ class FoundationaLLMToolBase(BaseTool):
 
         self.logger: Logger = Telemetry.get_logger(self.name)
         self.tracer: Tracer = Telemetry.get_tracer(self.name)
-        self.default_credential = DefaultAzureCredential(exclude_environment_credential=True)
+        self.default_credential = AzureCredentialRegistry.get_credential()
 
     def get_language_model(
         self,
@@ -3,19 +3,22 @@ Class: FoundationaLLMWorkflowBase
 Description: FoundationaLLM base class for tools that uses the agent workflow model for its configuration.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from opentelemetry.trace import SpanKind
 
-from azure.identity import DefaultAzureCredential
 from langchain_core.messages import (
     AIMessage,
     BaseMessage,
+    BaseMessageChunk,
     HumanMessage,
     SystemMessage
 )
+from langchain_core.runnables import Runnable, RunnableConfig
 
 from foundationallm.langchain.common import (
+    FoundationaLLMCompletionStream,
     FoundationaLLMToolBase
 )
 from foundationallm.config import (
@@ -39,6 +42,7 @@ from foundationallm.models.constants import (
 from foundationallm.models.messages import MessageHistoryItem
 from foundationallm.models.orchestration import (
     CompletionResponse,
+    CompletionStreamEventTypes,
     ContentArtifact,
     FileHistoryItem
 )
@@ -46,7 +50,7 @@ from foundationallm.models.resource_providers.ai_models import AIModelBase
 from foundationallm.models.resource_providers.configuration import APIEndpointConfiguration
 from foundationallm.operations import OperationsManager
 from foundationallm.telemetry import Telemetry
-from foundationallm.utils import LoggingAsyncHttpClient, ObjectUtils
+from foundationallm.utils import AzureCredentialRegistry, LoggingAsyncHttpClient, ObjectUtils
 
 class FoundationaLLMWorkflowBase(ABC):
     """
@@ -85,7 +89,7 @@ class FoundationaLLMWorkflowBase(ABC):
         self.config = config
         self.logger = Telemetry.get_logger(self.workflow_config.name)
         self.tracer = Telemetry.get_tracer(self.workflow_config.name)
-        self.default_credential = DefaultAzureCredential(exclude_environment_credential=True)
+        self.default_credential = AzureCredentialRegistry.get_credential()
 
         self.name = workflow_config.name
         self.default_error_message = workflow_config.properties.get(
@@ -95,6 +99,12 @@ class FoundationaLLMWorkflowBase(ABC):
         
         self.workflow_llm = None  # To be set in derived classes by calling create_workflow_llm()
 
+        # Set by the agent when the completion response is streamed to the caller.
+        self.completion_stream: Optional[FoundationaLLMCompletionStream] = None
+
+        # The generation of the name of a new conversation, running concurrently with the workflow.
+        self.__conversation_name_task: Optional[asyncio.Task] = None
+
     @abstractmethod
     async def invoke_async(
         self,
@@ -128,6 +138,81 @@ class FoundationaLLMWorkflowBase(ABC):
             The exploded objects assigned from the agent. This is used to pass additional context to the workflow.
         """
 
+    def emit_stream_event(
+        self,
+        event_type: str,
+        content: Optional[str] = None,
+        data: Optional[Any] = None):
+        """
+        Emits an event to the completion stream, if the completion response is streamed.
+
+        Parameters
+        ----------
+        event_type : str
+            The type of the event. See CompletionStreamEventTypes for the supported values.
+        content : str
+            The text content of the event.
+        data : Any
+            Additional data associated with the event.
+        """
+        if self.completion_stream is not None:
+            self.completion_stream.emit(event_type, content=content, data=data)
+
+    async def invoke_runnable_async(
+        self,
+        runnable: Runnable,
+        runnable_input: Any,
+        config: Optional[RunnableConfig] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Invokes a runnable (language model, chain, or graph) and returns its output.
+
+        When the completion response is streamed, the runnable is executed using astream_events
+        and the generated tokens and tool calls are relayed to the completion stream as they occur.
+        The output returned is the same as the one returned by ainvoke.
+
+        Parameters
+        ----------
+        runnable : Runnable
+            The runnable to invoke.
+        runnable_input : Any
+            The input of the runnable.
+        config : RunnableConfig
+            The configuration used to invoke the runnable.
+        kwargs
+            Additional keyword arguments passed to the runnable.
+
+        Returns
+        -------
+        Any
+            The output of the runnable.
+        """
+        if self.completion_stream is None:
+            return await runnable.ainvoke(runnable_input, config, **kwargs)
+
+        output = None
+        async for event in runnable.astream_events(runnable_input, config, version='v2', **kwargs):
+            match event['event']:
+                case 'on_chat_model_stream':
+                    text = self.__get_text_from_chunk(event['data']['chunk'])
+                    if text:
+                        self.completion_stream.emit(CompletionStreamEventTypes.TOKEN, content=text)
+                case 'on_tool_start':
+                    self.completion_stream.emit(
+                        CompletionStreamEventTypes.TOOL_START,
+                        content=event['name'],
+                        data={'run_id': event['run_id']})
+                case 'on_tool_end':
+                    self.completion_stream.emit(
+                        CompletionStreamEventTypes.TOOL_END,
+                        content=event['name'],
+                        data={'run_id': event['run_id']})
+            # The end event of the root run carries the output of the runnable.
+            if not event['parent_ids'] and event['event'].endswith('_end'):
+                output = event['data'].get('output')
+        return output
+
     def create_workflow_execution_content_artifact(
         self,
         original_prompt: str,
@@ -375,6 +460,16 @@ class FoundationaLLMWorkflowBase(ABC):
         text = " ".join(text_parts)
         return text.strip()
 
+    def __get_text_from_chunk(self, chunk: BaseMessageChunk) -> str:
+        """
+        Extracts the text from a message chunk streamed by the LLM.
+        """
+        if isinstance(chunk.content, str):
+            return chunk.content
+        return ''.join(
+            block.get('text', '') for block in chunk.content
+            if isinstance(block, dict) and block.get('type') == 'text')
+
     def get_canonical_usage(
             self,
             llm_response: AIMessage
@@ -409,7 +504,7 @@ class FoundationaLLMWorkflowBase(ABC):
     async def get_conversation_name(
         self,
         user_prompt: str,
-        agent_response: str
+        agent_response: Optional[str] = None
     ) -> tuple[str, int, int]:
         """
         Generates a conversation name based on the initial user message.
@@ -419,7 +514,7 @@ class FoundationaLLMWorkflowBase(ABC):
         user_prompt: str
             The initial user message of the conversation.
         agent_response: str
-            The agent's response to the user message.
+            The agent's response to the user message. The name is generated from the user message only if None.
 
         Returns
         -------
@@ -430,11 +525,11 @@ class FoundationaLLMWorkflowBase(ABC):
         output_tokens = 0
         conversation_name = None
 
-        messages = [
-            HumanMessage(content=user_prompt),
-            AIMessage(content=agent_response),
-            HumanMessage(content="Generate a brief title (3-6 words) that summarizes the main topic of this conversation. Return only the title, no quotes or punctuation.")
-        ]
+        messages = [HumanMessage(content=user_prompt)]
+        if agent_response is not None:
+            messages.append(AIMessage(content=agent_response))
+        messages.append(
+            HumanMessage(content="Generate a brief title (3-6 words) that summarizes the main topic of this conversation. Return only the title, no quotes or punctuation."))
 
         with self.tracer.start_as_current_span(
             f'{self.name}_get_conversation_name',
@@ -450,3 +545,44 @@ class FoundationaLLMWorkflowBase(ABC):
                 self.logger.error('Error during conversation name generation: %s', str(ex))
             
             return conversation_name, input_tokens, output_tokens
+
+    def start_conversation_name_generation(self, user_prompt: str):
+        """
+        Starts generating the name of a new conversation from its initial user message,
+        so the name is generated concurrently with the workflow instead of after it.
+
+        Parameters
+        ----------
+        user_prompt: str
+            The initial user message of the conversation.
+        """
+        self.cancel_conversation_name_generation()
+        self.__conversation_name_task = asyncio.create_task(self.get_conversation_name(user_prompt))
+
+    async def set_conversation_name_async(self, completion_response: CompletionResponse):
+        """
+        Waits for the generation of the conversation name, if started,
+        and sets the name and its token usage on the completion response.
+
+        Parameters
+        ----------
+        completion_response : CompletionResponse
+            The completion response of the first message of the conversation.
+        """
+        if self.__conversation_name_task is None:
+            return
+
+        conversation_name_task, self.__conversation_name_task = self.__conversation_name_task, None
+        conversation_name, input_tokens, output_tokens = await conversation_name_task
+        if conversation_name:
+            completion_response.conversation_name = conversation_name
+            completion_response.prompt_tokens += input_tokens
+            completion_response.completion_tokens += output_tokens
+
+    def cancel_conversation_name_generation(self):
+        """
+        Cancels the generation of the conversation name, if still running (e.g., when the workflow failed).
+        """
+        if self.__conversation_name_task is not None:
+            self.__conversation_name_task.cancel()
+            self.__conversation_name_task = None
@@ -1,2 +1,8 @@
 """Language model module"""
+from .aws_sts_credential_cache import AwsStsCredentialCache
+from .deployment_rate_limiter import DeploymentRateLimiter
+from .endpoint_health import EndpointHealth
+from .language_model_client_cache import LanguageModelClientCache
 from .language_model_factory import LanguageModelFactory
+from .rate_limiting_callback_handler import RateLimitingCallbackHandler
+from .routed_chat_model import RoutedChatModel
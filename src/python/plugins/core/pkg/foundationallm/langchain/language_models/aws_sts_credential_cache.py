@@ -0,0 +1,212 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+from foundationallm.telemetry import Telemetry
+from foundationallm.utils import AzureCredentialRegistry
+
+# The credentials are refreshed in the background when they expire in less than this number of seconds.
+# Matches the advisory refresh window of the botocore refreshable credentials.
+BACKGROUND_REFRESH_MARGIN_SECONDS = 15 * 60
+# The credentials are refreshed before being returned when they expire in less than this number of seconds.
+# Matches the mandatory refresh window of the botocore refreshable credentials.
+MANDATORY_REFRESH_MARGIN_SECONDS = 10 * 60
+
+class AwsStsCredentialCache():
+    """
+    Caches the temporary AWS credentials obtained by exchanging an Azure token
+    with AWS STS (AssumeRoleWithWebIdentity), per role ARN and Azure scope.
+
+    The cached credentials are refreshed in the background shortly before they expire,
+    so the requests using them do not wait for the Azure token and STS calls.
+    The boto3 sessions created by the cache use deferred refreshable credentials:
+    the credentials are only retrieved when the AWS clients send their first request,
+    which the LangChain chat models do outside of the event loop.
+    """
+
+    __default: Optional['AwsStsCredentialCache'] = None
+    __default_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Initializes the AWS STS credential cache.
+        """
+        self.logger = Telemetry.get_logger(__name__)
+        self.__credentials: Dict[Tuple[str, str], dict] = {}
+        self.__refreshing: set = set()
+        self.__locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self.__lock = threading.Lock()
+        self.__refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='aws-sts-refresh')
+        self.__hits = 0
+        self.__refreshes = 0
+        self.__background_refreshes = 0
+        self.__refresh_failures = 0
+
+    @staticmethod
+    def get_default() -> 'AwsStsCredentialCache':
+        """
+        Retrieves the process-wide AWS STS credential cache.
+
+        Returns
+        -------
+        AwsStsCredentialCache
+            The process-wide AWS STS credential cache.
+        """
+        if AwsStsCredentialCache.__default is None:
+            with AwsStsCredentialCache.__default_lock:
+                if AwsStsCredentialCache.__default is None:
+                    AwsStsCredentialCache.__default = AwsStsCredentialCache()
+        return AwsStsCredentialCache.__default
+
+    def get_credentials(self, role_arn: str, scope: str) -> dict:
+        """
+        Retrieves the AWS credentials for the specified role, refreshing them if needed.
+
+        Parameters
+        ----------
+        role_arn : str
+            The ARN of the AWS role to assume.
+        scope : str
+            The scope of the Azure token used as web identity token.
+
+        Returns
+        -------
+        dict
+            The AWS credentials, in the botocore credential metadata format
+            (access_key, secret_key, token, and expiry_time).
+        """
+        key = (role_arn, scope)
+        credentials = self.__credentials.get(key)
+        remaining_seconds = self.__get_remaining_seconds(credentials)
+
+        if remaining_seconds > BACKGROUND_REFRESH_MARGIN_SECONDS:
+            self.__hits += 1
+            return credentials
+
+        if remaining_seconds > MANDATORY_REFRESH_MARGIN_SECONDS:
+            self.__hits += 1
+            self.__start_background_refresh(key)
+            return credentials
+
+        with self.__get_lock(key):
+            # Another thread may have refreshed the credentials while this one was waiting for the lock.
+            credentials = self.__credentials.get(key)
+            if self.__get_remaining_seconds(credentials) > MANDATORY_REFRESH_MARGIN_SECONDS:
+                self.__hits += 1
+                return credentials
+            return self.__refresh(key)
+
+    def get_boto3_session(self, role_arn: str, scope: str, region: str) -> Any:
+        """
+        Creates a boto3 session using the cached AWS credentials of the specified role.
+
+        Parameters
+        ----------
+        role_arn : str
+            The ARN of the AWS role to assume.
+        scope : str
+            The scope of the Azure token used as web identity token.
+        region : str
+            The AWS region of the session.
+
+        Returns
+        -------
+        boto3.Session
+            A boto3 session whose clients retrieve the credentials from the cache when they need them.
+        """
+        import boto3
+        import botocore.credentials
+        import botocore.session
+
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = botocore.credentials.DeferredRefreshableCredentials(
+            refresh_using=partial(self.get_credentials, role_arn, scope),
+            method='sts-assume-role-with-web-identity')
+        return boto3.Session(botocore_session=botocore_session, region_name=region)
+
+    def clear(self):
+        """
+        Removes all the cached credentials.
+        """
+        with self.__lock:
+            self.__credentials.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the number of cached credentials, cache hits,
+            refreshes, background refreshes, and refresh failures.
+        """
+        return {
+            'size': len(self.__credentials),
+            'hits': self.__hits,
+            'refreshes': self.__refreshes,
+            'background_refreshes': self.__background_refreshes,
+            'refresh_failures': self.__refresh_failures
+        }
+
+    def __get_remaining_seconds(self, credentials: Optional[dict]) -> float:
+        if credentials is None:
+            return 0
+        return datetime.fromisoformat(credentials['expiry_time']).timestamp() - time.time()
+
+    def __get_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self.__lock:
+            return self.__locks.setdefault(key, threading.Lock())
+
+    def __start_background_refresh(self, key: Tuple[str, str]):
+        with self.__lock:
+            if key in self.__refreshing:
+                return
+            self.__refreshing.add(key)
+        self.__background_refreshes += 1
+        self.__refresh_executor.submit(self.__background_refresh, key)
+
+    def __background_refresh(self, key: Tuple[str, str]):
+        try:
+            with self.__get_lock(key):
+                self.__refresh(key)
+        except Exception as e:
+            # The current credentials remain in use until the mandatory refresh.
+            self.logger.warning(f'Failed to refresh the AWS credentials of the role {key[0]} in the background: {e}')
+        finally:
+            with self.__lock:
+                self.__refreshing.discard(key)
+
+    def __refresh(self, key: Tuple[str, str]) -> dict:
+        """
+        Exchanges an Azure token for new AWS credentials and caches them.
+        """
+        import boto3
+
+        role_arn, scope = key
+        try:
+            azure_token = AzureCredentialRegistry.get_credential().get_token(scope)
+
+            sts_client = boto3.client('sts')
+            sts_response = sts_client.assume_role_with_web_identity(
+                RoleArn=role_arn,
+                RoleSessionName='assume-role',
+                WebIdentityToken=azure_token.token
+            )
+        except Exception:
+            self.__refresh_failures += 1
+            raise
+
+        sts_credentials = sts_response['Credentials']
+        credentials = {
+            'access_key': sts_credentials['AccessKeyId'],
+            'secret_key': sts_credentials['SecretAccessKey'],
+            'token': sts_credentials['SessionToken'],
+            'expiry_time': sts_credentials['Expiration'].isoformat()
+        }
+        self.__credentials[key] = credentials
+        self.__refreshes += 1
+        return credentials
@@ -0,0 +1,276 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from foundationallm.telemetry import Telemetry
+
+# The number of seconds of capacity a bucket holds.
+# Azure OpenAI evaluates the RPM and TPM limits over short periods (1 to 10 seconds),
+# so allowing bursts of a full minute of capacity would still trigger throttling.
+BURST_SECONDS = 10
+
+class DeploymentRateLimiter():
+    """
+    Client-side rate limiter for a model deployment, enforcing its requests per minute (RPM)
+    and tokens per minute (TPM) budgets with token buckets.
+
+    Calls reserve their capacity when they are queued and wait until the buckets have refilled
+    enough to cover the reservation, so calls are dispatched in order and at the rate
+    the deployment accepts, instead of being dispatched immediately and rejected.
+    The token reservations are estimates, reconciled with the actual token usage once the calls complete.
+    """
+
+    __limiters: Dict[str, 'DeploymentRateLimiter'] = {}
+    __limiters_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None):
+        """
+        Initializes the deployment rate limiter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the deployment.
+        requests_per_minute : int
+            The number of requests per minute allowed by the deployment. No limit if None.
+        tokens_per_minute : int
+            The number of tokens per minute allowed by the deployment. No limit if None.
+        """
+        self.name = name
+        self.__lock = threading.Lock()
+        self.__last_refill = time.monotonic()
+        self.__set_limits(requests_per_minute, tokens_per_minute)
+        self.__available_requests = self.__request_capacity
+        self.__available_tokens = self.__token_capacity
+
+        self.__requests = 0
+        self.__queued_requests = 0
+        self.__throttled_requests = 0
+        self.__total_wait_ms = 0.0
+        self.__max_wait_ms = 0.0
+        self.__estimated_tokens = 0
+        self.__actual_tokens = 0
+
+        self.__wait_histogram = Telemetry.get_meter(__name__).create_histogram(
+            'foundationallm.language_models.rate_limit_wait',
+            unit='ms',
+            description='The time language model calls wait for the deployment rate limits.')
+
+    @staticmethod
+    def get_or_create(
+        name: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None) -> 'DeploymentRateLimiter':
+        """
+        Retrieves the process-wide rate limiter of a deployment, creating it if needed.
+        The limits of an existing rate limiter are updated when they change.
+
+        Parameters
+        ----------
+        name : str
+            The name of the deployment.
+        requests_per_minute : int
+            The number of requests per minute allowed by the deployment. No limit if None.
+        tokens_per_minute : int
+            The number of tokens per minute allowed by the deployment. No limit if None.
+
+        Returns
+        -------
+        DeploymentRateLimiter
+            The rate limiter of the deployment.
+        """
+        with DeploymentRateLimiter.__limiters_lock:
+            limiter = DeploymentRateLimiter.__limiters.get(name)
+            if limiter is None:
+                limiter = DeploymentRateLimiter(name, requests_per_minute, tokens_per_minute)
+                DeploymentRateLimiter.__limiters[name] = limiter
+            elif (limiter.requests_per_minute, limiter.tokens_per_minute) != (requests_per_minute, tokens_per_minute):
+                limiter.update_limits(requests_per_minute, tokens_per_minute)
+            return limiter
+
+    @staticmethod
+    def get_all_stats() -> dict:
+        """
+        Retrieves the statistics of all the deployment rate limiters.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the statistics of each rate limiter, indexed by deployment name.
+        """
+        with DeploymentRateLimiter.__limiters_lock:
+            limiters = list(DeploymentRateLimiter.__limiters.values())
+        return {limiter.name: limiter.get_stats() for limiter in limiters}
+
+    def update_limits(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]):
+        """
+        Updates the limits of the rate limiter, keeping the capacity already consumed.
+
+        Parameters
+        ----------
+        requests_per_minute : int
+            The number of requests per minute allowed by the deployment. No limit if None.
+        tokens_per_minute : int
+            The number of tokens per minute allowed by the deployment. No limit if None.
+        """
+        with self.__lock:
+            self.__refill()
+            self.__set_limits(requests_per_minute, tokens_per_minute)
+            self.__available_requests = min(self.__available_requests, self.__request_capacity)
+            self.__available_tokens = min(self.__available_tokens, self.__token_capacity)
+
+    def cap_token_reservation(self, estimated_tokens: int) -> int:
+        """
+        Caps the token reservation of a call to the capacity of the token bucket,
+        so a single large call cannot hold the deployment longer than the burst period.
+
+        Parameters
+        ----------
+        estimated_tokens : int
+            The estimated number of tokens used by the call (prompt and completion).
+
+        Returns
+        -------
+        int
+            The number of tokens to reserve for the call.
+        """
+        with self.__lock:
+            if not self.tokens_per_minute:
+                return estimated_tokens
+            return min(estimated_tokens, max(int(self.__token_capacity), 1))
+
+    async def acquire_async(self, estimated_tokens: int) -> float:
+        """
+        Reserves the capacity of a call and waits until the deployment can accept it.
+
+        Parameters
+        ----------
+        estimated_tokens : int
+            The estimated number of tokens used by the call (prompt and completion).
+
+        Returns
+        -------
+        float
+            The time, in milliseconds, the call waited.
+        """
+        with self.__lock:
+            self.__refill()
+            self.__requests += 1
+            self.__estimated_tokens += estimated_tokens
+            wait_seconds = 0.0
+            if self.requests_per_minute:
+                self.__available_requests -= 1
+                wait_seconds = max(wait_seconds, -self.__available_requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                self.__available_tokens -= estimated_tokens
+                wait_seconds = max(wait_seconds, -self.__available_tokens * 60 / self.tokens_per_minute)
+
+        wait_ms = wait_seconds * 1000
+        if wait_seconds > 0:
+            with self.__lock:
+                self.__queued_requests += 1
+                self.__total_wait_ms += wait_ms
+                self.__max_wait_ms = max(self.__max_wait_ms, wait_ms)
+            await asyncio.sleep(wait_seconds)
+
+        self.__wait_histogram.record(wait_ms, {'deployment': self.name})
+        return wait_ms
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Adjusts the token bucket with the difference between the estimated and the actual token usage of a call.
+
+        Parameters
+        ----------
+        estimated_tokens : int
+            The number of tokens reserved for the call.
+        actual_tokens : int
+            The number of tokens used by the call.
+        """
+        with self.__lock:
+            self.__actual_tokens += actual_tokens
+            if self.tokens_per_minute:
+                self.__refill()
+                self.__available_tokens = min(
+                    self.__available_tokens + estimated_tokens - actual_tokens,
+                    self.__token_capacity)
+
+    def release(self, estimated_tokens: int, throttled: bool = False, dispatched: bool = True):
+        """
+        Returns the token reservation of a call that failed or was cancelled.
+        When the deployment throttled the call, the buckets are emptied so the queued calls back off.
+
+        Parameters
+        ----------
+        estimated_tokens : int
+            The number of tokens reserved for the call.
+        throttled : bool
+            True if the deployment rejected the call because of its rate limits.
+        dispatched : bool
+            False if the call was cancelled before it was sent to the deployment,
+            in which case its request reservation is returned as well.
+        """
+        with self.__lock:
+            self.__refill()
+            if throttled:
+                self.__throttled_requests += 1
+                self.__available_requests = min(self.__available_requests, 0)
+                self.__available_tokens = min(self.__available_tokens, 0)
+                return
+            if self.requests_per_minute and not dispatched:
+                self.__available_requests = min(self.__available_requests + 1, self.__request_capacity)
+            if self.tokens_per_minute:
+                self.__available_tokens = min(self.__available_tokens + estimated_tokens, self.__token_capacity)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the statistics of the rate limiter.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the limits, the available capacity, the number of requests,
+            the number of queued and throttled requests, the wait times, and the estimated and actual token usage.
+        """
+        with self.__lock:
+            self.__refill()
+            return {
+                'requests_per_minute': self.requests_per_minute,
+                'tokens_per_minute': self.tokens_per_minute,
+                'available_requests': round(self.__available_requests, 3),
+                'available_tokens': round(self.__available_tokens, 3),
+                'requests': self.__requests,
+                'queued_requests': self.__queued_requests,
+                'throttled_requests': self.__throttled_requests,
+                'total_wait_ms': round(self.__total_wait_ms, 3),
+                'max_wait_ms': round(self.__max_wait_ms, 3),
+                'estimated_tokens': self.__estimated_tokens,
+                'actual_tokens': self.__actual_tokens
+            }
+
+    def __set_limits(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.__request_capacity = max((requests_per_minute or 0) * BURST_SECONDS / 60, 1)
+        self.__token_capacity = (tokens_per_minute or 0) * BURST_SECONDS / 60
+
+    def __refill(self):
+        """
+        Adds the capacity accumulated since the last refill to the buckets. Must be called under the lock.
+        """
+        now = time.monotonic()
+        elapsed_seconds = now - self.__last_refill
+        self.__last_refill = now
+        if self.requests_per_minute:
+            self.__available_requests = min(
+                self.__available_requests + elapsed_seconds * self.requests_per_minute / 60,
+                self.__request_capacity)
+        if self.tokens_per_minute:
+            self.__available_tokens = min(
+                self.__available_tokens + elapsed_seconds * self.tokens_per_minute / 60,
+                self.__token_capacity)
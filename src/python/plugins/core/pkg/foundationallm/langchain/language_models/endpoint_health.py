@@ -0,0 +1,313 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from foundationallm.telemetry import Telemetry
+
+# The weight of the latest observation in the exponentially weighted moving averages.
+EWMA_ALPHA = 0.2
+# The latency, in milliseconds, added to the score of an endpoint that always fails.
+ERROR_PENALTY_MS = 10000
+# The number of seconds after which the error rate of an endpoint that is not called anymore is halved.
+ERROR_RATE_HALF_LIFE_SECONDS = 60
+# The number of seconds an endpoint is avoided after throttling a call or failing with a server error,
+# when the response does not specify a Retry-After header.
+DEFAULT_COOLDOWN_SECONDS = 10
+# The number of recent successful call latencies kept to compute the latency percentiles.
+LATENCY_WINDOW_SIZE = 200
+# The minimum number of successful call latencies required to compute the latency percentiles.
+LATENCY_PERCENTILE_MIN_SAMPLES = 20
+
+class EndpointHealth():
+    """
+    Tracks the latency and error rate of a deployment on an API endpoint, as exponentially weighted moving averages (EWMA),
+    to route the language model calls to the healthiest endpoint of a pool.
+
+    The health is tracked per deployment, as Azure OpenAI throttles each deployment separately
+    and the latencies of different models are not comparable.
+
+    The error rate decays while the endpoint is not called, so an endpoint that failed
+    is tried again once it has recovered. Endpoints that throttled a call or failed with
+    a server error are avoided until their cooldown expires.
+    """
+
+    __endpoints: Dict[str, 'EndpointHealth'] = {}
+    __endpoints_lock = threading.Lock()
+
+    def __init__(self, endpoint_object_id: str, deployment_name: Optional[str] = None):
+        """
+        Initializes the endpoint health.
+
+        Parameters
+        ----------
+        endpoint_object_id : str
+            The object ID of the API endpoint configuration.
+        deployment_name : str
+            The name of the deployment called on the API endpoint, if any.
+        """
+        self.endpoint_object_id = endpoint_object_id
+        self.deployment_name = deployment_name
+        self.name = EndpointHealth.get_name(endpoint_object_id, deployment_name)
+        self.__metric_attributes = {'endpoint': endpoint_object_id}
+        if deployment_name:
+            self.__metric_attributes['deployment'] = deployment_name
+        self.__lock = threading.Lock()
+        self.__latency_ms: Optional[float] = None
+        self.__error_rate = 0.0
+        self.__error_rate_updated_at = time.monotonic()
+        self.__cooldown_until = 0.0
+        self.__requests = 0
+        self.__failures = 0
+        self.__throttled_requests = 0
+        self.__hedged_requests = 0
+        self.__hedge_wins = 0
+        self.__latencies = deque(maxlen=LATENCY_WINDOW_SIZE)
+
+        meter = Telemetry.get_meter(__name__)
+        self.__latency_histogram = meter.create_histogram(
+            'foundationallm.language_models.endpoint_latency',
+            unit='ms',
+            description='The latency of the language model calls, per API endpoint, deployment, and outcome.')
+        self.__hedged_requests_counter = meter.create_counter(
+            'foundationallm.language_models.hedged_requests',
+            description='The number of language model calls duplicated because they were slower than the hedging percentile.')
+        self.__hedge_wins_counter = meter.create_counter(
+            'foundationallm.language_models.hedge_wins',
+            description='The number of hedged language model calls that completed before the calls they duplicated.')
+
+    @staticmethod
+    def get_name(endpoint_object_id: str, deployment_name: Optional[str] = None) -> str:
+        """
+        Builds the name identifying the health of a deployment on an API endpoint.
+
+        Parameters
+        ----------
+        endpoint_object_id : str
+            The object ID of the API endpoint configuration.
+        deployment_name : str
+            The name of the deployment called on the API endpoint, if any.
+
+        Returns
+        -------
+        str
+            The name of the endpoint health.
+        """
+        return f'{endpoint_object_id}|{deployment_name}' if deployment_name else endpoint_object_id
+
+    @staticmethod
+    def get_or_create(endpoint_object_id: str, deployment_name: Optional[str] = None) -> 'EndpointHealth':
+        """
+        Retrieves the process-wide health of a deployment on an API endpoint, creating it if needed.
+
+        Parameters
+        ----------
+        endpoint_object_id : str
+            The object ID of the API endpoint configuration.
+        deployment_name : str
+            The name of the deployment called on the API endpoint, if any.
+
+        Returns
+        -------
+        EndpointHealth
+            The health of the deployment on the API endpoint.
+        """
+        name = EndpointHealth.get_name(endpoint_object_id, deployment_name)
+        with EndpointHealth.__endpoints_lock:
+            endpoint = EndpointHealth.__endpoints.get(name)
+            if endpoint is None:
+                endpoint = EndpointHealth(endpoint_object_id, deployment_name)
+                EndpointHealth.__endpoints[name] = endpoint
+            return endpoint
+
+    @staticmethod
+    def get_routing_order(endpoint_object_ids: List[str], deployment_name: Optional[str] = None) -> List[str]:
+        """
+        Sorts API endpoints from the healthiest to the least healthy for a deployment.
+        Endpoints in cooldown come last, the ones whose cooldown expires first coming first.
+
+        Parameters
+        ----------
+        endpoint_object_ids : List[str]
+            The object IDs of the API endpoint configurations.
+        deployment_name : str
+            The name of the deployment called on the API endpoints, if any.
+
+        Returns
+        -------
+        List[str]
+            The object IDs of the API endpoint configurations, in the order they should be called.
+        """
+        now = time.monotonic()
+        endpoints = [
+            EndpointHealth.get_or_create(endpoint_object_id, deployment_name)
+            for endpoint_object_id in endpoint_object_ids
+        ]
+        return [
+            endpoint.endpoint_object_id
+            for endpoint in sorted(
+                endpoints,
+                key=lambda endpoint: (1, endpoint.__cooldown_until) if endpoint.__cooldown_until > now \
+                    else (0, endpoint.get_score()))
+        ]
+
+    @staticmethod
+    def get_all_stats() -> dict:
+        """
+        Retrieves the health statistics of all the deployments on the API endpoints.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the statistics of each deployment on an API endpoint,
+            indexed by endpoint object ID and deployment name.
+        """
+        with EndpointHealth.__endpoints_lock:
+            endpoints = list(EndpointHealth.__endpoints.values())
+        return {endpoint.name: endpoint.get_stats() for endpoint in endpoints}
+
+    def get_score(self) -> float:
+        """
+        Computes the routing score of the endpoint. Lower is better.
+        Endpoints that were never called have the best score, so they are sampled.
+
+        Returns
+        -------
+        float
+            The latency EWMA, in milliseconds, penalized by the error rate EWMA.
+        """
+        with self.__lock:
+            return (self.__latency_ms or 0.0) + self.__get_error_rate() * ERROR_PENALTY_MS
+
+    def record_success(self, latency_ms: float):
+        """
+        Records a successful call to the endpoint.
+
+        Parameters
+        ----------
+        latency_ms : float
+            The latency of the call, in milliseconds.
+        """
+        with self.__lock:
+            self.__requests += 1
+            self.__latencies.append(latency_ms)
+            self.__update_latency(latency_ms)
+            self.__update_error_rate(0.0)
+        self.__latency_histogram.record(
+            latency_ms, {**self.__metric_attributes, 'outcome': 'success'})
+
+    def record_failure(
+        self,
+        latency_ms: float,
+        status_code: Optional[int] = None,
+        retry_after_seconds: Optional[float] = None):
+        """
+        Records a failed call to the endpoint and puts the endpoint in cooldown.
+
+        Parameters
+        ----------
+        latency_ms : float
+            The time, in milliseconds, until the call failed.
+        status_code : int
+            The HTTP status code of the response, if any.
+        retry_after_seconds : float
+            The number of seconds the endpoint asked the client to wait, if any.
+        """
+        with self.__lock:
+            self.__requests += 1
+            self.__failures += 1
+            if status_code == 429:
+                self.__throttled_requests += 1
+            if self.__latency_ms is None:
+                self.__latency_ms = latency_ms
+            self.__update_error_rate(1.0)
+            self.__cooldown_until = max(
+                self.__cooldown_until,
+                time.monotonic() + (retry_after_seconds or DEFAULT_COOLDOWN_SECONDS))
+        self.__latency_histogram.record(
+            latency_ms, {**self.__metric_attributes, 'outcome': 'throttled' if status_code == 429 else 'failure'})
+
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Computes a percentile of the latency of the recent successful calls to the endpoint.
+
+        Parameters
+        ----------
+        percentile : float
+            The percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The latency percentile, in milliseconds, or None if there are not enough recent calls.
+        """
+        with self.__lock:
+            if len(self.__latencies) < LATENCY_PERCENTILE_MIN_SAMPLES:
+                return None
+            latencies = sorted(self.__latencies)
+        index = min(math.ceil(percentile / 100 * len(latencies)) - 1, len(latencies) - 1)
+        return latencies[max(index, 0)]
+
+    def try_acquire_hedge(self, max_hedge_rate: float) -> bool:
+        """
+        Records a hedged request (a duplicate of a slow call) if the hedge rate of the endpoint allows it.
+
+        Parameters
+        ----------
+        max_hedge_rate : float
+            The maximum ratio of hedged requests to requests.
+
+        Returns
+        -------
+        bool
+            True if the request can be hedged, False otherwise.
+        """
+        with self.__lock:
+            if self.__hedged_requests + 1 > max_hedge_rate * (self.__requests + 1):
+                return False
+            self.__hedged_requests += 1
+        self.__hedged_requests_counter.add(1, self.__metric_attributes)
+        return True
+
+    def record_hedge_win(self):
+        """
+        Records a hedged request that completed before the call it duplicated.
+        """
+        with self.__lock:
+            self.__hedge_wins += 1
+        self.__hedge_wins_counter.add(1, self.__metric_attributes)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the health statistics of the endpoint.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the latency and error rate EWMAs, the remaining cooldown,
+            the number of requests, failures, and throttled requests, and the number of hedged requests and hedge wins.
+        """
+        with self.__lock:
+            return {
+                'latency_ms': round(self.__latency_ms, 3) if self.__latency_ms is not None else None,
+                'error_rate': round(self.__get_error_rate(), 3),
+                'cooldown_seconds': round(max(self.__cooldown_until - time.monotonic(), 0), 3),
+                'requests': self.__requests,
+                'failures': self.__failures,
+                'throttled_requests': self.__throttled_requests,
+                'hedged_requests': self.__hedged_requests,
+                'hedge_wins': self.__hedge_wins
+            }
+
+    def __get_error_rate(self) -> float:
+        elapsed_seconds = time.monotonic() - self.__error_rate_updated_at
+        return self.__error_rate * 0.5 ** (elapsed_seconds / ERROR_RATE_HALF_LIFE_SECONDS)
+
+    def __update_error_rate(self, value: float):
+        self.__error_rate = EWMA_ALPHA * value + (1 - EWMA_ALPHA) * self.__get_error_rate()
+        self.__error_rate_updated_at = time.monotonic()
+
+    def __update_latency(self, latency_ms: float):
+        self.__latency_ms = latency_ms if self.__latency_ms is None \
+            else EWMA_ALPHA * latency_ms + (1 - EWMA_ALPHA) * self.__latency_ms
@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_LANGUAGE_MODEL_CACHE_MAX_SIZE
+)
+
+DEFAULT_MAX_SIZE = 64
+
+class LanguageModelClientCache():
+    """
+    Caches the language model clients created by the LanguageModelFactory.
+
+    Each client owns an HTTP connection pool, so reusing the clients across requests
+    (and across the workflow and tools of a single request) reuses their connections.
+    The least recently used clients are evicted once the cache is full.
+    """
+
+    __default: Optional['LanguageModelClientCache'] = None
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initializes the language model client cache.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of cached clients.
+        """
+        self.max_size = max_size
+        self.__clients: OrderedDict[str, Any] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @staticmethod
+    def get_default() -> 'LanguageModelClientCache':
+        """
+        Retrieves the process-wide language model client cache, creating it from the environment variables if needed.
+
+        Returns
+        -------
+        LanguageModelClientCache
+            The process-wide language model client cache.
+        """
+        if LanguageModelClientCache.__default is None:
+            LanguageModelClientCache.__default = LanguageModelClientCache(
+                max_size=int(os.getenv(FOUNDATIONALLM_LANGUAGE_MODEL_CACHE_MAX_SIZE, DEFAULT_MAX_SIZE)))
+        return LanguageModelClientCache.__default
+
+    def get_or_create(self, key: str, create_client: Callable[[], Any]) -> Any:
+        """
+        Retrieves the client cached with the specified key, creating and caching it if needed.
+
+        Parameters
+        ----------
+        key : str
+            The key identifying the client settings.
+        create_client : Callable[[], Any]
+            The function creating the client.
+
+        Returns
+        -------
+        Any
+            The cached client.
+        """
+        with self.__lock:
+            client = self.__clients.get(key)
+            if client is not None:
+                self.__clients.move_to_end(key)
+                self.__hits += 1
+                return client
+            self.__misses += 1
+
+        client = create_client()
+
+        with self.__lock:
+            # Another request may have created the same client in the meantime.
+            cached_client = self.__clients.setdefault(key, client)
+            self.__clients.move_to_end(key)
+            while len(self.__clients) > self.max_size:
+                self.__clients.popitem(last=False)
+                self.__evictions += 1
+            return cached_client
+
+    def clear(self):
+        """
+        Removes all the cached clients.
+        """
+        with self.__lock:
+            self.__clients.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the cache size, hits, misses, and evictions.
+        """
+        lookups = self.__hits + self.__misses
+        return {
+            'size': len(self.__clients),
+            'max_size': self.max_size,
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'evictions': self.__evictions,
+            'hit_ratio': round(self.__hits / lookups, 3) if lookups else 0.0
+        }
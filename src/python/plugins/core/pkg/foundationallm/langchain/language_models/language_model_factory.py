@@ -1,26 +1,48 @@
-import boto3
-import botocore
+import hashlib
 import json
+from functools import partial
 from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-from databricks_langchain import ChatDatabricks
-from databricks.sdk import WorkspaceClient
-from google.oauth2 import service_account
-from langchain_azure_ai.chat_models import AzureAIChatCompletionsModel
-from langchain_core.language_models import BaseLanguageModel
-from langchain_aws import ChatBedrockConverse
-from langchain_google_genai import ChatGoogleGenerativeAI
+from azure.identity import get_bearer_token_provider
+from langchain_core.language_models import BaseChatModel, BaseLanguageModel
 from langchain_openai import AzureChatOpenAI, ChatOpenAI, OpenAI
 from openai import AsyncAzureOpenAI as async_aoi
 
 from foundationallm.config import Configuration
 from foundationallm.langchain.exceptions import LangChainException
 from foundationallm.models.authentication import AuthenticationTypes
+from foundationallm.models.constants import AIModelParameterNames
 from foundationallm.models.language_models import LanguageModelProvider
 from foundationallm.models.operations import OperationTypes
 from foundationallm.models.resource_providers.ai_models import AIModelBase
 from foundationallm.models.resource_providers.configuration import APIEndpointConfiguration
-from foundationallm.utils import ObjectUtils
+from foundationallm.utils import AzureCredentialRegistry, ObjectUtils
+
+from .aws_sts_credential_cache import AwsStsCredentialCache
+from .deployment_rate_limiter import DeploymentRateLimiter
+from .language_model_client_cache import LanguageModelClientCache
+from .rate_limiting_callback_handler import RateLimitingCallbackHandler
+from .routed_chat_model import RoutedChatModel
+
+# NOTE: The SDKs of the AzureAI, Bedrock, VertexAI, and Databricks providers are imported
+# by the provider branches of the factory, the first time a model of the provider is created.
+# This keeps their import time and memory out of the workers that never use these providers.
+
+# The authentication parameters holding the names of the configuration settings with secrets.
+SECRET_AUTHENTICATION_PARAMETERS = [
+    'api_key_configuration_name',
+    'access_key',
+    'secret_key',
+    'client_secret',
+    'service_account_credentials'
+]
+
+# The number of times the OpenAI clients of a pool of endpoints retry a call themselves.
+# The SDK retries throttled calls after waiting for their Retry-After delay (up to 60 seconds),
+# so the RoutedChatModel owns the retries and fails over to another endpoint instead.
+ROUTED_MAX_RETRIES = 0
+# The number of times the OpenAI client of a single hedged endpoint retries a call itself,
+# as the RoutedChatModel has no other endpoint to fail over to.
+HEDGED_MAX_RETRIES = 1
 
 class LanguageModelFactory:
 
@@ -38,6 +60,14 @@ class LanguageModelFactory:
         """
         Create a language model using the specified endpoint settings.
 
+        Language models are cached by endpoint, deployment, authentication, and model parameters,
+        so their HTTP connection pools are reused. Language models using a custom HTTP client are not cached.
+        When the AI model is served by a pool of endpoints (endpoint_object_ids), chat models route
+        each call to the healthiest endpoint of the pool and fail over to the other endpoints,
+        their OpenAI clients leaving the retries of the throttled calls to the routed model.
+        When the hedging_percentile model parameter is set, chat models hedge the calls slower than
+        the percentile, for at most hedging_max_rate of the calls (see RoutedChatModel).
+
         override_operation_type : OperationTypes - internally override the operation type for the API endpoint.
 
         Returns
@@ -45,23 +75,150 @@ class LanguageModelFactory:
         BaseLanguageModel
             Returns an API connector for a chat completion model.
         """
-        language_model:BaseLanguageModel = None
-        api_key = None
-
         ai_model = ObjectUtils.get_object_by_id(ai_model_object_id, self.objects, AIModelBase)
         if ai_model is None:
             raise LangChainException("AI model configuration settings are missing.", 400)
 
-        api_endpoint = ObjectUtils.get_object_by_id(ai_model.endpoint_object_id, self.objects, APIEndpointConfiguration)
-        if api_endpoint is None:
-            raise LangChainException("API endpoint configuration settings are missing.", 400)
+        endpoint_object_ids = [ai_model.endpoint_object_id]
+        for endpoint_object_id in ai_model.endpoint_object_ids or []:
+            if endpoint_object_id not in endpoint_object_ids:
+                endpoint_object_ids.append(endpoint_object_id)
+
+        model_parameters = ai_model.model_parameters or {}
+        hedging_percentile = model_parameters.get(AIModelParameterNames.HEDGING_PERCENTILE)
+
+        # The clients of routed chat models leave the retries to the RoutedChatModel.
+        max_retries = None
+        if len(endpoint_object_ids) > 1:
+            max_retries = ROUTED_MAX_RETRIES
+        elif hedging_percentile:
+            max_retries = HEDGED_MAX_RETRIES
+
+        endpoint_language_models = {}
+        for endpoint_object_id in endpoint_object_ids:
+            api_endpoint = ObjectUtils.get_object_by_id(endpoint_object_id, self.objects, APIEndpointConfiguration)
+            if api_endpoint is None:
+                raise LangChainException("API endpoint configuration settings are missing.", 400)
+
+            endpoint_language_models[endpoint_object_id] = self.__get_endpoint_language_model(
+                ai_model,
+                api_endpoint,
+                override_operation_type,
+                agent_model_parameter_overrides,
+                http_async_client,
+                max_retries)
+
+        # Only chat models can be routed, the other clients use the primary endpoint.
+        if (len(endpoint_language_models) == 1 and not hedging_percentile) \
+            or not all(isinstance(language_model, BaseChatModel) for language_model in endpoint_language_models.values()):
+            return endpoint_language_models[ai_model.endpoint_object_id]
+
+        hedging_parameters = {}
+        try:
+            if hedging_percentile:
+                hedging_parameters['hedging_percentile'] = float(hedging_percentile)
+            if AIModelParameterNames.HEDGING_MAX_RATE in model_parameters:
+                hedging_parameters['hedging_max_rate'] = float(model_parameters[AIModelParameterNames.HEDGING_MAX_RATE])
+        except ValueError as e:
+            raise LangChainException(f"Invalid hedging parameters for the AI model {ai_model.name}: {str(e)}", 400)
+
+        return RoutedChatModel(
+            endpoint_models=endpoint_language_models,
+            deployment_name=ai_model.deployment_name,
+            **hedging_parameters)
+
+    def __get_endpoint_language_model(
+        self,
+        ai_model: AIModelBase,
+        api_endpoint: APIEndpointConfiguration,
+        override_operation_type: OperationTypes,
+        agent_model_parameter_overrides: dict,
+        http_async_client,
+        max_retries: int = None
+    ) -> BaseLanguageModel:
+        """
+        Retrieves the language model for an endpoint from the cache, creating it if needed.
+        """
+        create_language_model = partial(
+            self.__create_language_model,
+            ai_model,
+            api_endpoint,
+            override_operation_type,
+            agent_model_parameter_overrides,
+            http_async_client,
+            max_retries)
+
+        if http_async_client is not None:
+            return create_language_model()
+
+        return LanguageModelClientCache.get_default().get_or_create(
+            self.__get_cache_key(ai_model, api_endpoint, override_operation_type, agent_model_parameter_overrides, max_retries),
+            create_language_model)
+
+    def __get_cache_key(
+        self,
+        ai_model: AIModelBase,
+        api_endpoint: APIEndpointConfiguration,
+        override_operation_type: OperationTypes,
+        agent_model_parameter_overrides: dict,
+        max_retries: int = None
+    ) -> str:
+        """
+        Builds the key identifying the settings of a language model in the cache.
+        The secrets are included as a hash, so a rotated secret creates a new language model.
+        """
+        secrets_hash = hashlib.sha256()
+        for parameter_name in SECRET_AUTHENTICATION_PARAMETERS:
+            secret_name = api_endpoint.authentication_parameters.get(parameter_name)
+            if secret_name is not None:
+                try:
+                    secrets_hash.update(str(self.config.get_value(secret_name)).encode('utf-8'))
+                except Exception:
+                    # The missing secret is reported when the language model is created.
+                    pass
+
+        return json.dumps({
+            'provider': api_endpoint.provider,
+            'endpoint': api_endpoint.object_id,
+            'endpoint_properties': api_endpoint.properties,
+            'url': api_endpoint.url,
+            'api_version': api_endpoint.api_version,
+            'timeout_seconds': api_endpoint.timeout_seconds,
+            'operation_type': override_operation_type or api_endpoint.operation_type,
+            'authentication_type': api_endpoint.authentication_type,
+            'authentication_parameters': api_endpoint.authentication_parameters,
+            'secrets': secrets_hash.hexdigest(),
+            'deployment_name': ai_model.deployment_name,
+            'model_parameters': ai_model.model_parameters,
+            'model_parameter_overrides': agent_model_parameter_overrides,
+            'max_retries': max_retries
+        }, sort_keys=True, default=str)
+
+    def __create_language_model(
+        self,
+        ai_model: AIModelBase,
+        api_endpoint: APIEndpointConfiguration,
+        override_operation_type: OperationTypes,
+        agent_model_parameter_overrides: dict,
+        http_async_client,
+        max_retries: int = None
+    ) -> BaseLanguageModel:
+        """
+        Creates a language model using the specified endpoint settings.
+        When max_retries is specified, the OpenAI chat clients retry the failed calls at most max_retries times.
+        """
+        language_model:BaseLanguageModel = None
+        api_key = None
+        retry_parameters = {'max_retries': max_retries} if max_retries is not None else {}
 
         match api_endpoint.provider:
             case LanguageModelProvider.AZUREAI:
+                from langchain_azure_ai.chat_models import AzureAIChatCompletionsModel
+
                 if api_endpoint.authentication_type == AuthenticationTypes.AZURE_IDENTITY:
                     try:
                         scope = api_endpoint.authentication_parameters.get('scope', 'https://cognitiveservices.azure.com/.default')
-                        credential = DefaultAzureCredential(exclude_environment_credential=True)
+                        credential = AzureCredentialRegistry.get_credential()
                         language_model = AzureAIChatCompletionsModel(
                             endpoint=api_endpoint.url,
                             credential=credential,
@@ -104,7 +261,7 @@ class LanguageModelFactory:
                         scope = api_endpoint.authentication_parameters.get('scope', 'https://cognitiveservices.azure.com/.default')
                         # Set up a Azure AD token provider.
                         token_provider = get_bearer_token_provider(
-                            DefaultAzureCredential(exclude_environment_credential=True),
+                            AzureCredentialRegistry.get_credential(),
                             scope
                         )
 
@@ -116,7 +273,8 @@ class LanguageModelFactory:
                                 azure_ad_token_provider=token_provider,
                                 azure_deployment=ai_model.deployment_name,
                                 request_timeout=api_endpoint.timeout_seconds,
-                                http_async_client=http_async_client
+                                http_async_client=http_async_client,
+                                **retry_parameters
                             )
                         elif op_type == OperationTypes.ASSISTANTS_API or op_type == OperationTypes.IMAGE_SERVICES:
                             # Assistants API clients can't have deployment as that is assigned at the assistant level.
@@ -147,7 +305,8 @@ class LanguageModelFactory:
                             api_version=api_endpoint.api_version,
                             azure_deployment=ai_model.deployment_name,
                             request_timeout=api_endpoint.timeout_seconds,
-                            http_async_client=http_async_client
+                            http_async_client=http_async_client,
+                            **retry_parameters
                         )
                     elif op_type == OperationTypes.ASSISTANTS_API or op_type == OperationTypes.IMAGE_SERVICES:
                         # Assistants API clients can't have deployment as that is assigned at the assistant level.
@@ -169,11 +328,14 @@ class LanguageModelFactory:
                     raise LangChainException("API key is missing from the configuration settings.", 400)
 
                 language_model = (
-                    ChatOpenAI(base_url=api_endpoint.url, api_key=api_key, request_timeout=api_endpoint.timeout_seconds)
+                    ChatOpenAI(base_url=api_endpoint.url, api_key=api_key, request_timeout=api_endpoint.timeout_seconds, **retry_parameters)
                     if api_endpoint.operation_type == OperationTypes.CHAT
                     else OpenAI(base_url=api_endpoint.url, api_key=api_key, request_timeout=api_endpoint.timeout_seconds)
                 )
             case LanguageModelProvider.BEDROCK:
+                import botocore.config
+                from langchain_aws import ChatBedrockConverse
+
                 boto3_config = botocore.config.Config(connect_timeout=60, read_timeout=api_endpoint.timeout_seconds)
 
                 if api_endpoint.authentication_type == AuthenticationTypes.AZURE_IDENTITY:
@@ -194,27 +356,16 @@ class LanguageModelFactory:
                     if role_arn is None:
                         raise LangChainException("Role ARN is missing from the configuration settings.", 400)
 
-                    # Get Azure token for designated scope.
-                    az_creds = DefaultAzureCredential(exclude_environment_credential=True)
-                    azure_token = az_creds.get_token(scope)
-
-                    # Get AWS STS credentials using Azure token.
-                    sts_client = boto3.client('sts')
-                    sts_response = sts_client.assume_role_with_web_identity(
-                        RoleArn=role_arn,
-                        RoleSessionName='assume-role',
-                        WebIdentityToken=azure_token.token
-                    )
-                    creds = sts_response['Credentials']
-
                     # parse region from the URL, ex: https://bedrock-runtime.us-east-1.amazonaws.com/
                     region = api_endpoint.url.split('.')[1]
+
+                    # The AWS STS credentials, obtained using an Azure token for the designated scope,
+                    # are retrieved from the cache when the client sends its requests.
+                    boto3_session = AwsStsCredentialCache.get_default().get_boto3_session(role_arn, scope, region)
                     language_model = ChatBedrockConverse(
                         model= ai_model.deployment_name,
                         region_name = region,
-                        aws_access_key_id = creds["AccessKeyId"],
-                        aws_secret_access_key = creds["SecretAccessKey"],
-                        aws_session_token= creds["SessionToken"],
+                        client = boto3_session.client('bedrock-runtime', config=boto3_config),
                         config=boto3_config
                     )
                 else: # Key-based authentication
@@ -244,6 +395,9 @@ class LanguageModelFactory:
                         config=boto3_config
                     )
             case LanguageModelProvider.VERTEXAI:
+                from google.oauth2 import service_account
+                from langchain_google_genai import ChatGoogleGenerativeAI
+
                 # Only supports service account authentication via JSON credentials stored in key vault.
                 # Uses the authentication parameter: service_account_credentials to get the application configuration key for this value.
                 try:
@@ -268,7 +422,9 @@ class LanguageModelFactory:
                     vertexai=True
                 )
             case LanguageModelProvider.DATABRICKS:
-                    
+                from databricks.sdk import WorkspaceClient
+                from databricks_langchain import ChatDatabricks
+
                 workspace_client = WorkspaceClient(
                     host=api_endpoint.url,
                     client_id=api_endpoint.authentication_parameters.get('client_id'),
@@ -292,4 +448,37 @@ class LanguageModelFactory:
                 if hasattr(language_model, key):
                     setattr(language_model, key, value)
 
+        # Hold the calls until the rate limits of the deployment allow them.
+        rate_limiter = self.__get_rate_limiter(ai_model, api_endpoint)
+        if rate_limiter is not None and isinstance(language_model, BaseLanguageModel):
+            language_model.callbacks = [*(language_model.callbacks or []), RateLimitingCallbackHandler(rate_limiter)]
+
         return language_model
+
+    def __get_rate_limiter(
+        self,
+        ai_model: AIModelBase,
+        api_endpoint: APIEndpointConfiguration
+    ) -> DeploymentRateLimiter | None:
+        """
+        Retrieves the rate limiter of the deployment used by the AI model, if its requests per minute
+        or tokens per minute limits are defined by the model parameters or, by default, by the endpoint properties.
+        """
+        model_parameters = ai_model.model_parameters or {}
+        endpoint_properties = api_endpoint.properties or {}
+        requests_per_minute = model_parameters.get(
+            AIModelParameterNames.REQUESTS_PER_MINUTE,
+            endpoint_properties.get(AIModelParameterNames.REQUESTS_PER_MINUTE))
+        tokens_per_minute = model_parameters.get(
+            AIModelParameterNames.TOKENS_PER_MINUTE,
+            endpoint_properties.get(AIModelParameterNames.TOKENS_PER_MINUTE))
+        if not requests_per_minute and not tokens_per_minute:
+            return None
+
+        try:
+            return DeploymentRateLimiter.get_or_create(
+                f'{api_endpoint.url}|{ai_model.deployment_name}',
+                int(requests_per_minute) if requests_per_minute else None,
+                int(tokens_per_minute) if tokens_per_minute else None)
+        except ValueError as e:
+            raise LangChainException(f"Invalid rate limits for the AI model {ai_model.name}: {str(e)}", 400)
@@ -0,0 +1,169 @@
+import json
+import math
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from .deployment_rate_limiter import DeploymentRateLimiter
+
+# The average number of characters per token, used to estimate the prompt tokens before dispatching a call.
+CHARACTERS_PER_TOKEN = 4
+# The estimated number of tokens of an image (or another non-text attachment) embedded in a message.
+# The base64 payload of the attachment is not representative of the tokens the model bills for it.
+TOKENS_PER_IMAGE = 1000
+# The estimated number of tokens of an audio clip embedded in a message.
+TOKENS_PER_AUDIO = 2000
+
+class RateLimitingCallbackHandler(AsyncCallbackHandler):
+    """
+    Callback handler holding the language model calls until the rate limiter of the deployment accepts them.
+
+    The handler estimates the tokens of a call from its prompt, its bound tools, and its maximum completion tokens
+    before the call is dispatched, and reconciles the estimate with the token usage reported by the model.
+    """
+
+    # Run before the other handlers, so the call is held before anything else is recorded.
+    run_inline: bool = True
+
+    def __init__(self, rate_limiter: DeploymentRateLimiter):
+        """
+        Initializes the rate limiting callback handler.
+
+        Parameters
+        ----------
+        rate_limiter : DeploymentRateLimiter
+            The rate limiter of the deployment used by the language model.
+        """
+        self.rate_limiter = rate_limiter
+        self.__estimated_tokens: Dict[UUID, int] = {}
+
+    async def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any) -> None:
+        """
+        Waits for the rate limiter before a chat model call is dispatched.
+        """
+        prompt_tokens = sum(
+            self.__estimate_message_tokens(message)
+            for message_list in messages
+            for message in message_list)
+        await self.__acquire_async(run_id, prompt_tokens, kwargs.get('invocation_params'))
+
+    async def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        **kwargs: Any) -> None:
+        """
+        Waits for the rate limiter before a completion model call is dispatched.
+        """
+        prompt_tokens = math.ceil(sum(len(prompt) for prompt in prompts) / CHARACTERS_PER_TOKEN)
+        await self.__acquire_async(run_id, prompt_tokens, kwargs.get('invocation_params'))
+
+    async def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        **kwargs: Any) -> None:
+        """
+        Reconciles the estimated tokens of a call with its actual token usage.
+        """
+        estimated_tokens = self.__estimated_tokens.pop(run_id, None)
+        if estimated_tokens is None:
+            return
+
+        actual_tokens = self.__get_total_tokens(response)
+        if actual_tokens is not None:
+            self.rate_limiter.reconcile(estimated_tokens, actual_tokens)
+
+    async def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        **kwargs: Any) -> None:
+        """
+        Returns the reservation of a failed call to the rate limiter.
+        """
+        estimated_tokens = self.__estimated_tokens.pop(run_id, None)
+        if estimated_tokens is None:
+            return
+
+        self.rate_limiter.release(
+            estimated_tokens,
+            throttled=getattr(error, 'status_code', None) == 429)
+
+    async def __acquire_async(self, run_id: UUID, prompt_tokens: int, invocation_params: Optional[dict]):
+        invocation_params = invocation_params or {}
+        max_completion_tokens = invocation_params.get('max_completion_tokens') \
+            or invocation_params.get('max_tokens') \
+            or 0
+        # The schemas of the tools bound to the model are sent with every call.
+        tool_tokens = math.ceil(len(json.dumps(invocation_params['tools'], default=str)) / CHARACTERS_PER_TOKEN) \
+            if invocation_params.get('tools') else 0
+
+        # A reservation larger than the bucket capacity would block the deployment until the whole bucket refills.
+        estimated_tokens = self.rate_limiter.cap_token_reservation(
+            prompt_tokens + tool_tokens + max_completion_tokens)
+
+        self.__estimated_tokens[run_id] = estimated_tokens
+        try:
+            await self.rate_limiter.acquire_async(estimated_tokens)
+        except BaseException:
+            # A call cancelled while it waits is never dispatched, and never reaches on_llm_error.
+            self.__estimated_tokens.pop(run_id, None)
+            self.rate_limiter.release(estimated_tokens, dispatched=False)
+            raise
+
+    def __estimate_message_tokens(self, message: BaseMessage) -> int:
+        """
+        Estimates the tokens of a message from its text, counting a fixed number of tokens
+        for each image or audio block instead of the length of its base64 payload.
+        """
+        content = message.content if isinstance(message.content, list) else [message.content]
+        characters = 0
+        media_tokens = 0
+        for block in content:
+            if isinstance(block, str):
+                characters += len(block)
+            elif not isinstance(block, dict):
+                continue
+            elif block.get('type') == 'text':
+                characters += len(block.get('text') or '')
+            elif block.get('type') in ('audio', 'input_audio') \
+                or str(block.get('mime_type', '')).startswith('audio/'):
+                media_tokens += TOKENS_PER_AUDIO
+            else:
+                media_tokens += TOKENS_PER_IMAGE
+
+        tool_calls = getattr(message, 'tool_calls', None)
+        if tool_calls:
+            characters += len(json.dumps(tool_calls, default=str))
+
+        return math.ceil(characters / CHARACTERS_PER_TOKEN) + media_tokens
+
+    def __get_total_tokens(self, response: LLMResult) -> Optional[int]:
+        """
+        Retrieves the total token usage of a call, from the usage metadata of the messages or from the LLM output.
+        """
+        total_tokens = None
+        for generations in response.generations:
+            for generation in generations:
+                if isinstance(generation, ChatGeneration) \
+                    and getattr(generation.message, 'usage_metadata', None):
+                    total_tokens = (total_tokens or 0) + generation.message.usage_metadata['total_tokens']
+        if total_tokens is not None:
+            return total_tokens
+
+        token_usage = (response.llm_output or {}).get('token_usage') or {}
+        return token_usage.get('total_tokens')
@@ -0,0 +1,296 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from pydantic import ConfigDict, Field
+
+from foundationallm.telemetry import Telemetry
+
+from .endpoint_health import EndpointHealth
+
+logger = Telemetry.get_logger(__name__)
+
+# The endpoint models do not report their runs to the callbacks of the routed model (only to their own callbacks),
+# otherwise the tokens streamed by the routed model would be reported twice (e.g., by astream_events).
+# An empty list is required: None would inherit the callbacks of the parent runnable.
+ENDPOINT_MODEL_CONFIG = {'callbacks': []}
+
+class RoutedChatModel(BaseChatModel):
+    """
+    Chat model routing each call to the healthiest API endpoint of a pool.
+
+    The endpoints are ranked by their latency and error rate (see EndpointHealth).
+    When an endpoint throttles a call (429), fails with a server error (5xx), or cannot be reached,
+    the call fails over to the next endpoint. Streaming calls fail over only until the first chunk is received.
+    Other errors (e.g., invalid requests) are raised without failing over.
+
+    When hedging is enabled, an asynchronous, non-streamed call that has not completed after the specified
+    latency percentile of its endpoint is duplicated (hedged) to the next endpoint of the pool, or to the same
+    endpoint if the pool has a single endpoint. The first response is kept and the other call is cancelled.
+    The ratio of hedged calls is capped to bound the cost of the duplicate calls.
+    The health of the endpoints is tracked per deployment (see EndpointHealth).
+        endpoint_models: Dict[str, Runnable] - The chat models of the pool, indexed by endpoint object ID.
+        deployment_name: str - The name of the deployment called on the endpoints, identifying their health with the endpoint object IDs.
+        hedging_percentile: float - The latency percentile after which a call is hedged. No hedging if None.
+        hedging_max_rate: float - The maximum ratio of hedged calls to calls, per endpoint.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    endpoint_models: Dict[str, Runnable] = Field(description="The chat models of the pool, indexed by endpoint object ID.")
+    deployment_name: Optional[str] = Field(default=None, description="The name of the deployment called on the endpoints, identifying their health with the endpoint object IDs.")
+    hedging_percentile: Optional[float] = Field(default=None, description="The latency percentile after which a call is hedged. No hedging if None.")
+    hedging_max_rate: float = Field(default=0.1, description="The maximum ratio of hedged calls to calls, per endpoint.")
+
+    @property
+    def _llm_type(self) -> str:
+        return 'foundationallm-routed-chat-model'
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {'endpoints': list(self.endpoint_models.keys()), 'deployment_name': self.deployment_name}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        """
+        Binds the tools to the chat models of all the endpoints of the pool.
+        """
+        return RoutedChatModel(
+            endpoint_models={
+                endpoint_object_id: model.bind_tools(tools, **kwargs)
+                for endpoint_object_id, model in self.endpoint_models.items()
+            },
+            deployment_name=self.deployment_name,
+            hedging_percentile=self.hedging_percentile,
+            hedging_max_rate=self.hedging_max_rate,
+            callbacks=self.callbacks)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any) -> ChatResult:
+        endpoint_object_ids = EndpointHealth.get_routing_order(list(self.endpoint_models.keys()), self.deployment_name)
+        for index, endpoint_object_id in enumerate(endpoint_object_ids):
+            endpoint = EndpointHealth.get_or_create(endpoint_object_id, self.deployment_name)
+            start = time.perf_counter()
+            try:
+                message = self.endpoint_models[endpoint_object_id].invoke(
+                    messages,
+                    config=ENDPOINT_MODEL_CONFIG,
+                    stop=stop,
+                    **kwargs)
+            except Exception as e:
+                self._handle_failure(endpoint, e, start, is_last=index == len(endpoint_object_ids) - 1)
+                continue
+
+            endpoint.record_success((time.perf_counter() - start) * 1000)
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any) -> ChatResult:
+        endpoint_object_ids = EndpointHealth.get_routing_order(list(self.endpoint_models.keys()), self.deployment_name)
+        hedging_delay_ms = EndpointHealth.get_or_create(endpoint_object_ids[0], self.deployment_name) \
+            .get_latency_percentile(self.hedging_percentile) if self.hedging_percentile else None
+
+        if hedging_delay_ms is None:
+            message = await self._ainvoke_with_failover(endpoint_object_ids, messages, stop, **kwargs)
+        else:
+            message = await self._ainvoke_hedged(endpoint_object_ids, hedging_delay_ms, messages, stop, **kwargs)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _ainvoke_with_failover(
+        self,
+        endpoint_object_ids: List[str],
+        messages: List[BaseMessage],
+        stop: Optional[List[str]],
+        **kwargs: Any) -> BaseMessage:
+        """
+        Calls the endpoints in the specified order until one of them succeeds or fails with an error that cannot fail over.
+        """
+        for index, endpoint_object_id in enumerate(endpoint_object_ids):
+            endpoint = EndpointHealth.get_or_create(endpoint_object_id, self.deployment_name)
+            start = time.perf_counter()
+            try:
+                message = await self.endpoint_models[endpoint_object_id].ainvoke(
+                    messages,
+                    config=ENDPOINT_MODEL_CONFIG,
+                    stop=stop,
+                    **kwargs)
+            except Exception as e:
+                self._handle_failure(endpoint, e, start, is_last=index == len(endpoint_object_ids) - 1)
+                continue
+
+            endpoint.record_success((time.perf_counter() - start) * 1000)
+            return message
+
+    async def _ainvoke_hedged(
+        self,
+        endpoint_object_ids: List[str],
+        hedging_delay_ms: float,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]],
+        **kwargs: Any) -> BaseMessage:
+        """
+        Calls the endpoints with failover and, if the call has not completed after the hedging delay,
+        sends a duplicate call to the next endpoint. Returns the first successful response.
+        """
+        endpoint = EndpointHealth.get_or_create(endpoint_object_ids[0], self.deployment_name)
+        # The hedged call fails over to the other endpoints of the pool, if any.
+        hedge_endpoint_object_ids = endpoint_object_ids[1:] or endpoint_object_ids
+
+        primary_task = asyncio.create_task(self._ainvoke_with_failover(endpoint_object_ids, messages, stop, **kwargs))
+        tasks = {primary_task}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging_delay_ms / 1000)
+            if done or not endpoint.try_acquire_hedge(self.hedging_max_rate):
+                return await primary_task
+
+            hedge_task = asyncio.create_task(
+                self._ainvoke_with_failover(hedge_endpoint_object_ids, messages, stop, **kwargs))
+            tasks.add(hedge_task)
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            endpoint.record_hedge_win()
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            # Cancel the slower call (or both calls, if the call itself was cancelled).
+            for task in tasks:
+                task.cancel()
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        endpoint_object_ids = EndpointHealth.get_routing_order(list(self.endpoint_models.keys()), self.deployment_name)
+        for index, endpoint_object_id in enumerate(endpoint_object_ids):
+            endpoint = EndpointHealth.get_or_create(endpoint_object_id, self.deployment_name)
+            start = time.perf_counter()
+            streamed = False
+            try:
+                for chunk in self.endpoint_models[endpoint_object_id].stream(
+                    messages,
+                    config=ENDPOINT_MODEL_CONFIG,
+                    stop=stop,
+                    **kwargs):
+                    streamed = True
+                    yield self._to_generation_chunk(chunk)
+            except Exception as e:
+                if streamed:
+                    endpoint.record_failure((time.perf_counter() - start) * 1000)
+                    raise
+                self._handle_failure(endpoint, e, start, is_last=index == len(endpoint_object_ids) - 1)
+                continue
+
+            endpoint.record_success((time.perf_counter() - start) * 1000)
+            return
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        endpoint_object_ids = EndpointHealth.get_routing_order(list(self.endpoint_models.keys()), self.deployment_name)
+        for index, endpoint_object_id in enumerate(endpoint_object_ids):
+            endpoint = EndpointHealth.get_or_create(endpoint_object_id, self.deployment_name)
+            start = time.perf_counter()
+            streamed = False
+            try:
+                async for chunk in self.endpoint_models[endpoint_object_id].astream(
+                    messages,
+                    config=ENDPOINT_MODEL_CONFIG,
+                    stop=stop,
+                    **kwargs):
+                    streamed = True
+                    yield self._to_generation_chunk(chunk)
+            except Exception as e:
+                if streamed:
+                    endpoint.record_failure((time.perf_counter() - start) * 1000)
+                    raise
+                self._handle_failure(endpoint, e, start, is_last=index == len(endpoint_object_ids) - 1)
+                continue
+
+            endpoint.record_success((time.perf_counter() - start) * 1000)
+            return
+
+    def _to_generation_chunk(self, chunk: BaseMessage) -> ChatGenerationChunk:
+        if not isinstance(chunk, AIMessageChunk):
+            chunk = AIMessageChunk(**chunk.model_dump(exclude={'type'}))
+        return ChatGenerationChunk(message=chunk)
+
+    def _handle_failure(self, endpoint: EndpointHealth, error: Exception, start: float, is_last: bool):
+        """
+        Records the failure of a call to an endpoint, and raises the error
+        if the call cannot fail over to another endpoint.
+        """
+        status_code = RoutedChatModel.get_status_code(error)
+        if not RoutedChatModel.is_retryable(error, status_code):
+            raise error
+
+        endpoint.record_failure(
+            (time.perf_counter() - start) * 1000,
+            status_code,
+            RoutedChatModel.get_retry_after_seconds(error))
+        if is_last:
+            raise error
+
+        logger.warning(
+            f'The call to the deployment {endpoint.deployment_name} of the API endpoint {endpoint.endpoint_object_id} failed '
+            f'with status code {status_code}, failing over to the next endpoint: {error}')
+
+    @staticmethod
+    def get_status_code(error: Exception) -> Optional[int]:
+        """
+        Retrieves the HTTP status code of the response that caused an error, if any.
+        """
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        return status_code if isinstance(status_code, int) else None
+
+    @staticmethod
+    def get_retry_after_seconds(error: Exception) -> Optional[float]:
+        """
+        Retrieves the number of seconds the endpoint asked the client to wait, from the Retry-After header.
+        """
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get('retry-after-ms')) / 1000 if headers.get('retry-after-ms') \
+                else float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def is_retryable(error: Exception, status_code: Optional[int]) -> bool:
+        """
+        Determines whether a call that failed can be sent to another endpoint:
+        the endpoint throttled the call, failed with a server error, timed out, or could not be reached.
+        """
+        if status_code is not None:
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, (TimeoutError, ConnectionError)) \
+            or type(error).__name__.endswith(('TimeoutError', 'ConnectionError'))
@@ -1,8 +1,10 @@
+from typing import Optional
 from foundationallm.config import Configuration, UserIdentity
 from foundationallm.langchain.agents import (
     AgentFactory,
     AgentBase
 )
+from foundationallm.langchain.common import FoundationaLLMCompletionStream
 from foundationallm.operations import OperationsManager
 from foundationallm.plugins import PluginManager
 from foundationallm.models.orchestration import (
@@ -19,7 +21,8 @@ class OrchestrationManager:
         user_identity: UserIdentity,
         configuration: Configuration,
         plugin_manager: PluginManager,
-        operations_manager: OperationsManager):
+        operations_manager: OperationsManager,
+        completion_stream: Optional[FoundationaLLMCompletionStream] = None):
         """
         Initializes an instance of the OrchestrationManager.
 
@@ -36,6 +39,9 @@ class OrchestrationManager:
             The configuration object containing the details needed for the OrchestrationManager to assemble an agent.
         operations_manager : OperationsManager
             The operations manager object for allowing an agent to interact with the State API.
+        completion_stream : FoundationaLLMCompletionStream
+            The stream used to relay the completion response while it is generated.
+            If None, the completion response is not streamed.
         """
         self.agent = self.__create_agent(
             completion_request = completion_request,
@@ -43,7 +49,8 @@ class OrchestrationManager:
             plugin_manager = plugin_manager,
             operations_manager = operations_manager,
             instance_id = instance_id,
-            user_identity = user_identity
+            user_identity = user_identity,
+            completion_stream = completion_stream
         )
 
     def __create_agent(
@@ -53,7 +60,8 @@ class OrchestrationManager:
         plugin_manager: PluginManager,
         operations_manager: OperationsManager,
         instance_id: str,
-        user_identity: UserIdentity
+        user_identity: UserIdentity,
+        completion_stream: Optional[FoundationaLLMCompletionStream]
     ) -> AgentBase:
         """Creates an agent for executing completion requests."""
         return AgentFactory().get_agent(
@@ -62,7 +70,8 @@ class OrchestrationManager:
             plugin_manager,
             operations_manager,
             instance_id,
-            user_identity)
+            user_identity,
+            completion_stream)
 
     async def invoke_async(self, request: CompletionRequestBase) -> CompletionResponse:
         """
@@ -13,12 +13,12 @@ from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from azure.search.documents import SearchClient
 from azure.search.documents.models import VectorizedQuery
-from azure.identity import DefaultAzureCredential
 from foundationallm.models.orchestration import ContentArtifact
 from foundationallm.models.vectors import VectorDocument
 from foundationallm.services.gateway_text_embedding import GatewayTextEmbeddingService
 from .content_artifact_retrieval_base import ContentArtifactRetrievalBase
 from foundationallm.models.agents import KnowledgeManagementIndexConfiguration
+from foundationallm.utils import AzureCredentialRegistry
 
 class AzureAISearchServiceRetriever(BaseRetriever, ContentArtifactRetrievalBase):
     """
@@ -74,7 +74,7 @@ class AzureAISearchServiceRetriever(BaseRetriever, ContentArtifactRetrievalBase)
 
             credential = None
             if credential_type == "AzureIdentity":
-                credential = DefaultAzureCredential()
+                credential = AzureCredentialRegistry.get_credential(include_environment_credential=True)
 
             endpoint = index_config.api_endpoint_configuration.url
 
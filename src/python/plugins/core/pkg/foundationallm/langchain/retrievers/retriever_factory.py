@@ -1,7 +1,7 @@
 from typing import List
-from azure.identity import DefaultAzureCredential
 from langchain_core.retrievers import BaseRetriever
 from foundationallm.config import Configuration
+from foundationallm.utils import AzureCredentialRegistry
 from foundationallm.services.gateway_text_embedding import GatewayTextEmbeddingService
 from .azure_ai_search_service_retriever import AzureAISearchServiceRetriever
 from foundationallm.models.agents import KnowledgeManagementIndexConfiguration
@@ -29,7 +29,7 @@ class RetrieverFactory:
         BaseRetriever
             Returns the concrete initialization of a vectorstore retriever.
         """               
-        credential = DefaultAzureCredential(exclude_environment_credential=True)                                   
+        credential = AzureCredentialRegistry.get_credential()                                   
   
         """
         # use indexing profile to build the retriever (current only supporting Azure AI Search)
@@ -1,6 +1,6 @@
 import json
 from enum import Enum
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+from azure.identity import get_bearer_token_provider
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import ToolException
 from openai import AsyncAzureOpenAI
@@ -13,7 +13,7 @@ from foundationallm.models.agents import AgentTool
 from foundationallm.models.orchestration import ContentArtifact
 from foundationallm.models.resource_providers.ai_models import AIModelBase
 from foundationallm.models.resource_providers.configuration import APIEndpointConfiguration
-from foundationallm.utils import ObjectUtils
+from foundationallm.utils import AzureCredentialRegistry, ObjectUtils
 from foundationallm.langchain.exceptions import LangChainException
 from foundationallm.models.constants import (
     ResourceObjectIdPropertyNames,
@@ -144,7 +144,7 @@ class DALLEImageGenerationTool(FoundationaLLMToolBase):
         scope = self.api_endpoint.authentication_parameters.get('scope', 'https://cognitiveservices.azure.com/.default')
         # Set up a Azure AD token provider.
         token_provider = get_bearer_token_provider(
-            DefaultAzureCredential(exclude_environment_credential=True),
+            AzureCredentialRegistry.get_credential(),
             scope
         )
         return AsyncAzureOpenAI(
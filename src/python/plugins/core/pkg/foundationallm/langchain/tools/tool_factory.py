@@ -9,7 +9,7 @@ from foundationallm.langchain.common import FoundationaLLMToolBase
 from foundationallm.langchain.exceptions import LangChainException
 from foundationallm.langchain.tools import DALLEImageGenerationTool
 from foundationallm.models.agents import AgentTool
-from foundationallm.plugins import PluginManager, PluginManagerTypes
+from foundationallm.plugins import PluginManager, PluginManagerTypes, PluginRegistry
 from foundationallm.telemetry import Telemetry
 
 class ToolFactory:
@@ -20,7 +20,7 @@ class ToolFactory:
     DALLE_IMAGE_GENERATION_TOOL = "DALLEImageGeneration"
     FOUNDATIONALLM_CONTENT_SEARCH_TOOL = "FoundationaLLMContentSearchTool"
 
-    def __init__(self, plugin_manager: PluginManager):
+    def __init__(self, plugin_manager: PluginManager, plugin_registry: PluginRegistry = None):
         """
         Initializes the tool factory.
 
@@ -28,8 +28,12 @@ class ToolFactory:
         ----------
         plugin_manager : PluginManager
             The plugin manager object used to load external tools.
+        plugin_registry : PluginRegistry
+            The version of the external modules used to create the tools.
+            Defaults to the current plugin registry of the plugin manager.
         """
         self.plugin_manager = plugin_manager
+        self.plugin_registry = plugin_registry or plugin_manager.registry
         self.logger = Telemetry.get_logger(self.__class__.__name__)
 
     def get_tool(
@@ -71,10 +75,10 @@ class ToolFactory:
         else:
             tool_plugin_manager = None
 
-            if tool_config.package_name in self.plugin_manager.external_modules:
+            if tool_config.package_name in self.plugin_registry.external_modules:
                 tool_plugin_manager = next(( \
                     pm for pm \
-                    in self.plugin_manager.external_modules[tool_config.package_name].plugin_managers \
+                    in self.plugin_registry.external_modules[tool_config.package_name].plugin_managers \
                     if pm.plugin_manager_type == PluginManagerTypes.TOOLS), None)
                 if tool_plugin_manager is None:
                     raise LangChainException(f"Tool plugin manager not found for package {tool_config.package_name}")
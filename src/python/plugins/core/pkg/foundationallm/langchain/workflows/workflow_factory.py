@@ -13,13 +13,17 @@ from foundationallm.models.agents import (
     ExternalAgentWorkflow
 )
 from foundationallm.operations import OperationsManager
-from foundationallm.plugins import PluginManager, PluginManagerTypes
+from foundationallm.plugins import PluginManager, PluginManagerTypes, PluginRegistry
 
 class WorkflowFactory:
     """
     Factory class for creating an external agent workflow instance based on the Agent workflow configuration.
     """   
-    def __init__(self, plugin_manager: PluginManager, operations_manager: OperationsManager = None):
+    def __init__(
+        self,
+        plugin_manager: PluginManager,
+        operations_manager: OperationsManager = None,
+        plugin_registry: PluginRegistry = None):
         """
         Initializes the workflow factory.
 
@@ -27,8 +31,12 @@ class WorkflowFactory:
         ----------
         plugin_manager : PluginManager
             The plugin manager object used to load external workflows.
+        plugin_registry : PluginRegistry
+            The version of the external modules used to create the workflows.
+            Defaults to the current plugin registry of the plugin manager.
         """
         self.plugin_manager = plugin_manager
+        self.plugin_registry = plugin_registry or plugin_manager.registry
         self.operations_manager = operations_manager
 
     def get_workflow(
@@ -60,10 +68,10 @@ class WorkflowFactory:
         else:
             workflow_plugin_manager = None
 
-            if workflow_config.package_name in self.plugin_manager.external_modules:
+            if workflow_config.package_name in self.plugin_registry.external_modules:
                 workflow_plugin_manager = next(( \
                     wm for wm \
-                    in self.plugin_manager.external_modules[workflow_config.package_name].plugin_managers \
+                    in self.plugin_registry.external_modules[workflow_config.package_name].plugin_managers \
                     if wm.plugin_manager_type == PluginManagerTypes.WORKFLOWS), None)
                 if workflow_plugin_manager is None:
                     raise LangChainException(f"Workflow plugin manager not found for package {workflow_config.package_name}")
@@ -1,4 +1,5 @@
 from .agent_capability_categories import AgentCapabilityCategories
+from .ai_model_parameter_names import AIModelParameterNames
 from .resource_object_id_property_names import ResourceObjectIdPropertyNames
 from .resource_object_id_property_values import ResourceObjectIdPropertyValues
 from .resource_provider_names import ResourceProviderNames
@@ -0,0 +1,6 @@
+class AIModelParameterNames:
+    """The names of the AI model parameters used by the platform rather than by the language model clients."""
+    REQUESTS_PER_MINUTE = 'requests_per_minute'
+    TOKENS_PER_MINUTE = 'tokens_per_minute'
+    HEDGING_PERCENTILE = 'hedging_percentile'
+    HEDGING_MAX_RATE = 'hedging_max_rate'
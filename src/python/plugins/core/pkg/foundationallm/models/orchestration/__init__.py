@@ -14,3 +14,5 @@ from .openai_text_message_content_item import OpenAITextMessageContentItem
 from .completion_request_object_keys import CompletionRequestObjectKeys
 from .completion_request_base import CompletionRequestBase
 from .completion_response import CompletionResponse
+from .completion_stream_event_types import CompletionStreamEventTypes
+from .completion_stream_event import CompletionStreamEvent
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import Any, Optional
+
+class CompletionStreamEvent(BaseModel):
+    """
+    Represents an event emitted while a completion response is being streamed.
+    """
+    event_type: str = Field(..., description="The type of the event. See CompletionStreamEventTypes for the supported values.")
+    operation_id: str = Field(..., description="The unique identifier of the operation generating the completion response.")
+    content: Optional[str] = Field(None, description="The text content of the event (e.g., the generated tokens or a status message).")
+    data: Optional[Any] = Field(None, description="Additional data associated with the event (e.g., the tool call details or the final completion response).")
@@ -0,0 +1,8 @@
+class CompletionStreamEventTypes:
+   """Completion Stream Event Type Constants"""
+   STATUS = "status"
+   TOKEN = "token"
+   TOOL_START = "tool_start"
+   TOOL_END = "tool_end"
+   COMPLETION = "completion"
+   ERROR = "error"
@@ -1,5 +1,5 @@
 from pydantic import Field
-from typing import Any, Self, Optional
+from typing import Any, List, Self, Optional
 from foundationallm.models.resource_providers import ResourceBase
 from foundationallm.utils import ObjectUtils
 from foundationallm.langchain.exceptions import LangChainException
@@ -9,6 +9,7 @@ class AIModelBase(ResourceBase):
     The base class used for AIModel resources.
     """
     endpoint_object_id: str = Field(description="The object ID of the APIEndpointConfiguration object providing the configuration for the API endpoint used to interact with the model.")
+    endpoint_object_ids: Optional[List[str]] = Field(default=[], description="The object IDs of additional APIEndpointConfiguration objects serving the same model. The calls are routed to the healthiest endpoint of the pool.")
     version: Optional[str] = Field(description="The version of the AI model.")
     deployment_name: Optional[str] = Field(description="The deployment name for the AI model.")
     model_parameters: Optional[dict] = Field(default={}, description="A dictionary containing default values for model parameters.")
@@ -1,4 +1,5 @@
 """
 Operations module for FoundationaLLM package.
 """
+from .operation_state_writer import OperationStateWriter
 from .operations_manager import OperationsManager
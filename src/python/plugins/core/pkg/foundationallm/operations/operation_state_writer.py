@@ -0,0 +1,186 @@
+import asyncio
+import os
+from functools import partial
+from logging import Logger
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_OPERATION_STATE_FLUSH_INTERVAL_SECONDS
+)
+from foundationallm.telemetry import Telemetry
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+class OperationStateWriter():
+    """
+    Writes the progress updates of long running operations to the State API in the background.
+
+    Only the latest pending update of each operation is kept. Pending updates are flushed
+    on a fixed interval, so callers reporting progress never wait on the State API.
+    Terminal updates are not handled by the writer: callers must discard the pending
+    updates of an operation before writing its terminal state.
+    """
+
+    def __init__(
+        self,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        logger: Logger = None):
+        """
+        Initializes the operation state writer.
+
+        Parameters
+        ----------
+        flush_interval_seconds : float
+            The interval, in seconds, at which the pending updates are flushed.
+        logger : Logger
+            The logger used for logging.
+        """
+        self.flush_interval_seconds = flush_interval_seconds
+        self.logger = logger or Telemetry.get_logger(__name__)
+
+        self.__pending_updates: Dict[str, Callable[[], Awaitable]] = {}
+        self.__operation_locks: Dict[str, asyncio.Lock] = {}
+        self.__operation_writes: Dict[str, Set[asyncio.Task]] = {}
+        self.__flush_task: Optional[asyncio.Task] = None
+        self.__enqueued = 0
+        self.__coalesced = 0
+        self.__written = 0
+        self.__failed = 0
+
+    @staticmethod
+    def from_environment(logger: Logger = None) -> 'OperationStateWriter':
+        """
+        Creates an operation state writer using the settings from the environment variables.
+
+        Returns
+        -------
+        OperationStateWriter
+            The operation state writer.
+        """
+        return OperationStateWriter(
+            flush_interval_seconds=float(os.getenv(
+                FOUNDATIONALLM_OPERATION_STATE_FLUSH_INTERVAL_SECONDS, DEFAULT_FLUSH_INTERVAL_SECONDS)),
+            logger=logger)
+
+    def start(self):
+        """
+        Starts flushing the pending updates in the background.
+        """
+        if self.__flush_task is None or self.__flush_task.done():
+            self.__flush_task = asyncio.create_task(self.__flush_loop())
+
+    async def stop_async(self):
+        """
+        Stops the background flush and writes the remaining pending updates.
+        """
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+            await asyncio.gather(self.__flush_task, return_exceptions=True)
+            self.__flush_task = None
+        await self.flush_async()
+
+    def enqueue(self, operation_id: str, write_update: Callable[[], Awaitable]):
+        """
+        Sets the pending update of an operation, replacing any update not yet written.
+
+        Parameters
+        ----------
+        operation_id : str
+            The unique identifier of the operation.
+        write_update : Callable[[], Awaitable]
+            The function writing the update to the State API.
+        """
+        self.__enqueued += 1
+        if operation_id in self.__pending_updates:
+            self.__coalesced += 1
+        self.__pending_updates[operation_id] = write_update
+
+    async def discard_pending_updates_async(self, operation_id: str):
+        """
+        Discards the pending update of an operation and waits for any update
+        of the operation being written to complete.
+
+        Parameters
+        ----------
+        operation_id : str
+            The unique identifier of the operation.
+        """
+        self.__pending_updates.pop(operation_id, None)
+        operation_writes = self.__operation_writes.get(operation_id)
+        if operation_writes:
+            await asyncio.wait(list(operation_writes))
+
+    async def flush_async(self):
+        """
+        Writes all the pending updates to the State API.
+        """
+        if not self.__pending_updates:
+            return
+        pending_updates = self.__pending_updates
+        self.__pending_updates = {}
+
+        # Register the writes before they start, so discarding the pending updates
+        # of an operation waits for the updates already taken by this flush.
+        write_tasks = []
+        for operation_id, write_update in pending_updates.items():
+            write_task = asyncio.create_task(self.__write_update(operation_id, write_update))
+            self.__operation_writes.setdefault(operation_id, set()).add(write_task)
+            write_task.add_done_callback(partial(self.__remove_operation_write, operation_id))
+            write_tasks.append(write_task)
+        await asyncio.gather(*write_tasks)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the current statistics of the writer.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the writer statistics.
+        """
+        return {
+            'flush_interval_seconds': self.flush_interval_seconds,
+            'pending': len(self.__pending_updates),
+            'enqueued': self.__enqueued,
+            'coalesced': self.__coalesced,
+            'written': self.__written,
+            'failed': self.__failed
+        }
+
+    async def __flush_loop(self):
+        """
+        Flushes the pending updates on the configured interval.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush_async()
+            except Exception as e:
+                self.logger.error(f'An error occurred while flushing the operation state updates: {e}')
+
+    async def __write_update(self, operation_id: str, write_update: Callable[[], Awaitable]):
+        """
+        Writes the update of an operation while holding the operation lock.
+        """
+        lock = self.__operation_locks.setdefault(operation_id, asyncio.Lock())
+        try:
+            async with lock:
+                await write_update()
+            self.__written += 1
+        except Exception as e:
+            # Progress updates are best effort, the terminal state of the operation is written separately.
+            self.__failed += 1
+            self.logger.warning(f'Failed to write the progress update of operation {operation_id}: {e}')
+        finally:
+            if not lock.locked():
+                self.__operation_locks.pop(operation_id, None)
+
+    def __remove_operation_write(self, operation_id: str, write_task: asyncio.Task):
+        """
+        Unregisters a completed write of an operation update.
+        """
+        operation_writes = self.__operation_writes.get(operation_id)
+        if operation_writes is not None:
+            operation_writes.discard(write_task)
+            if not operation_writes:
+                del self.__operation_writes[operation_id]
@@ -1,7 +1,8 @@
 from aiohttp import ClientSession
+import asyncio
 import json
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from foundationallm.config import Configuration
 from foundationallm.models.operations import (
     LongRunningOperation,
@@ -12,16 +13,25 @@ from foundationallm.models.orchestration import (
     CompletionResponse,
     OpenAITextMessageContentItem
 )
+from foundationallm.operations.operation_state_writer import OperationStateWriter
 from foundationallm.telemetry import Telemetry
+from foundationallm.utils import HttpSessionPool
 from logging import Logger
 
 class OperationsManager():
     """
     Class for managing long running operations via calls to the StateAPI.
     """
-    def __init__(self, config: Configuration, http_client_session: ClientSession = None, logger: Logger = None):
+    def __init__(
+        self,
+        config: Configuration,
+        http_client_session: ClientSession = None,
+        logger: Logger = None,
+        state_writer: OperationStateWriter = None):
         self.http_client_session = http_client_session
         self.logger = logger or Telemetry.get_logger(__name__)
+        # When set, the progress updates of the operations are written in the background.
+        self.state_writer = state_writer
         # Retrieve the State API configuration settings.
         self.state_api_url = config.get_value('FoundationaLLM:APIEndpoints:StateAPI:Essentials:APIUrl').rstrip('/')
         self.state_api_key = config.get_value('FoundationaLLM:APIEndpoints:StateAPI:Essentials:APIKey')
@@ -31,7 +41,7 @@ class OperationsManager():
     
     async def _ensure_session(self) -> ClientSession:
         if self.http_client_session is None or self.http_client_session.closed:
-            self.http_client_session = ClientSession()
+            self.http_client_session = HttpSessionPool.get_default().get_session()
         return self.http_client_session
 
     async def create_operation_async(
@@ -311,6 +321,9 @@ class OperationsManager():
         """
         Updates the state of a background operation through the State API, including a text result.
 
+        If a state writer is configured, non-terminal updates are queued on the writer and
+        written in the background; only the latest queued update of the operation is written.
+
         Parameters
         ----------
         operation : LongRunningOperation
@@ -329,7 +342,56 @@ class OperationsManager():
         Returns
         -------
         Optional[LongRunningOperation]
-            Object representing the operation if successful, None if not found.
+            Object representing the operation if successful, None if not found
+            or if the update was queued on the state writer.
+        """
+        if self.state_writer is not None:
+            if status in (OperationStatus.COMPLETED, OperationStatus.FAILED):
+                await self.state_writer.discard_pending_updates_async(operation_id)
+            else:
+                self.state_writer.enqueue(
+                    operation_id,
+                    lambda: self.__write_text_result_async(
+                        operation_id,
+                        instance_id,
+                        status,
+                        status_message,
+                        result_message,
+                        user_identity))
+                return None
+
+        return await self.__write_text_result_async(
+            operation_id,
+            instance_id,
+            status,
+            status_message,
+            result_message,
+            user_identity)
+
+    async def discard_pending_updates_async(self, operation_id: str):
+        """
+        Discards the progress updates of an operation not yet written by the state writer.
+        Must be called before writing the terminal state of an operation.
+
+        Parameters
+        ----------
+        operation_id : str
+            The unique identifier for the operation.
+        """
+        if self.state_writer is not None:
+            await self.state_writer.discard_pending_updates_async(operation_id)
+
+    async def __write_text_result_async(
+        self,
+        operation_id: str,
+        instance_id: str,
+        status: OperationStatus,
+        status_message: str,
+        result_message: str,
+        user_identity: str
+    ) -> Optional[LongRunningOperation]:
+        """
+        Writes the result and the state of a background operation through the State API.
         """
         try:
 
@@ -361,6 +423,62 @@ class OperationsManager():
             self.logger.exception(f'An error occurred while updating the status of operation {operation_id}: {e}')
             raise
 
+    async def fail_operations_async(
+        self,
+        operations: List[Tuple[str, str, str]],
+        status_message: str
+    ) -> int:
+        """
+        Marks a set of background operations as failed through the State API.
+
+        The State API does not expose a bulk endpoint, so the result and status
+        updates for all the operations are sent concurrently.
+
+        Parameters
+        ----------
+        operations : List[Tuple[str, str, str]]
+            The operations to fail, as (operation_id, instance_id, user_identity) tuples.
+        status_message : str
+            The message to associate with the failed status and used as the error of the operation result.
+
+        Returns
+        -------
+        int
+            The number of operations that were successfully marked as failed.
+        """
+        async def fail_operation(operation_id: str, instance_id: str, user_identity: str):
+            await self.discard_pending_updates_async(operation_id)
+            await asyncio.gather(
+                self.set_operation_result_async(
+                    operation_id,
+                    instance_id,
+                    CompletionResponse(
+                        operation_id=operation_id,
+                        user_prompt='',
+                        content=[],
+                        errors=[status_message]
+                    )),
+                self.update_operation_async(
+                    operation_id,
+                    instance_id,
+                    OperationStatus.FAILED,
+                    status_message,
+                    user_identity
+                )
+            )
+
+        results = await asyncio.gather(
+            *[fail_operation(*operation) for operation in operations],
+            return_exceptions=True)
+
+        failed_count = 0
+        for (operation_id, _, _), result in zip(operations, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f'Failed to mark operation {operation_id} as failed: {result}')
+            else:
+                failed_count += 1
+        return failed_count
+
     def __get_standard_headers(self):
         """
         Retrieves the standard headers for interacting with the State API.
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .plugin_manager_types import PluginManagerTypes
+from .plugin_registry import PluginRegistry
 from .plugin_manager import PluginManager
 
 from .tools.tool_plugin_manager_base import ToolPluginManagerBase
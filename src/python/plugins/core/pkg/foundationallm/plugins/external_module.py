@@ -11,6 +11,8 @@ class ExternalModule():
         module_name: str - The name of the module.
         module_loaded: bool - Indicates whether the module is loaded.
         module: ModuleType - The module object.
+        module_path: str - The local directory the module is imported from.
+        import_time_ms: float - The time, in milliseconds, spent importing the module.
         plugin_manager_class_names: List[str] - The list of plugin manager class names for the module.
         plugin_manager: List[Union[ToolPluginManager, WorkflowPluginManager]] - The list of plugin managers for the module.
     """
@@ -19,6 +21,8 @@ class ExternalModule():
     module_name: str
     module_loaded: bool = False
     module: ModuleType = None
+    module_path: str = None
+    import_time_ms: float = None
     plugin_manager_class_names: List[str] = None
     plugin_managers: List[Union[ToolPluginManagerBase, WorkflowPluginManagerBase]] = None
 
@@ -1,16 +1,24 @@
 '''
 Manages the plugins in the system.'''
-from importlib import import_module, reload
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module, invalidate_caches
 from logging import Logger
 import json
 import os
 import sys
+import threading
+import time
 
 from foundationallm.config import Configuration
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_PLUGIN_DOWNLOAD_MAX_WORKERS
+)
 from foundationallm.storage import BlobStorageManager
 
 from .external_module import ExternalModule
 from .plugin_manager_types import PluginManagerTypes
+from .plugin_registry import PluginRegistry
+from .wheel_installer import WheelInstaller
 
 PLUGIN_MANAGER_CONFIGURATION_NAMESPACE = \
     'FoundationaLLM:APIEndpoints:LangChainAPI:Configuration:ExternalModules'
@@ -22,10 +30,15 @@ PLUGIN_MANAGER_STORAGE_CONTAINER = 'resource-provider'
 PLUGIN_MANAGER_STORAGE_ROOT_PATH = 'FoundationaLLM.Plugin'
 PLUGIN_MANAGER_LOCAL_STORAGE_FOLDER_NAME = \
     'foundationallm_external_modules'
+DEFAULT_DOWNLOAD_MAX_WORKERS = 8
 
 class PluginManager():
     """
     Manages the plugins in the system.
+
+    The loaded external modules are published as a versioned PluginRegistry. Reloading the
+    plugins builds and imports a new version, then replaces the current registry in a single
+    assignment, so requests that captured the previous registry finish on the previous version.
     """
 
     object_cache : dict[str, object] = {}
@@ -43,8 +56,13 @@ class PluginManager():
         """
         self.config = config
         self.logger = logger
-        self.external_modules: dict[str, ExternalModule] = {}
+        self.registry = PluginRegistry(version=0, external_modules={})
         self.modules_local_path = f'./{PLUGIN_MANAGER_LOCAL_STORAGE_FOLDER_NAME}'
+        self.download_max_workers = int(os.getenv(
+            FOUNDATIONALLM_PLUGIN_DOWNLOAD_MAX_WORKERS, DEFAULT_DOWNLOAD_MAX_WORKERS))
+        self.download_stats = {}
+        self.__load_lock = threading.Lock()
+        self.__pending_external_modules: dict[str, ExternalModule] = None
 
         if not os.path.exists(self.modules_local_path):
             os.makedirs(self.modules_local_path)
@@ -78,30 +96,7 @@ class PluginManager():
                     authentication_type=storage_authentication_type
                 )
 
-                plugin_blobs = self.storage_manager.list_blobs(
-                    f'{PLUGIN_MANAGER_STORAGE_ROOT_PATH}/Python-')
-                plugin_blob_names = [blob.name for blob in plugin_blobs]
-
-                for plugin_blob_name in plugin_blob_names:
-                    self.logger.info(f'Loading plugin package from: {plugin_blob_name}')
-
-                    plugin_package_content = self.storage_manager.read_file_content(plugin_blob_name)
-                    plugin_package = json.loads(plugin_package_content)
-
-                    module_file = plugin_package['package_file_path']
-                    module_name = plugin_package['properties']['module_name']
-                    plugin_manager_class_names = plugin_package['properties']['plugin_managers']
-
-                    for plugin_manager_class_name in plugin_manager_class_names.split(','):
-
-                        if module_name in self.external_modules:
-                            self.external_modules[module_name].plugin_manager_class_names.append(plugin_manager_class_name)
-                        else:
-                            self.external_modules[module_name] = ExternalModule(
-                                module_file=module_file,
-                                module_name=module_name,
-                                plugin_manager_class_names=[plugin_manager_class_name]
-                            )
+                self.__pending_external_modules = self.__read_external_modules()
 
                 self.initialized = True
                 self.logger.info('The plugin manager initialized successfully.')
@@ -110,62 +105,105 @@ class PluginManager():
                 self.logger.exception('An error occurred while initializing the plugin manager storage manager. No plugins will be loaded.')
                 self.logger.error(f'Exception details: {e}')
 
+    @property
+    def external_modules(self) -> dict[str, ExternalModule]:
+        """
+        The external modules of the current plugin registry.
+        """
+        return self.registry.external_modules
+
     def load_external_modules(self, reload_modules:bool=False):
         """
-        Loads the external modules into the system.
+        Loads the external modules into the system and publishes them as a new plugin registry.
+
+        This method blocks while the module files are downloaded and imported. Callers running
+        on an event loop should call it in a worker thread (e.g., using asyncio.to_thread).
+
+        Parameters
+        ----------
+        reload_modules : bool
+            Set to True to read the plugin package descriptors again and import the new
+            version of the external modules. The current registry is kept until the new one is loaded.
         """
         if not self.initialized:
             self.logger.error('The plugin manager is not initialized. No plugins will be loaded.')
             return
 
-        loaded_modules = set()
+        with self.__load_lock:
+            previous_registry = self.registry
+            if reload_modules or self.__pending_external_modules is None:
+                external_modules = self.__read_external_modules()
+            else:
+                external_modules = self.__pending_external_modules
+            self.__pending_external_modules = None
 
-        for module_name, external_module in self.external_modules.items():
+            # Modules imported by a previous registry are imported again, others already in sys.modules
+            # were loaded externally (not by PluginManager) and are reused.
+            def is_loaded_by_plugin_manager(module_name: str) -> bool:
+                previous_module = previous_registry.external_modules.get(module_name)
+                return previous_module is not None and previous_module.module_path is not None
 
-            module_file_name = external_module.module_file
-            local_module_file_name = f'{self.modules_local_path}/{os.path.basename(module_file_name)}'
-            self.logger.info(f'Loading module from {module_file_name}')
+            # Download and install the module files concurrently before importing the modules in order.
+            self.__install_module_files([
+                external_module for module_name, external_module in external_modules.items()
+                if module_name not in sys.modules or is_loaded_by_plugin_manager(module_name)
+            ])
 
-            try:
+            for module_name, external_module in external_modules.items():
 
-                if module_name in loaded_modules:
-                    self.logger.info(f'Module {module_name} and all plugin managers are already loaded.')
-                    continue
-                if module_name in sys.modules:
-                    # Module was already loaded externally (not by PluginManager)
-                    self.logger.info(f'Module {module_name} was already loaded externally. Reusing existing module.')
-                    external_module.module = sys.modules[module_name]
-                    external_module.module_loaded = True
-                    loaded_modules.add(module_name)
+                module_file_name = external_module.module_file
+                self.logger.info(f'Loading module from {module_file_name}')
 
-                    # NOTE: Modules loaded outside of PluginManager are not expected to have plugin managers.
-                    # Consequently, we skip loading plugin managers for such modules.
-                    continue
+                previous_module = previous_registry.external_modules.get(module_name)
+                unloaded_modules = {}
 
-                if (self.storage_manager.file_exists(module_file_name)):
-                    self.logger.info(f'Copying module file to: {local_module_file_name}')
-                    module_file_binary_content = self.storage_manager.read_file_content(module_file_name)
-                    with open(local_module_file_name, 'wb') as f:
-                        f.write(module_file_binary_content)
+                try:
 
-                sys.path.insert(0, local_module_file_name)
+                    if module_name in sys.modules and not is_loaded_by_plugin_manager(module_name):
+                        # Module was already loaded externally (not by PluginManager)
+                        self.logger.info(f'Module {module_name} was already loaded externally. Reusing existing module.')
+                        external_module.module = sys.modules[module_name]
+                        external_module.module_loaded = True
 
-                if reload_modules:
-                    external_module.module = reload(external_module.module)
-                    self.logger.info(f'Module {module_name} reloaded successfully.')
-                else:
+                        # NOTE: Modules loaded outside of PluginManager are not expected to have plugin managers.
+                        # Consequently, we skip loading plugin managers for such modules.
+                        continue
+
+                    if external_module.module_path is None:
+                        raise FileNotFoundError(f'The module file {module_file_name} could not be installed.')
+
+                    if previous_module is not None and previous_module.module_loaded:
+                        # The previous version stays referenced by the previous registry.
+                        unloaded_modules = self.__unload_module(previous_module)
+
+                    if external_module.module_path not in sys.path:
+                        sys.path.insert(0, external_module.module_path)
+
+                    import_start = time.perf_counter()
                     external_module.module = import_module(external_module.module_name)
-                    self.logger.info(f'Module {module_name} loaded successfully.')
+                    external_module.import_time_ms = round((time.perf_counter() - import_start) * 1000, 3)
+                    self.logger.info(
+                        f'Module {module_name} loaded successfully in {external_module.import_time_ms} ms.')
 
-                external_module.module_loaded = True
-                loaded_modules.add(module_name)
+                    for plugin_manager_class_name in external_module.plugin_manager_class_names:
+                        # Note the () at the end of the getattr call - this is to call the class constructor, not just get the class.
+                        external_module.plugin_managers.append(getattr(external_module.module, plugin_manager_class_name)())
 
-                for plugin_manager_class_name in external_module.plugin_manager_class_names:
-                    # Note the () at the end of the getattr call - this is to call the class constructor, not just get the class.
-                    external_module.plugin_managers.append(getattr(external_module.module, plugin_manager_class_name)())
+                    external_module.module_loaded = True
 
-            except Exception as e:
-                self.logger.exception(f'An error occurred while loading module {module_name}: {str(e)}')
+                except Exception as e:
+                    self.logger.exception(f'An error occurred while loading module {module_name}: {str(e)}')
+                    if previous_module is not None and previous_module.module_loaded:
+                        # Keep serving the previous version of the module.
+                        # It is only unloaded if the new version failed after being installed.
+                        if unloaded_modules:
+                            self.__restore_module(previous_module, external_module, unloaded_modules)
+                        external_modules[module_name] = previous_module
+
+            self.registry = PluginRegistry(
+                version=previous_registry.version + 1,
+                external_modules=external_modules)
+            self.logger.info(f'Plugin registry version {self.registry.version} published.')
 
     def clear_cache(self):
         """
@@ -174,3 +212,156 @@ class PluginManager():
         self.object_cache.clear()
         self.logger.info('Object cache cleared.')
 
+    def __read_external_modules(self) -> dict[str, ExternalModule]:
+        """
+        Reads the plugin package descriptors and builds the external modules they describe.
+        """
+        plugin_blobs = self.storage_manager.list_blobs(
+            f'{PLUGIN_MANAGER_STORAGE_ROOT_PATH}/Python-')
+        plugin_blob_names = [blob.name for blob in plugin_blobs]
+
+        # Read the plugin package descriptors concurrently, keeping their order.
+        with ThreadPoolExecutor(
+            max_workers=self.download_max_workers,
+            thread_name_prefix='foundationallm-plugin-descriptor') as executor:
+            plugin_packages = list(executor.map(self.__read_plugin_package, plugin_blob_names))
+
+        external_modules: dict[str, ExternalModule] = {}
+        for plugin_package in plugin_packages:
+
+            module_file = plugin_package['package_file_path']
+            module_name = plugin_package['properties']['module_name']
+            plugin_manager_class_names = plugin_package['properties']['plugin_managers']
+
+            for plugin_manager_class_name in plugin_manager_class_names.split(','):
+
+                if module_name in external_modules:
+                    external_modules[module_name].plugin_manager_class_names.append(plugin_manager_class_name)
+                else:
+                    external_modules[module_name] = ExternalModule(
+                        module_file=module_file,
+                        module_name=module_name,
+                        plugin_manager_class_names=[plugin_manager_class_name]
+                    )
+
+        return external_modules
+
+    def __unload_module(self, external_module: ExternalModule) -> dict:
+        """
+        Removes a module and its submodules from sys.modules and its directory from sys.path,
+        so the next import loads the new version. Returns the removed modules.
+        """
+        module_name = external_module.module_name
+        unloaded_modules = {
+            name: module for name, module in sys.modules.items()
+            if name == module_name or name.startswith(f'{module_name}.')
+        }
+        for name in unloaded_modules:
+            del sys.modules[name]
+        if external_module.module_path in sys.path:
+            sys.path.remove(external_module.module_path)
+        invalidate_caches()
+        return unloaded_modules
+
+    def __restore_module(self, external_module: ExternalModule, failed_external_module: ExternalModule, unloaded_modules: dict):
+        """
+        Restores a module unloaded by __unload_module after its new version failed to load.
+        """
+        module_name = external_module.module_name
+        for name in [name for name in sys.modules if name == module_name or name.startswith(f'{module_name}.')]:
+            del sys.modules[name]
+        sys.modules.update(unloaded_modules)
+        if failed_external_module.module_path in sys.path:
+            sys.path.remove(failed_external_module.module_path)
+        if external_module.module_path not in sys.path:
+            sys.path.insert(0, external_module.module_path)
+        invalidate_caches()
+
+    def __read_plugin_package(self, plugin_blob_name: str) -> dict:
+        """
+        Reads a plugin package descriptor from storage.
+        """
+        self.logger.info(f'Loading plugin package from: {plugin_blob_name}')
+        plugin_package_content = self.storage_manager.read_file_content(plugin_blob_name)
+        return json.loads(plugin_package_content)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the installation statistics of the external modules.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the download statistics and, for each external module,
+            its installation path and import time.
+        """
+        return {
+            'registry_version': self.registry.version,
+            'registry_created_on': self.registry.created_on.isoformat(),
+            'download': self.download_stats,
+            'modules': {
+                module_name: {
+                    'module_loaded': external_module.module_loaded,
+                    'module_path': external_module.module_path,
+                    'import_time_ms': external_module.import_time_ms
+                }
+                for module_name, external_module in self.external_modules.items()
+            }
+        }
+
+    def __install_module_files(self, external_modules: list[ExternalModule]):
+        """
+        Downloads and installs the module files concurrently, skipping the module files
+        whose version (the blob ETag) is already installed locally.
+        """
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.download_max_workers,
+            thread_name_prefix='foundationallm-plugin-download') as executor:
+            results = list(executor.map(self.__install_module_file, external_modules))
+
+        self.download_stats = {
+            'modules': len(external_modules),
+            'downloaded': results.count('downloaded'),
+            'cached': results.count('cached'),
+            'failed': results.count('failed'),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 3)
+        }
+        self.logger.info(f'Module files installed: {self.download_stats}')
+
+    def __install_module_file(self, external_module: ExternalModule) -> str:
+        """
+        Installs a module file into {modules_local_path}/{module_name}/{version}, where the version
+        is derived from the blob ETag. The module file is downloaded only if the version is not installed.
+
+        Returns
+        -------
+        str
+            The outcome of the installation: downloaded, cached, or failed.
+        """
+        module_file_name = external_module.module_file
+        try:
+            module_file_properties = self.storage_manager.get_file_properties(module_file_name)
+            if module_file_properties is None:
+                self.logger.error(f'The module file {module_file_name} does not exist.')
+                return 'failed'
+
+            install_path = os.path.join(
+                self.modules_local_path,
+                external_module.module_name,
+                WheelInstaller.get_version(module_file_properties.etag))
+
+            if WheelInstaller.is_installed(install_path):
+                self.logger.info(f'The module file {module_file_name} is unchanged. Using the installed copy.')
+                external_module.module_path = install_path
+                return 'cached'
+
+            self.logger.info(f'Installing module file to: {install_path}')
+            module_file_binary_content = self.storage_manager.read_file_content(module_file_name)
+            external_module.module_path = WheelInstaller.install(module_file_binary_content, install_path)
+            return 'downloaded'
+
+        except Exception as e:
+            self.logger.exception(f'An error occurred while installing module file {module_file_name}: {str(e)}')
+            return 'failed'
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from .external_module import ExternalModule
+
+class PluginRegistry():
+    """
+    A version of the external modules loaded by the plugin manager.
+
+    A registry is never modified once published by the plugin manager. Reloading the plugins
+    publishes a new registry, so requests holding a previous registry keep using the plugin
+    managers of the version they started with.
+        version: int - The version of the registry, incremented on every reload.
+        external_modules: dict[str, ExternalModule] - The external modules, indexed by module name.
+        created_on: datetime - The time the registry was published.
+    """
+
+    version: int
+    external_modules: dict[str, ExternalModule]
+    created_on: datetime
+
+    def __init__(self, version: int, external_modules: dict[str, ExternalModule]):
+        """
+        Initializes the plugin registry.
+
+        Parameters
+        ----------
+        version : int
+            The version of the registry.
+        external_modules : dict[str, ExternalModule]
+            The external modules, indexed by module name.
+        """
+        self.version = version
+        self.external_modules = external_modules
+        self.created_on = datetime.now(timezone.utc)
@@ -0,0 +1,92 @@
+import compileall
+import os
+import re
+import shutil
+import zipfile
+from io import BytesIO
+
+WHEEL_INSTALLED_MARKER_FILE_NAME = '.installed'
+
+class WheelInstaller():
+    """
+    Installs wheel files into versioned local directories.
+
+    Importing from an extracted directory allows Python to use precompiled bytecode,
+    which is not possible when importing a wheel file from sys.path through zipimport.
+    """
+
+    @staticmethod
+    def get_version(etag: str) -> str:
+        """
+        Builds a directory-safe version identifier from the ETag of a wheel blob.
+
+        Parameters
+        ----------
+        etag : str
+            The ETag of the wheel blob.
+
+        Returns
+        -------
+        str
+            The version identifier.
+        """
+        return re.sub(r'[^A-Za-z0-9]', '', etag)
+
+    @staticmethod
+    def is_installed(install_path: str) -> bool:
+        """
+        Checks whether a wheel is fully installed in the specified directory.
+
+        Parameters
+        ----------
+        install_path : str
+            The installation directory.
+
+        Returns
+        -------
+        bool
+            True if the wheel is installed, False otherwise.
+        """
+        return os.path.exists(os.path.join(install_path, WHEEL_INSTALLED_MARKER_FILE_NAME))
+
+    @staticmethod
+    def install(wheel_content: bytes, install_path: str) -> str:
+        """
+        Extracts a wheel into the installation directory and precompiles its Python files.
+        The wheel is extracted into a temporary directory first and moved into place once
+        precompiled, so a partially installed wheel is never imported.
+
+        Parameters
+        ----------
+        wheel_content : bytes
+            The content of the wheel file.
+        install_path : str
+            The installation directory. The directory name should identify the wheel version.
+
+        Returns
+        -------
+        str
+            The installation directory, to be added to sys.path.
+        """
+        if WheelInstaller.is_installed(install_path):
+            return install_path
+
+        temporary_install_path = f'{install_path}.tmp-{os.getpid()}'
+        shutil.rmtree(temporary_install_path, ignore_errors=True)
+
+        with zipfile.ZipFile(BytesIO(wheel_content)) as wheel:
+            wheel.extractall(temporary_install_path)
+
+        compileall.compile_dir(temporary_install_path, ddir=install_path, quiet=1)
+        with open(os.path.join(temporary_install_path, WHEEL_INSTALLED_MARKER_FILE_NAME), 'w', encoding='utf-8'):
+            pass
+
+        try:
+            os.replace(temporary_install_path, install_path)
+        except OSError:
+            # Another process installed the same version in the meantime.
+            shutil.rmtree(temporary_install_path, ignore_errors=True)
+            if not WheelInstaller.is_installed(install_path):
+                raise
+
+        return install_path
@@ -1,14 +1,33 @@
 import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+
 import requests
 import aiohttp
+from requests.adapters import HTTPAdapter
 from foundationallm.config import Configuration, UserIdentity
 from foundationallm.models.authentication import AuthenticationTypes, AuthenticationParametersKeys
 from foundationallm.models.resource_providers.configuration import APIEndpointConfiguration
+from foundationallm.utils import HttpSessionPool
+
+# The maximum number of connections kept open per host by the pooled synchronous sessions.
+SYNC_POOL_MAXSIZE = 32
 
 class HttpClientService:
     """
     Class for creating an HTTP client session based on an API endpoint configuration.
+
+    The requests are sent through process-wide pooled clients, so connections are reused
+    across HttpClientService instances. The synchronous sessions are keyed by base URL and
+    certificate verification setting; the asynchronous requests use the shared HttpSessionPool.
+    Headers specific to a request are passed per call and never set on the pooled clients,
+    and the pooled clients do not store cookies, so the cookies of a user's request are never sent with another's.
     """
+
+    __sync_sessions: Dict[Tuple[str, bool], requests.Session] = {}
+    __sync_sessions_lock = threading.Lock()
+
     def __init__(
             self,
             api_endpoint_configuration: APIEndpointConfiguration,
@@ -33,10 +52,6 @@ class HttpClientService:
         else:
             raise Exception(f"Authentication type {self.api_endpoint_configuration.authentication_type} is not currently supported.")
 
-        # If the user identity is provided, add the user principal name to the headers.
-        if self.user_identity is not None:
-            headers["X-USER-IDENTITY"] = self.user_identity.model_dump_json(by_alias=True)
-
         # Check for base URL exceptions.
         for url_exception in self.api_endpoint_configuration.url_exceptions:
             if url_exception.user_principal_name.lower() == self.user_identity.upn.lower() and url_exception.enabled:
@@ -45,64 +60,113 @@ class HttpClientService:
 
         self.headers = headers
 
-    def get(self, endpoint: str, content_type: str = "application/json"):
+    def get(self, endpoint: str, content_type: str = "application/json", headers: Optional[dict] = None):
+        """
+        Execute a synchronous GET request using a pooled session.
+        """
+        session = self.__get_sync_session()
+        url = self.base_url + endpoint
+        response = session.get(
+            url,
+            headers=self.__get_request_headers(content_type, headers),
+            timeout=self.time_out,
+            verify=self.verify_certs)
+        response.raise_for_status()
+        return self.__read_response(response, content_type)
+
+    def post(self, endpoint: str, content_type: str = "application/json", data = None, headers: Optional[dict] = None):
+        """
+        Execute a synchronous POST request using a pooled session.
+        """
+        session = self.__get_sync_session()
+        url = self.base_url + endpoint
+        response = session.post(
+            url,
+            data=data,
+            headers=self.__get_request_headers(content_type, headers),
+            timeout=self.time_out,
+            verify=self.verify_certs)
+        response.raise_for_status()
+        return self.__read_response(response, content_type)
+
+    async def get_async(self, endpoint: str, content_type: str = "application/json", headers: Optional[dict] = None):
         """
-        Execute a synchronous GET request.
+        Execute an asynchronous GET request using the shared HTTP session pool.
         """
-        with requests.Session() as session:
-            session.headers.update(self.headers)
-            if content_type:
-                session.headers.update({"Content-Type": content_type})
-            url = self.base_url + endpoint
-            response = session.get(url, timeout=self.time_out, verify=self.verify_certs)
+        session = HttpSessionPool.get_default().get_session()
+        url = self.base_url + endpoint
+        async with session.get(
+            url,
+            headers=self.__get_request_headers(content_type, headers),
+            timeout=aiohttp.ClientTimeout(total=self.time_out),
+            ssl=self.verify_certs) as response:
             response.raise_for_status()
-            return \
-                response.json() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/json" \
-                else response.read() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/octet-stream" \
-                else response.text()
+            return await self.__read_response_async(response, content_type)
 
-    def post(self, endpoint: str, content_type: str = "application/json", data = None):
+    async def post_async(self, endpoint: str, content_type: str = "application/json", data = None, headers: Optional[dict] = None):
         """
-        Execute a synchronous POST request.
+        Execute an asynchronous POST request using the shared HTTP session pool.
         """
-        with requests.Session() as session:
-            session.headers.update(self.headers)
-            if content_type:
-                session.headers.update({"Content-Type": content_type})
-            url = self.base_url + endpoint
-            response = session.post(url, data=data, timeout=self.time_out, verify=self.verify_certs)
+        session = HttpSessionPool.get_default().get_session()
+        url = self.base_url + endpoint
+        async with session.post(
+            url,
+            data=data,
+            headers=self.__get_request_headers(content_type, headers),
+            timeout=aiohttp.ClientTimeout(total=self.time_out),
+            ssl=self.verify_certs) as response:
             response.raise_for_status()
-            return \
-                response.json() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/json" \
-                else response.read() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/octet-stream" \
-                else response.text()
-
-    async def get_async(self, endpoint: str, content_type: str = "application/json"):
-        """
-        Execute an asynchronous GET request.
-        """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            if content_type:
-                session.headers.update({"Content-Type": content_type})
-            url = self.base_url + endpoint
-            async with session.get(url, timeout=self.time_out, ssl=self.verify_certs) as response:
-                response.raise_for_status()
-                return \
-                    await response.json() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/json" \
-                    else await response.read() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/octet-stream" \
-                    else await response.text()
-
-    async def post_async(self, endpoint: str, content_type: str = "application/json", data = None):
-        """
-        Execute an asynchronous POST request.
-        """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            if content_type:
-                session.headers.update({"Content-Type": content_type})
-            url = self.base_url + endpoint
-            async with session.post(url, data=data, timeout=self.time_out, ssl=self.verify_certs) as response:
-                response.raise_for_status()
-                return \
-                    await response.json() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/json" \
-                    else await response.read() if "Content-Type" in session.headers and session.headers["Content-Type"] == "application/octet-stream" \
-                    else await response.text()
+            return await self.__read_response_async(response, content_type)
+
+    def __get_sync_session(self) -> requests.Session:
+        """
+        Retrieves the pooled synchronous session for the base URL and certificate verification setting.
+        """
+        key = (self.base_url, self.verify_certs)
+        session = HttpClientService.__sync_sessions.get(key)
+        if session is None:
+            with HttpClientService.__sync_sessions_lock:
+                session = HttpClientService.__sync_sessions.get(key)
+                if session is None:
+                    session = requests.Session()
+                    # The session is shared by the requests of all users, so it must not store cookies.
+                    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=SYNC_POOL_MAXSIZE)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    HttpClientService.__sync_sessions[key] = session
+        return session
+
+    def __get_request_headers(self, content_type: str, headers: Optional[dict] = None) -> dict:
+        """
+        Builds the headers of a request without modifying the headers shared by the requests.
+        """
+        request_headers = dict(self.headers)
+        # If the user identity is provided, add the user principal name to the headers.
+        if self.user_identity is not None:
+            request_headers["X-USER-IDENTITY"] = self.user_identity.model_dump_json(by_alias=True)
+        if content_type:
+            request_headers["Content-Type"] = content_type
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+    def __read_response(self, response: requests.Response, content_type: str):
+        """
+        Reads the body of a synchronous response based on the requested content type.
+        """
+        if content_type == "application/json":
+            return response.json()
+        if content_type == "application/octet-stream":
+            return response.content
+        return response.text
+
+    async def __read_response_async(self, response: aiohttp.ClientResponse, content_type: str):
+        """
+        Reads the body of an asynchronous response based on the requested content type.
+        """
+        if content_type == "application/json":
+            return await response.json()
+        if content_type == "application/octet-stream":
+            return await response.read()
+        return await response.text()
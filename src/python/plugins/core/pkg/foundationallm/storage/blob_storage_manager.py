@@ -1,9 +1,9 @@
 from io import BytesIO
 import fnmatch
-import os
-from azure.storage.blob import BlobServiceClient
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobProperties, BlobServiceClient
 from foundationallm.storage import StorageManagerBase
-from azure.identity import DefaultAzureCredential
+from foundationallm.utils import AzureCredentialRegistry
 
 class BlobStorageManager(StorageManagerBase):
     """
@@ -25,18 +25,7 @@ class BlobStorageManager(StorageManagerBase):
             if account_name is None or account_name == '':
                 raise ValueError('The account_name parameter must be set to a valid account name.')
 
-            credential = \
-                DefaultAzureCredential(
-                    exclude_workload_identity_credentials=True,
-                    exclude_developer_cli_credential=False,
-                    exclude_cli_credential=False,
-                    exclude_environment_credential=True,
-                    exclude_managed_identity_credential=True,
-                    exclude_powershell_credential=True,
-                    exclude_visual_studio_code_credential=True,
-                    exclude_shared_token_cache_credentials=True,
-                    exclude_interactive_browser_credential=True) if os.getenv('FOUNDATIONALLM_CONTEXT', 'NONE') == 'DEBUG' \
-                else DefaultAzureCredential(exclude_environment_credential=True)
+            credential = AzureCredentialRegistry.get_credential()
             
             blob_service_client = BlobServiceClient(account_url=f"https://{account_name}.blob.core.windows.net", credential=credential)
         else:
@@ -111,6 +100,27 @@ class BlobStorageManager(StorageManagerBase):
         blob = self.blob_container_client.get_blob_client(full_path)
         return blob.exists()
 
+    def get_file_properties(self, path) -> BlobProperties:
+        """
+        Retrieves the properties (including the ETag) of a specified file.
+
+        Parameters
+        ----------
+        path : str
+            The path to the blob.
+
+        Returns
+        -------
+        BlobProperties
+            The properties of the specified file or None if the file does not exist.
+        """
+        full_path = self.__get_full_path(path)
+        blob = self.blob_container_client.get_blob_client(full_path)
+        try:
+            return blob.get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+
     def read_file_content(self, path, read_into_stream=True) -> bytes:
         """
         Retrieves the contents of a specified file in bytes.
@@ -3,8 +3,9 @@ import platform
 import foundationallm
 
 from azure.monitor.opentelemetry import configure_azure_monitor
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource, SERVICE_INSTANCE_ID, SERVICE_VERSION, SERVICE_NAMESPACE
+from opentelemetry.metrics import Meter
 from opentelemetry.trace import Span, Status, StatusCode, Tracer
 from foundationallm.config import Configuration
 
@@ -103,6 +104,23 @@ class Telemetry:
         """
         return trace.get_tracer(name)
 
+    @staticmethod
+    def get_meter(name: str) -> Meter:
+        """
+        Creates an OpenTelemetry meter with the specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name to assign to the meter.
+
+        Returns
+        -------
+        Meter
+            Returns an OpenTelemetry meter used to create metric instruments.
+        """
+        return metrics.get_meter(name)
+
     @staticmethod
     def record_exception(span: Span, ex: Exception):
         """
@@ -1,3 +1,7 @@
 from .object_utils import ObjectUtils
 from .openai_assistants_helpers import OpenAIAssistantsHelpers
 from .logging_async_http_client import LoggingAsyncHttpClient
+from .http_session_pool import HttpSessionPool
+from .caching_token_credential import CachingTokenCredential
+from .azure_credential_registry import AzureCredentialRegistry
+from .context_file_content_cache import ContextFileContentCache
@@ -0,0 +1,85 @@
+import os
+import threading
+from typing import Dict
+
+from azure.identity import DefaultAzureCredential
+
+from .caching_token_credential import CachingTokenCredential
+
+class AzureCredentialRegistry():
+    """
+    Provides the process-wide Azure credential.
+
+    Creating a DefaultAzureCredential for every client probes the credential chain and acquires
+    new tokens every time. The registry creates a single credential for the process, shared by
+    all the clients, and wraps it in a CachingTokenCredential so tokens are acquired once per scope
+    and reused until they are about to expire.
+
+    A second credential, including the environment credential, is provided to the clients
+    that can authenticate with a service principal configured through environment variables.
+    """
+
+    __credentials: Dict[bool, CachingTokenCredential] = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_credential(include_environment_credential: bool = False) -> CachingTokenCredential:
+        """
+        Retrieves the process-wide Azure credential, creating it if needed.
+
+        By default, the environment credential is excluded and, when FOUNDATIONALLM_CONTEXT is set to DEBUG,
+        the credential uses the developer credentials (Azure CLI and Azure Developer CLI).
+
+        Parameters
+        ----------
+        include_environment_credential : bool
+            True to retrieve a credential using the full DefaultAzureCredential chain, including the
+            environment credential (AZURE_CLIENT_ID, AZURE_TENANT_ID, and AZURE_CLIENT_SECRET).
+
+        Returns
+        -------
+        CachingTokenCredential
+            The process-wide Azure credential.
+        """
+        credential = AzureCredentialRegistry.__credentials.get(include_environment_credential)
+        if credential is None:
+            with AzureCredentialRegistry.__lock:
+                credential = AzureCredentialRegistry.__credentials.get(include_environment_credential)
+                if credential is None:
+                    credential = AzureCredentialRegistry.__create_credential(include_environment_credential)
+                    AzureCredentialRegistry.__credentials[include_environment_credential] = credential
+        return credential
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        Retrieves the token acquisition statistics of the process-wide Azure credentials.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the token acquisition statistics of each credential, per scope, indexed by credential name.
+        """
+        credentials = list(AzureCredentialRegistry.__credentials.values())
+        return {credential.name: credential.get_stats() for credential in credentials}
+
+    @staticmethod
+    def __create_credential(include_environment_credential: bool) -> CachingTokenCredential:
+        if include_environment_credential:
+            return CachingTokenCredential(DefaultAzureCredential(), name='environment')
+        if os.getenv('FOUNDATIONALLM_CONTEXT', 'NONE') == 'DEBUG':
+            return CachingTokenCredential(
+                DefaultAzureCredential(
+                    exclude_workload_identity_credentials=True,
+                    exclude_developer_cli_credential=False,
+                    exclude_cli_credential=False,
+                    exclude_environment_credential=True,
+                    exclude_managed_identity_credential=True,
+                    exclude_powershell_credential=True,
+                    exclude_visual_studio_code_credential=True,
+                    exclude_shared_token_cache_credentials=True,
+                    exclude_interactive_browser_credential=True),
+                name='debug')
+        return CachingTokenCredential(
+            DefaultAzureCredential(exclude_environment_credential=True),
+            name='default')
@@ -0,0 +1,169 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from azure.core.credentials import AccessToken, TokenCredential
+
+from foundationallm.telemetry import Telemetry
+
+# Tokens are refreshed when they expire in less than this number of seconds.
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+
+class CachingTokenCredential(TokenCredential):
+    """
+    Wraps a credential and caches its access tokens in memory, per scope.
+
+    The credential is thread-safe: concurrent requests for the same scope wait for a single
+    token acquisition instead of each calling the wrapped credential.
+    Token requests with claims (e.g., claims challenges) always call the wrapped credential.
+    """
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        name: str,
+        refresh_margin_seconds: int = DEFAULT_REFRESH_MARGIN_SECONDS):
+        """
+        Initializes the caching token credential.
+
+        Parameters
+        ----------
+        credential : TokenCredential
+            The credential acquiring the access tokens.
+        name : str
+            The name of the credential, used in the metrics.
+        refresh_margin_seconds : int
+            The number of seconds before expiration at which the tokens are refreshed.
+        """
+        self.credential = credential
+        self.name = name
+        self.refresh_margin_seconds = refresh_margin_seconds
+
+        self.__tokens: Dict[Tuple, AccessToken] = {}
+        self.__locks: Dict[Tuple, threading.Lock] = {}
+        self.__locks_lock = threading.Lock()
+        self.__stats: Dict[str, dict] = {}
+
+        meter = Telemetry.get_meter(__name__)
+        self.__acquisition_duration_histogram = meter.create_histogram(
+            'foundationallm.credentials.token_acquisition_duration',
+            unit='ms',
+            description='The time spent acquiring access tokens from the identity provider.')
+        self.__cache_hits_counter = meter.create_counter(
+            'foundationallm.credentials.token_cache_hits',
+            description='The number of access token requests served from the token cache.')
+
+    def get_token(
+        self,
+        *scopes: str,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        **kwargs) -> AccessToken:
+        """
+        Retrieves an access token for the specified scopes, from the cache when the cached token is not about to expire.
+
+        Parameters
+        ----------
+        scopes : str
+            The scopes of the access token.
+        claims : str
+            Additional claims required in the token. Tokens requested with claims are not cached.
+        tenant_id : str
+            The tenant to include in the token request.
+
+        Returns
+        -------
+        AccessToken
+            The access token.
+        """
+        if claims:
+            return self.__acquire_token(scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        key = (scopes, tenant_id)
+        token = self.__get_cached_token(key)
+        if token is not None:
+            self.__record_cache_hit(scopes)
+            return token
+
+        with self.__get_lock(key):
+            # Another thread may have acquired the token while this one was waiting for the lock.
+            token = self.__get_cached_token(key)
+            if token is not None:
+                self.__record_cache_hit(scopes)
+                return token
+
+            token = self.__acquire_token(scopes, tenant_id=tenant_id, **kwargs)
+            self.__tokens[key] = token
+            return token
+
+    def close(self):
+        """
+        Closes the wrapped credential.
+        """
+        self.credential.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # The credential is shared, it is not closed when used as a context manager.
+        pass
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the token acquisition statistics, per scope.
+
+        Returns
+        -------
+        dict
+            A dictionary containing, for each scope, the number of token acquisitions,
+            the number of cache hits, and the token acquisition latency.
+        """
+        return {
+            scope: {
+                **stats,
+                'average_acquisition_ms': \
+                    round(stats['total_acquisition_ms'] / stats['acquisitions'], 3) if stats['acquisitions'] else 0.0
+            }
+            for scope, stats in self.__stats.items()
+        }
+
+    def __get_cached_token(self, key: Tuple) -> Optional[AccessToken]:
+        token = self.__tokens.get(key)
+        if token is not None and token.expires_on - time.time() > self.refresh_margin_seconds:
+            return token
+        return None
+
+    def __get_lock(self, key: Tuple) -> threading.Lock:
+        with self.__locks_lock:
+            return self.__locks.setdefault(key, threading.Lock())
+
+    def __acquire_token(self, scopes: Tuple[str, ...], **kwargs) -> AccessToken:
+        """
+        Acquires a token from the wrapped credential and records the acquisition latency.
+        """
+        start = time.perf_counter()
+        try:
+            return self.credential.get_token(*scopes, **kwargs)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            scope = ' '.join(scopes)
+            self.__acquisition_duration_histogram.record(
+                duration_ms, {'credential': self.name, 'scope': scope})
+            stats = self.__get_scope_stats(scope)
+            stats['acquisitions'] += 1
+            stats['total_acquisition_ms'] = round(stats['total_acquisition_ms'] + duration_ms, 3)
+            stats['max_acquisition_ms'] = round(max(stats['max_acquisition_ms'], duration_ms), 3)
+
+    def __record_cache_hit(self, scopes: Tuple[str, ...]):
+        scope = ' '.join(scopes)
+        self.__cache_hits_counter.add(1, {'credential': self.name, 'scope': scope})
+        self.__get_scope_stats(scope)['cache_hits'] += 1
+
+    def __get_scope_stats(self, scope: str) -> dict:
+        return self.__stats.setdefault(scope, {
+            'acquisitions': 0,
+            'cache_hits': 0,
+            'total_acquisition_ms': 0.0,
+            'max_acquisition_ms': 0.0
+        })
@@ -0,0 +1,320 @@
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_DISK_MB,
+    FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_MEMORY_MB,
+    FOUNDATIONALLM_CONTEXT_FILE_CACHE_PATH
+)
+from foundationallm.telemetry import Telemetry
+
+DEFAULT_MAX_MEMORY_MB = 256
+DEFAULT_MAX_DISK_MB = 1024
+
+class ContextFileContentCache():
+    """
+    Caches the content of the context files embedded in the completion requests, across the turns of the conversations.
+
+    The cached content is the message content block sent to the language model (e.g., the base64 encoded image),
+    so the follow-up turns of a conversation skip both the download of the file from the Context API and its encoding.
+    The entries are scoped per FoundationaLLM instance and user, and are identified by the object ID of the file.
+    The least recently used entries are evicted from memory to the local disk once the memory budget is exceeded,
+    and removed from the local disk once the disk budget is exceeded.
+    """
+
+    __default: Optional['ContextFileContentCache'] = None
+    __default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_MB * 1024 * 1024,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_MB * 1024 * 1024,
+        disk_path: Optional[str] = None):
+        """
+        Initializes the context file content cache.
+
+        Parameters
+        ----------
+        max_memory_bytes : int
+            The maximum size, in bytes, of the entries cached in memory. The cache is disabled if 0.
+        max_disk_bytes : int
+            The maximum size, in bytes, of the entries cached on the local disk. Entries are cached in memory only if 0.
+        disk_path : str
+            The directory in which the entries are cached on the local disk. Defaults to the temporary directory.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes if max_memory_bytes > 0 else 0
+        self.disk_path = disk_path
+        self.logger = Telemetry.get_logger(__name__)
+
+        self.__memory_entries: OrderedDict[str, Tuple[dict, int]] = OrderedDict()
+        self.__disk_entries: OrderedDict[str, int] = OrderedDict()
+        self.__memory_bytes = 0
+        self.__disk_bytes = 0
+        self.__disk_directory: Optional[str] = None
+        self.__lock = threading.Lock()
+
+        self.__memory_hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+        self.__memory_evictions = 0
+        self.__disk_evictions = 0
+
+    @staticmethod
+    def get_default() -> 'ContextFileContentCache':
+        """
+        Retrieves the process-wide context file content cache, creating it from the environment variables if needed.
+
+        Returns
+        -------
+        ContextFileContentCache
+            The process-wide context file content cache.
+        """
+        if ContextFileContentCache.__default is None:
+            with ContextFileContentCache.__default_lock:
+                if ContextFileContentCache.__default is None:
+                    ContextFileContentCache.__default = ContextFileContentCache(
+                        max_memory_bytes=int(os.getenv(
+                            FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_MEMORY_MB, DEFAULT_MAX_MEMORY_MB)) * 1024 * 1024,
+                        max_disk_bytes=int(os.getenv(
+                            FOUNDATIONALLM_CONTEXT_FILE_CACHE_MAX_DISK_MB, DEFAULT_MAX_DISK_MB)) * 1024 * 1024,
+                        disk_path=os.getenv(FOUNDATIONALLM_CONTEXT_FILE_CACHE_PATH))
+        return ContextFileContentCache.__default
+
+    @staticmethod
+    def get_key(instance_id: str, user_id: str, object_id: str) -> str:
+        """
+        Builds the key of a context file, scoped to the FoundationaLLM instance and the user.
+
+        Parameters
+        ----------
+        instance_id : str
+            The FoundationaLLM instance ID.
+        user_id : str
+            The identifier of the user the file belongs to.
+        object_id : str
+            The object ID of the context file.
+
+        Returns
+        -------
+        str
+            The key of the context file in the cache.
+        """
+        return hashlib.sha256(f'{instance_id}|{user_id}|{object_id}'.encode('utf-8')).hexdigest()
+
+    async def get_async(self, key: str) -> Optional[dict]:
+        """
+        Retrieves the cached content of a context file, from memory or from the local disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the context file, built with get_key.
+
+        Returns
+        -------
+        dict
+            The message content block of the context file, or None if it is not cached.
+        """
+        if self.max_memory_bytes <= 0:
+            return None
+
+        with self.__lock:
+            entry = self.__memory_entries.get(key)
+            if entry is not None:
+                self.__memory_entries.move_to_end(key)
+                self.__memory_hits += 1
+                return entry[0]
+            is_on_disk = key in self.__disk_entries
+
+        if is_on_disk:
+            content = await asyncio.to_thread(self.__read_from_disk, key)
+            if content is not None:
+                with self.__lock:
+                    self.__disk_hits += 1
+                await self.set_async(key, content)
+                return content
+
+        with self.__lock:
+            self.__misses += 1
+        return None
+
+    async def set_async(self, key: str, content: dict):
+        """
+        Caches the content of a context file in memory, evicting the least recently used entries to the local disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the context file, built with get_key.
+        content : dict
+            The message content block of the context file.
+        """
+        if self.max_memory_bytes <= 0:
+            return
+
+        size = self.__get_size(content)
+        evicted_entries: List[Tuple[str, dict, int]] = []
+        with self.__lock:
+            previous_entry = self.__memory_entries.pop(key, None)
+            if previous_entry is not None:
+                self.__memory_bytes -= previous_entry[1]
+            if size <= self.max_memory_bytes:
+                self.__memory_entries[key] = (content, size)
+                self.__memory_bytes += size
+            else:
+                # Entries larger than the memory budget are cached on the local disk only.
+                evicted_entries.append((key, content, size))
+            while self.__memory_bytes > self.max_memory_bytes:
+                evicted_key, (evicted_content, evicted_size) = self.__memory_entries.popitem(last=False)
+                self.__memory_bytes -= evicted_size
+                self.__memory_evictions += 1
+                evicted_entries.append((evicted_key, evicted_content, evicted_size))
+
+        if evicted_entries and self.max_disk_bytes > 0:
+            await asyncio.to_thread(self.__write_to_disk, evicted_entries)
+
+    def clear(self):
+        """
+        Removes all the cached entries, from memory and from the local disk.
+        """
+        with self.__lock:
+            self.__memory_entries.clear()
+            self.__memory_bytes = 0
+            disk_keys = list(self.__disk_entries.keys())
+            self.__disk_entries.clear()
+            self.__disk_bytes = 0
+        for key in disk_keys:
+            self.__remove_from_disk(key)
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the number and size of the entries cached in memory and on the local disk,
+            the budgets, the hits, misses, and evictions.
+        """
+        with self.__lock:
+            lookups = self.__memory_hits + self.__disk_hits + self.__misses
+            return {
+                'memory_entries': len(self.__memory_entries),
+                'memory_bytes': self.__memory_bytes,
+                'max_memory_bytes': self.max_memory_bytes,
+                'disk_entries': len(self.__disk_entries),
+                'disk_bytes': self.__disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+                'memory_hits': self.__memory_hits,
+                'disk_hits': self.__disk_hits,
+                'misses': self.__misses,
+                'memory_evictions': self.__memory_evictions,
+                'disk_evictions': self.__disk_evictions,
+                'hit_ratio': round((self.__memory_hits + self.__disk_hits) / lookups, 3) if lookups else 0.0
+            }
+
+    def __get_size(self, content) -> int:
+        """
+        Estimates the size, in bytes, of a message content block from the length of its string values.
+        """
+        if isinstance(content, dict):
+            return sum(self.__get_size(value) for value in content.values())
+        if isinstance(content, (list, tuple)):
+            return sum(self.__get_size(value) for value in content)
+        if isinstance(content, str):
+            return len(content)
+        return 0
+
+    def __get_disk_directory(self) -> str:
+        """
+        Creates the directory of the process in which the entries are cached on the local disk, if needed.
+        The directory is removed when the process exits.
+        """
+        with self.__lock:
+            if self.__disk_directory is None:
+                self.__disk_directory = tempfile.mkdtemp(prefix='foundationallm-context-files-', dir=self.disk_path)
+                atexit.register(shutil.rmtree, self.__disk_directory, ignore_errors=True)
+            return self.__disk_directory
+
+    def __get_file_path(self, key: str) -> str:
+        return os.path.join(self.__get_disk_directory(), f'{key}.json')
+
+    def __write_to_disk(self, entries: List[Tuple[str, dict, int]]):
+        """
+        Writes the entries evicted from memory to the local disk, evicting the least recently used entries of the disk.
+        """
+        for key, content, size in entries:
+            if size > self.max_disk_bytes:
+                continue
+
+            with self.__lock:
+                if key in self.__disk_entries:
+                    # The content of the files does not change, so the entry on the local disk is still valid.
+                    self.__disk_entries.move_to_end(key)
+                    continue
+
+            # Each writer uses its own temporary file, and the entry is only registered once the file is complete,
+            # so concurrent reads never find a registered entry without its file.
+            file_path = self.__get_file_path(key)
+            temporary_file_path = f'{file_path}.{threading.get_ident()}.tmp'
+            try:
+                with open(temporary_file_path, 'w', encoding='utf-8') as file:
+                    json.dump(content, file)
+                os.replace(temporary_file_path, file_path)
+            except OSError as e:
+                self.logger.warning(f'Failed to cache the content of a context file on the local disk: {e}')
+                try:
+                    os.remove(temporary_file_path)
+                except OSError:
+                    pass
+                continue
+
+            with self.__lock:
+                if key in self.__disk_entries:
+                    # Another writer registered the same entry in the meantime.
+                    self.__disk_entries.move_to_end(key)
+                    continue
+                self.__disk_entries[key] = size
+                self.__disk_bytes += size
+
+            evicted_keys = []
+            with self.__lock:
+                while self.__disk_bytes > self.max_disk_bytes and self.__disk_entries:
+                    evicted_key, evicted_size = self.__disk_entries.popitem(last=False)
+                    self.__disk_bytes -= evicted_size
+                    self.__disk_evictions += 1
+                    evicted_keys.append(evicted_key)
+            for evicted_key in evicted_keys:
+                self.__remove_from_disk(evicted_key)
+
+    def __read_from_disk(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.__get_file_path(key), 'r', encoding='utf-8') as file:
+                content = json.load(file)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f'Failed to read the content of a context file from the local disk cache: {e}')
+            with self.__lock:
+                size = self.__disk_entries.pop(key, None)
+                if size is not None:
+                    self.__disk_bytes -= size
+            return None
+
+        with self.__lock:
+            if key in self.__disk_entries:
+                self.__disk_entries.move_to_end(key)
+        return content
+
+    def __remove_from_disk(self, key: str):
+        try:
+            os.remove(self.__get_file_path(key))
+        except OSError:
+            pass
@@ -0,0 +1,261 @@
+import asyncio
+import os
+import threading
+from logging import Logger
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from aiohttp import (
+    ClientSession,
+    DummyCookieJar,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams
+)
+
+from foundationallm.config.environment_variables import (
+    FOUNDATIONALLM_HTTP_POOL_DNS_CACHE_TTL_SECONDS,
+    FOUNDATIONALLM_HTTP_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+    FOUNDATIONALLM_HTTP_POOL_LIMIT,
+    FOUNDATIONALLM_HTTP_POOL_LIMIT_PER_HOST
+)
+from foundationallm.telemetry import Telemetry
+
+DEFAULT_LIMIT = 512
+DEFAULT_LIMIT_PER_HOST = 256
+DEFAULT_DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 30
+
+class HttpSessionPool():
+    """
+    Provides process-wide aiohttp client sessions, one per event loop, backed by tuned, pooled connectors.
+
+    The sessions are shared by the calls to the State API, the Context API, and the Gateway API,
+    so connections are reused across requests instead of being established for every call.
+    Requests must pass their headers and TLS settings per call instead of setting them on the session.
+    The sessions do not store cookies, so the cookies of a user's request are never sent with another's.
+    """
+
+    __default: Optional['HttpSessionPool'] = None
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        dns_cache_ttl_seconds: int = DEFAULT_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout_seconds: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS,
+        logger: Logger = None):
+        """
+        Initializes the HTTP session pool.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of simultaneous connections.
+        limit_per_host : int
+            The maximum number of simultaneous connections to the same endpoint.
+        dns_cache_ttl_seconds : int
+            The time, in seconds, the resolved DNS entries are cached.
+        keepalive_timeout_seconds : float
+            The time, in seconds, idle connections are kept open for reuse.
+        logger : Logger
+            The logger used for logging.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl_seconds = dns_cache_ttl_seconds
+        self.keepalive_timeout_seconds = keepalive_timeout_seconds
+        self.logger = logger or Telemetry.get_logger(__name__)
+
+        self.__sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
+        self.__sessions_lock = threading.Lock()
+        self.__connections_created = 0
+        self.__connections_reused = 0
+        self.__connections_queued = 0
+        self.__active_requests = 0
+        self.__peak_active_requests = 0
+
+        meter = Telemetry.get_meter(__name__)
+        self.__connections_created_counter = meter.create_counter(
+            'foundationallm.http_pool.connections_created',
+            description='The number of connections established by the HTTP session pool.')
+        self.__connections_reused_counter = meter.create_counter(
+            'foundationallm.http_pool.connections_reused',
+            description='The number of requests that reused a pooled connection.')
+        self.__connections_queued_counter = meter.create_counter(
+            'foundationallm.http_pool.connections_queued',
+            description='The number of requests that waited for a connection because the pool was exhausted.')
+        self.__active_requests_counter = meter.create_up_down_counter(
+            'foundationallm.http_pool.active_requests',
+            description='The number of requests being executed through the HTTP session pool.')
+
+    @staticmethod
+    def from_environment(logger: Logger = None) -> 'HttpSessionPool':
+        """
+        Creates an HTTP session pool using the settings from the environment variables.
+
+        Returns
+        -------
+        HttpSessionPool
+            The HTTP session pool.
+        """
+        return HttpSessionPool(
+            limit=int(os.getenv(FOUNDATIONALLM_HTTP_POOL_LIMIT, DEFAULT_LIMIT)),
+            limit_per_host=int(os.getenv(FOUNDATIONALLM_HTTP_POOL_LIMIT_PER_HOST, DEFAULT_LIMIT_PER_HOST)),
+            dns_cache_ttl_seconds=int(os.getenv(
+                FOUNDATIONALLM_HTTP_POOL_DNS_CACHE_TTL_SECONDS, DEFAULT_DNS_CACHE_TTL_SECONDS)),
+            keepalive_timeout_seconds=float(os.getenv(
+                FOUNDATIONALLM_HTTP_POOL_KEEPALIVE_TIMEOUT_SECONDS, DEFAULT_KEEPALIVE_TIMEOUT_SECONDS)),
+            logger=logger)
+
+    @staticmethod
+    def get_default() -> 'HttpSessionPool':
+        """
+        Retrieves the process-wide HTTP session pool, creating it from the environment variables if needed.
+
+        Returns
+        -------
+        HttpSessionPool
+            The process-wide HTTP session pool.
+        """
+        if HttpSessionPool.__default is None:
+            HttpSessionPool.__default = HttpSessionPool.from_environment()
+        return HttpSessionPool.__default
+
+    def get_session(self) -> ClientSession:
+        """
+        Retrieves the pooled client session of the running event loop, creating it if needed.
+
+        Returns
+        -------
+        ClientSession
+            The pooled aiohttp client session.
+        """
+        loop = asyncio.get_running_loop()
+        with self.__sessions_lock:
+            session = self.__sessions.get(loop)
+            if session is None or session.closed:
+                # A session can only be used on the event loop it was created on, so each loop gets its own.
+                # The sessions of the loops that have been closed can no longer be used nor closed.
+                for closed_loop in [l for l in self.__sessions if l.is_closed()]:
+                    del self.__sessions[closed_loop]
+                connector = TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl_seconds,
+                    keepalive_timeout=self.keepalive_timeout_seconds)
+                # The session is shared by the requests of all users, so it must not store cookies.
+                session = ClientSession(
+                    connector=connector,
+                    cookie_jar=DummyCookieJar(),
+                    trace_configs=[self.__create_trace_config()])
+                self.__sessions[loop] = session
+        return session
+
+    async def close_async(self):
+        """
+        Closes the pooled client sessions of all the event loops and their connections.
+
+        The sessions of other running event loops are closed on their own loops.
+        The sessions of the event loops that are not running anymore cannot be closed and are dropped from the pool.
+        """
+        with self.__sessions_lock:
+            sessions = list(self.__sessions.items())
+            self.__sessions.clear()
+
+        loop = asyncio.get_running_loop()
+        for session_loop, session in sessions:
+            if session.closed:
+                continue
+            try:
+                if session_loop is loop:
+                    await session.close()
+                elif session_loop.is_running():
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), session_loop))
+            except Exception as e:
+                self.logger.warning(f'Failed to close a pooled HTTP client session: {e}')
+
+    def get_stats(self) -> dict:
+        """
+        Retrieves the current statistics of the pool.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the pool settings, utilization, and connection reuse statistics.
+        """
+        total_connections = self.__connections_created + self.__connections_reused
+        return {
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'dns_cache_ttl_seconds': self.dns_cache_ttl_seconds,
+            'keepalive_timeout_seconds': self.keepalive_timeout_seconds,
+            'active_requests': self.__active_requests,
+            'peak_active_requests': self.__peak_active_requests,
+            'utilization': round(self.__active_requests / self.limit, 3) if self.limit else 0.0,
+            'connections_created': self.__connections_created,
+            'connections_reused': self.__connections_reused,
+            'connections_queued': self.__connections_queued,
+            'connection_reuse_ratio': \
+                round(self.__connections_reused / total_connections, 3) if total_connections else 0.0
+        }
+
+    def __create_trace_config(self) -> TraceConfig:
+        """
+        Creates the trace configuration recording the pool statistics.
+        """
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self.__on_request_start)
+        trace_config.on_request_end.append(self.__on_request_done)
+        trace_config.on_request_exception.append(self.__on_request_done)
+        trace_config.on_connection_create_end.append(self.__on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self.__on_connection_reuseconn)
+        trace_config.on_connection_queued_end.append(self.__on_connection_queued_end)
+        return trace_config
+
+    async def __on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams):
+        self.__active_requests += 1
+        self.__peak_active_requests = max(self.__peak_active_requests, self.__active_requests)
+        self.__active_requests_counter.add(1)
+
+    async def __on_request_done(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams | TraceRequestExceptionParams):
+        self.__active_requests -= 1
+        self.__active_requests_counter.add(-1)
+
+    async def __on_connection_create_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams):
+        self.__connections_created += 1
+        self.__connections_created_counter.add(1)
+
+    async def __on_connection_reuseconn(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams):
+        self.__connections_reused += 1
+        self.__connections_reused_counter.add(1)
+
+    async def __on_connection_queued_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedEndParams):
+        self.__connections_queued += 1
+        self.__connections_queued_counter.add(1)
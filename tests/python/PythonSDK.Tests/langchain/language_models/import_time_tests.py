@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import pytest
+
+# The import time budget, in milliseconds, of the foundationallm language models package.
+# It can be adjusted for slower build agents using the FOUNDATIONALLM_IMPORT_TIME_BUDGET_MS environment variable.
+DEFAULT_IMPORT_TIME_BUDGET_MS = 5000
+
+# The provider SDKs imported on demand by the LanguageModelFactory.
+LAZY_PROVIDER_MODULES = [
+    'boto3',
+    'botocore',
+    'databricks',
+    'databricks_langchain',
+    'google.oauth2',
+    'langchain_aws',
+    'langchain_azure_ai',
+    'langchain_google_genai'
+]
+
+@pytest.fixture
+def import_times():
+    """
+    Imports the foundationallm language models package in a new interpreter using -X importtime
+    and returns the cumulative import time, in microseconds, of each module.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import foundationallm.langchain.language_models'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    import_times = {}
+    foundationallm_import_time = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module_name = line[len('import time:'):].split('|')
+        import_times[module_name.strip()] = int(cumulative)
+        if module_name.startswith(' foundationallm'):
+            # The foundationallm packages imported at the top level are not indented,
+            # their cumulative times add up to the import time of the package, excluding the interpreter startup.
+            foundationallm_import_time += int(cumulative)
+    import_times['<foundationallm>'] = foundationallm_import_time
+    return import_times
+
+class ImportTimeTests:
+    """
+    ImportTimeTests is responsible for catching regressions of the foundationallm import time.
+
+    The provider SDKs used by the LanguageModelFactory must not be imported with the package,
+    and the total import time must stay within the budget.
+    """
+
+    def test_provider_sdks_are_not_imported(self, import_times):
+        imported_provider_modules = [
+            module_name for module_name in LAZY_PROVIDER_MODULES if module_name in import_times
+        ]
+        assert imported_provider_modules == []
+
+    def test_import_time_within_budget(self, import_times):
+        budget_ms = int(os.environ.get('FOUNDATIONALLM_IMPORT_TIME_BUDGET_MS', DEFAULT_IMPORT_TIME_BUDGET_MS))
+        import_time_ms = import_times['<foundationallm>'] / 1000
+        assert import_time_ms <= budget_ms, \
+            f'Importing foundationallm.langchain.language_models took {import_time_ms:.0f} ms (budget: {budget_ms} ms).'
@@ -0,0 +1,48 @@
+import asyncio
+from uuid import uuid4
+from foundationallm.langchain.language_models import DeploymentRateLimiter, RateLimitingCallbackHandler
+
+class RateLimitingCallbackHandlerTests:
+    """
+    RateLimitingCallbackHandlerTests is responsible for testing that the reservations of the language model calls
+    are returned to the deployment rate limiter when the calls do not complete.
+    """
+
+    def test_cancelled_queued_call_releases_its_reservation(self):
+        async def run() -> tuple:
+            rate_limiter = DeploymentRateLimiter('deployment', requests_per_minute=6, tokens_per_minute=60000)
+            handler = RateLimitingCallbackHandler(rate_limiter)
+
+            # The first call consumes the request capacity, so the second call is queued.
+            dispatched_run_id = uuid4()
+            await handler.on_llm_start({}, ['prompt'], run_id=dispatched_run_id)
+            queued_call = asyncio.create_task(handler.on_llm_start({}, ['prompt'], run_id=uuid4()))
+            await asyncio.sleep(0.05)
+            queued_call.cancel()
+            try:
+                await queued_call
+            except asyncio.CancelledError:
+                pass
+
+            pending_run_ids = list(handler._RateLimitingCallbackHandler__estimated_tokens)
+            return pending_run_ids == [dispatched_run_id], rate_limiter.get_stats()
+
+        only_dispatched_call_pending, stats = asyncio.run(run())
+        assert only_dispatched_call_pending
+        assert stats['available_requests'] >= 0
+        assert stats['available_tokens'] >= 10000 - 3
+
+    def test_failed_call_releases_its_tokens(self):
+        async def run() -> tuple:
+            rate_limiter = DeploymentRateLimiter('deployment', tokens_per_minute=60000)
+            handler = RateLimitingCallbackHandler(rate_limiter)
+            run_id = uuid4()
+
+            await handler.on_llm_start({}, ['prompt'], run_id=run_id, invocation_params={'max_tokens': 1000})
+            await handler.on_llm_error(Exception(), run_id=run_id)
+
+            return len(handler._RateLimitingCallbackHandler__estimated_tokens), rate_limiter.get_stats()
+
+        pending_reservations, stats = asyncio.run(run())
+        assert pending_reservations == 0
+        assert stats['available_tokens'] >= 10000 - 1
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from foundationallm.operations import OperationStateWriter
+
+class OperationStateWriterTests:
+    """
+    OperationStateWriterTests is responsible for testing the ordering guarantees of the operation state writer:
+    a progress update must never be written after the terminal state of its operation.
+    """
+
+    def test_discard_waits_for_updates_taken_by_flush(self):
+        async def run() -> list:
+            writer = OperationStateWriter(flush_interval_seconds=60, logger=logging.getLogger(__name__))
+            writes = []
+
+            async def write_progress_update():
+                await asyncio.sleep(0.05)
+                writes.append('InProgress')
+
+            writer.enqueue('operation', write_progress_update)
+            flush_task = asyncio.create_task(writer.flush_async())
+            # Let the flush take the pending updates without running their writes yet.
+            await asyncio.sleep(0)
+
+            await writer.discard_pending_updates_async('operation')
+            writes.append('Completed')
+            await flush_task
+            return writes
+
+        assert asyncio.run(run()) == ['InProgress', 'Completed']
+
+    def test_discard_drops_pending_update(self):
+        async def run() -> list:
+            writer = OperationStateWriter(flush_interval_seconds=60, logger=logging.getLogger(__name__))
+            writes = []
+
+            async def write_progress_update():
+                writes.append('InProgress')
+
+            writer.enqueue('operation', write_progress_update)
+            await writer.discard_pending_updates_async('operation')
+            writes.append('Completed')
+            await writer.flush_async()
+            return writes
+
+        assert asyncio.run(run()) == ['Completed']